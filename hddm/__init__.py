@@ -33,7 +33,8 @@ try:
 except ImportError:
     pass
 
-from kabuki.utils import load_csv, save_csv, load
+from kabuki.utils import load_csv, save_csv
+from .utils import load
 
 try:
     from IPython.core.debugger import Tracer
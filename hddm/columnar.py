@@ -0,0 +1,238 @@
+"""
+Columnar trace database for pymc.MCMC, used by model.sample(db='columnar').
+
+The database is a directory. Every trace of every chain is a binary file
+holding its samples one after the other, which is written in blocks of
+chunk_size samples while sampling. Traces are read back as memory maps, so
+a database loads lazily and reading one node does not touch the others.
+
+Layout of the directory dbname::
+
+    meta.json         dtype, shape and file of every trace of every chain
+    state.pkl         sampler and step method state (see pymc.MCMC.get_state)
+    chain<i>/<j>.bin  samples of trace j of chain i
+"""
+
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+from pymc.database import base
+
+__all__ = ["Trace", "Database", "load"]
+
+
+class Trace(base.Trace):
+    """Trace of a tallyable pymc object, buffered in memory and flushed to
+    one file per chain."""
+
+    def __init__(self, name, getfunc=None, db=None):
+        base.Trace.__init__(self, name=name, getfunc=getfunc, db=db)
+        self._buffer = {}
+        self._n_buffered = {}
+
+    def _initialize(self, chain, length):
+        base.Trace._initialize(self, chain, length)
+
+        value = np.asarray(self._getfunc())
+        if value.dtype == object:
+            raise TypeError(
+                "The columnar database can not store %s, its values are not numeric."
+                % self.name
+            )
+        self.db._add_column(chain, self.name, value.dtype, value.shape)
+        self._buffer[chain] = np.empty(
+            (self.db.chunk_size,) + value.shape, dtype=value.dtype
+        )
+        self._n_buffered[chain] = 0
+
+    def tally(self, chain):
+        """Store the object's current value in the buffer of a chain and
+        flush the buffer when it is full."""
+        self._buffer[chain][self._n_buffered[chain]] = self._getfunc()
+        self._n_buffered[chain] += 1
+        if self._n_buffered[chain] == self.db.chunk_size:
+            self._flush(chain)
+
+    def _flush(self, chain):
+        n = self._n_buffered.get(chain, 0)
+        if n > 0:
+            with open(self.db._column_path(chain, self.name), "ab") as f:
+                self._buffer[chain][:n].tofile(f)
+            self._n_buffered[chain] = 0
+
+    def _finalize(self, chain):
+        self._flush(chain)
+        self._buffer.pop(chain, None)
+
+    def truncate(self, index, chain):
+        """Remove the samples after index (used when sampling is halted)."""
+        self._flush(chain)
+        path = self.db._column_path(chain, self.name)
+        size = index * self.db._row_size(chain, self.name)
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            os.truncate(path, size)
+
+    def _column(self, chain):
+        """Memory map of the samples of a chain (flushed samples only)."""
+        column = self.db._columns[chain][self.name]
+        path = self.db._column_path(chain, self.name)
+        n = 0
+        if os.path.exists(path):
+            n = os.path.getsize(path) // self.db._row_size(chain, self.name)
+        shape = (n,) + tuple(column["shape"])
+        if n == 0:
+            return np.empty(shape, dtype=column["dtype"])
+        return np.memmap(path, dtype=column["dtype"], mode="r", shape=shape)
+
+    def gettrace(self, burn=0, thin=1, chain=-1, slicing=None):
+        """Return the trace.
+
+        :Stochastics:
+          - burn (int): The number of transient steps to skip.
+          - thin (int): Keep one in thin.
+          - chain (int): The index of the chain to fetch. If None, return all chains.
+          - slicing: A slice, overriding burn and thin assignement.
+        """
+        if slicing is None:
+            slicing = slice(burn, None, thin)
+        if chain is not None:
+            if chain < 0:
+                chain = range(self.db.chains)[chain]
+            return self._column(chain)[slicing]
+        else:
+            return np.concatenate(
+                [self._column(chain) for chain in self._chains()]
+            )[slicing]
+
+    __call__ = gettrace
+
+    def __getitem__(self, index):
+        chain = self._chain
+        if chain is None:
+            return np.concatenate([self._column(chain) for chain in self._chains()])[
+                index
+            ]
+        else:
+            if chain < 0:
+                chain = range(self.db.chains)[chain]
+            return self._column(chain)[index]
+
+    def _chains(self):
+        return [
+            chain
+            for chain in range(self.db.chains)
+            if self.name in self.db._columns[chain]
+        ]
+
+    def length(self, chain=-1):
+        """Return the length of the trace.
+
+        :Parameters:
+        chain : int or None
+          The chain index. If None, returns the combined length of all chains.
+        """
+        if chain is not None:
+            if chain < 0:
+                chain = range(self.db.chains)[chain]
+            return self._column(chain).shape[0]
+        else:
+            return sum([self._column(chain).shape[0] for chain in self._chains()])
+
+
+class Database(base.Database):
+    """Columnar database, see the module docstring.
+
+    :Parameters:
+    dbname : string
+      Directory of the database.
+    dbmode : {'a', 'w'}
+      Use 'a' to add chains to an existing database and 'w' to overwrite it.
+    chunk_size : int
+      Number of samples buffered in memory before they are written.
+    """
+
+    def __init__(self, dbname, dbmode="a", chunk_size=1000):
+        self.__name__ = "columnar"
+        self.__Trace__ = Trace
+        self.dbname = dbname
+        self.chunk_size = chunk_size
+        self.trace_names = []
+        # A list of sequences of names of the objects to tally.
+        self._traces = {}  # A dictionary of the Trace objects.
+        self._columns = []  # dtype, shape and file of the traces of each chain
+        self.chains = 0
+
+        if os.path.exists(dbname) and dbmode == "w":
+            shutil.rmtree(dbname)
+
+        meta_path = os.path.join(dbname, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            self.chunk_size = meta["chunk_size"]
+            self._columns = meta["chains"]
+            self.chains = len(self._columns)
+            self.trace_names = [list(columns.keys()) for columns in self._columns]
+            for columns in self._columns:
+                for name in columns:
+                    if name not in self._traces:
+                        self._traces[name] = Trace(name=name, db=self)
+
+            state_path = os.path.join(dbname, "state.pkl")
+            if os.path.exists(state_path):
+                with open(state_path, "rb") as f:
+                    self._state_ = pickle.load(f)
+            else:
+                self._state_ = {}
+
+    def _initialize(self, funs_to_tally, length=None):
+        """Create the directory of a new chain and initialize its traces."""
+        self._columns.append({})
+        chain_dir = os.path.join(self.dbname, "chain%d" % self.chains)
+        if os.path.exists(chain_dir):
+            # Left over from a chain that was never registered in meta.json
+            shutil.rmtree(chain_dir)
+        os.makedirs(chain_dir)
+        base.Database._initialize(self, funs_to_tally, length)
+        self._write_meta()
+
+    def _add_column(self, chain, name, dtype, shape):
+        self._columns[chain][name] = {
+            "file": "%d.bin" % len(self._columns[chain]),
+            "dtype": np.dtype(dtype).str,
+            "shape": list(shape),
+        }
+
+    def _column_path(self, chain, name):
+        return os.path.join(
+            self.dbname, "chain%d" % chain, self._columns[chain][name]["file"]
+        )
+
+    def _row_size(self, chain, name):
+        column = self._columns[chain][name]
+        return np.dtype(column["dtype"]).itemsize * int(np.prod(column["shape"]))
+
+    def _write_meta(self):
+        with open(os.path.join(self.dbname, "meta.json"), "w") as f:
+            json.dump({"chunk_size": self.chunk_size, "chains": self._columns}, f)
+
+    def commit(self):
+        """Flush the buffered samples and the sampler state to disk."""
+        for name, trace in self._traces.items():
+            for chain in list(trace._buffer.keys()):
+                trace._flush(chain)
+        if hasattr(self, "_state_"):
+            with open(os.path.join(self.dbname, "state.pkl"), "wb") as f:
+                pickle.dump(self._state_, f)
+
+
+def load(dbname):
+    """Load a columnar database. The traces are memory mapped when they are
+    read.
+
+    Return a Database instance.
+    """
+    return Database(dbname)
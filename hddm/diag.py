@@ -1,5 +1,9 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import copy
 import numpy as np
+import pandas as pd
 import pymc as pm
 
 np.seterr(divide="ignore")
@@ -138,6 +142,162 @@ def run_accuracy_test(nTimes=20, include=(), stop_when_fail=True):
     return {}
 
 
+def _fit_recovery_dataset(
+    task, params, model_class, model_kwargs, size, fit, samples, burn, seed
+):
+    """Simulate and fit a single dataset, used by run_recovery_study."""
+    np.random.seed(seed)
+    model = model_kwargs.get("model", None)
+    if model is None:
+        data, _ = hddm.generate.gen_rand_data(params, size=size)
+    else:
+        names = hddm.model_config.model_config[model]["params"]
+        theta = [params[name] for name in names]
+        data, _ = hddm.simulators.simulator_single_subject(
+            theta, model=model, n_samples=size, random_state=seed
+        )
+
+    row = OrderedDict([("task", task), ("seed", int(seed))])
+    for name, value in params.items():
+        row[name + "_true"] = value
+
+    i_t = time()
+    m = model_class(data, **model_kwargs)
+    if fit == "map":
+        m.map()
+        for name, value in m.values.items():
+            row[name + "_est"] = value
+    else:
+        m.sample(samples + burn, burn=burn, progress_bar=False)
+        stats = m.gen_stats()
+        for name in stats.index:
+            row[name + "_est"] = stats.loc[name, "mean"]
+            row[name + "_std"] = stats.loc[name, "std"]
+            row[name + "_2.5q"] = stats.loc[name, "2.5q"]
+            row[name + "_97.5q"] = stats.loc[name, "97.5q"]
+    row["fit_time"] = time() - i_t
+    return row
+
+
+def run_recovery_study(
+    param_sets,
+    path,
+    model_class=None,
+    model_kwargs=None,
+    size=500,
+    fit="map",
+    samples=500,
+    burn=100,
+    n_jobs=1,
+    seed=None,
+    resume=True,
+):
+    """Parameter recovery study: simulate one dataset per parameter set, fit
+    it and append the true and estimated parameters to a csv file.
+
+    Every finished fit is written to path right away, so an interrupted study
+    can be picked up again by calling the function with the same arguments.
+
+    :Arguments:
+        param_sets : pandas.DataFrame or list of dicts
+            One parameter set per dataset, e.g. the output of
+            hddm.simulators.make_parameter_vectors_nn() or a list of
+            hddm.generate.gen_rand_params() draws.
+        path : str
+            csv file the results are written to.
+
+    :Optional:
+        model_class : class <default=hddm.HDDM>
+            Model that is fit to each dataset.
+        model_kwargs : dict
+            Keyword arguments of model_class. If they contain 'model' (as for
+            hddm.HDDMnn), the datasets are simulated from that model with
+            hddm.simulators.simulator_single_subject(), otherwise with
+            hddm.generate.gen_rand_data().
+        size : int <default=500>
+            Number of trials of each dataset.
+        fit : str <default='map'>
+            'map' for the maximum a posteriori estimate or 'mcmc' for a short
+            chain of samples after burn burn-in samples.
+        n_jobs : int <default=1>
+            Number of processes fitting datasets in parallel.
+        seed : int <default=None>
+            Seed from which the seed of every dataset is drawn. Needed to
+            resume a study with the same datasets.
+        resume : bool <default=True>
+            Skip the parameter sets that already have a row in path. If False,
+            an existing file is overwritten.
+
+    :Returns:
+        pandas.DataFrame with one row per dataset, holding the columns
+        <param>_true, <param>_est (plus <param>_std, <param>_2.5q and
+        <param>_97.5q for fit='mcmc'), the dataset seed and the fit time.
+    """
+    if fit not in ("map", "mcmc"):
+        raise ValueError("fit has to be 'map' or 'mcmc', got %s" % fit)
+    if model_class is None:
+        model_class = hddm.HDDM
+    if model_kwargs is None:
+        model_kwargs = {}
+    if isinstance(param_sets, pd.DataFrame):
+        param_sets = param_sets.to_dict("records")
+    else:
+        param_sets = [dict(params) for params in param_sets]
+
+    # Draw all seeds up front, so a resumed study simulates the same datasets
+    rng = np.random.RandomState(seed)
+    seeds = rng.randint(2**31 - 1, size=len(param_sets))
+
+    columns = None
+    done = set()
+    if os.path.exists(path):
+        if resume:
+            done = set(pd.read_csv(path, usecols=["task"])["task"])
+            columns = list(pd.read_csv(path, nrows=0).columns)
+        else:
+            os.remove(path)
+    tasks = [task for task in range(len(param_sets)) if task not in done]
+
+    def write(row):
+        nonlocal columns
+        if columns is None:
+            columns = list(row.keys())
+            header = True
+        else:
+            header = False
+        pd.DataFrame([row], columns=columns).to_csv(
+            path, mode="a", header=header, index=False
+        )
+
+    args = (
+        tasks,
+        [param_sets[task] for task in tasks],
+        [model_class] * len(tasks),
+        [model_kwargs] * len(tasks),
+        [size] * len(tasks),
+        [fit] * len(tasks),
+        [samples] * len(tasks),
+        [burn] * len(tasks),
+        [seeds[task] for task in tasks],
+    )
+
+    if n_jobs == 1:
+        for row in map(_fit_recovery_dataset, *args):
+            write(row)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_fit_recovery_dataset, *task_args)
+                for task_args in zip(*args)
+            ]
+            for future in as_completed(futures):
+                write(future.result())
+
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return pd.read_csv(path).sort_values("task").reset_index(drop=True)
+
+
 def str_params(params):
     s = ""
     keys = list(params.keys())
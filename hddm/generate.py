@@ -3,7 +3,6 @@ import hddm
 import numpy as np
 import pandas as pd
 from numpy.random import rand
-from scipy.stats import uniform, norm
 from copy import copy
 from hddm.simulators.basic_simulator import *
 
@@ -198,7 +197,9 @@ def gen_rts(
     if method == "cdf_py":
         rts = _gen_rts_from_cdf(params, size, range_, dt)
     elif method == "drift":
-        rts = _gen_rts_from_simulated_drift(params, size, dt, intra_sv)[0]
+        rts = _gen_rts_from_simulated_drift(
+            params, size, dt, intra_sv, return_trajectories=False
+        )[0]
     elif method == "cdf":
         rts = hddm.wfpt.gen_rts_from_cdf(
             params["v"],
@@ -226,7 +227,143 @@ def gen_rts(
         return data
 
 
-def _gen_rts_from_simulated_drift(params, samples=1000, dt=1e-4, intra_sv=1.0):
+def _simulate_drift_process(
+    v,
+    sv,
+    a,
+    z,
+    sz,
+    t,
+    st,
+    size=None,
+    dt=1e-4,
+    intra_sv=1.0,
+    v_switch=None,
+    V_switch=0.0,
+    t_switch=0.0,
+    return_trajectories=False,
+    n_steps=1000,
+    max_elements=2**22,
+):
+    """Returns simulated RTs from simulating the drift-process of many trials at once.
+
+    Parameters can be scalars or arrays with one value per trial. All active
+    trials are advanced by blocks of n_steps steps; trials that crossed a
+    boundary are absorbed and drop out of the next block. Trials are processed
+    in chunks so that at most max_elements steps are held in memory.
+
+    :Arguments:
+        v, sv, a, z, sz, t, st : float or numpy.ndarray
+            DDM parameters (scalars or one value per trial).
+
+    :Optional:
+        size : int
+            Number of trials, needed if all parameters are scalars.
+        dt : float
+            Step size in seconds.
+        intra_sv : float
+            Intra-trial variability.
+        v_switch, V_switch, t_switch : float
+            Drift-rate (and its variability) after t_switch seconds.
+        return_trajectories : bool
+            Whether to also return the trajectory of each trial.
+        n_steps : int
+            Number of steps simulated per block.
+        max_elements : int
+            Maximum number of steps (trials x n_steps) simulated at once.
+
+    :Returns:
+        numpy.ndarray of RTs, negative for lower boundary responses.
+        If return_trajectories is True, a tuple of the RTs and a list with the
+        trajectory of each trial (starting point during the non-decision time,
+        followed by the drift).
+
+    :SeeAlso:
+        gen_rts
+    """
+    if size is None:
+        size = np.broadcast(v, sv, a, z, sz, t, st).size
+    v, sv, a, z, sz, t, st = [
+        np.broadcast_to(np.asarray(param, dtype=np.float64), (size,))
+        for param in (v, sv, a, z, sz, t, st)
+    ]
+
+    start_delay = t + (rand(size) - 0.5) * st
+    starting_points = (z + (rand(size) - 0.5) * sz) * a
+    drift_rates = v + sv * np.random.randn(size)
+    prob_up = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rates)
+    if v_switch is not None:
+        n_switch = int(round(t_switch / dt))
+        drift_rates_switch = v_switch + V_switch * np.random.randn(size)
+        prob_up_switch = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rates_switch)
+    step_size = np.sqrt(dt) * intra_sv
+
+    rts = np.empty(size)
+    decision_times = np.empty(size)
+    trajectory_blocks = [[] for _ in range(size)] if return_trajectories else None
+    chunk_size = max(1, max_elements // n_steps)
+    for chunk_start in range(0, size, chunk_size):
+        active = np.arange(chunk_start, min(chunk_start + chunk_size, size))
+        y_0 = starting_points[active]
+        steps_done = 0
+        while active.shape[0] > 0:
+            p_up = prob_up[active, None]
+            if v_switch is not None and steps_done + n_steps > n_switch:
+                p_up = np.where(
+                    steps_done + np.arange(n_steps) < n_switch,
+                    p_up,
+                    prob_up_switch[active, None],
+                )
+            position = np.where(
+                rand(active.shape[0], n_steps) < p_up, step_size, -step_size
+            )
+            position[:, 0] += y_0
+            position = np.cumsum(position, axis=1, out=position)
+
+            if return_trajectories:
+                for row, i_trial in enumerate(active):
+                    trajectory_blocks[i_trial].append(position[row])
+
+            # Find first boundary crossings
+            crossings = (position < 0) | (position > a[active, None])
+            crossed = crossings.any(axis=1)
+            rows = np.flatnonzero(crossed)
+            cross_idx = crossings[rows].argmax(axis=1)
+
+            # Interpolate the boundary interception
+            y2 = position[rows, cross_idx]
+            y1 = np.where(cross_idx > 0, position[rows, cross_idx - 1], y_0[rows])
+            boundary = np.where(y2 < 0, 0.0, a[active[rows]])
+            decision_times[active[rows]] = (
+                steps_done + cross_idx - (y2 - boundary) / (y2 - y1)
+            ) * dt
+            rts[active[rows]] = (
+                decision_times[active[rows]] + start_delay[active[rows]]
+            ) * np.sign(y2)
+
+            # Continue the drift of the remaining trials
+            y_0 = position[~crossed, -1]
+            active = active[~crossed]
+            steps_done += n_steps
+
+    if not return_trajectories:
+        return rts
+
+    trajectories = [
+        np.concatenate(
+            (
+                np.ones(int(start_delay[i] / dt)) * starting_points[i],
+                np.concatenate(trajectory_blocks[i])[: int(decision_times[i] / dt)],
+            )
+        )
+        for i in range(size)
+    ]
+    return rts, trajectories
+
+
+def _gen_rts_from_simulated_drift(
+    params, samples=1000, dt=1e-4, intra_sv=1.0, return_trajectories=True
+):
     """Returns simulated RTs from simulating the whole drift-process.
 
     :Arguments:
@@ -240,112 +377,36 @@ def _gen_rts_from_simulated_drift(params, samples=1000, dt=1e-4, intra_sv=1.0):
             How many steps/sec.
         intra_sv : float
             Intra-trial variability.
+        return_trajectories : bool
+            Whether to keep the trajectory of each sample (None is returned
+            in their place otherwise).
 
     :SeeAlso:
-        gen_rts
+        gen_rts, _simulate_drift_process
     """
-
-    from numpy.random import rand
-
     if samples is None:
         samples = 1
-    nn = 1000
-    a = params["a"]
-    v = params["v"]
-
-    if "v_switch" in params:
-        switch = True
-        t_switch = params["t_switch"] / dt
-        # Hack so that we will always step into a switch
-        nn = int(round(t_switch))
-    else:
-        switch = False
-
-    # create delay
-    if "st" in params:
-        start_delay = (
-            uniform.rvs(loc=params["t"], scale=params["st"], size=samples)
-            - params["st"] / 2.0
-        )
-    else:
-        start_delay = np.ones(samples) * params["t"]
-
-    # create starting_points
-    if "sz" in params:
-        starting_points = (
-            uniform.rvs(loc=params["z"], scale=params["sz"], size=samples)
-            - params["sz"] / 2.0
-        ) * a
-    else:
-        starting_points = np.ones(samples) * params["z"] * a
-
-    rts = np.empty(samples)
-    step_size = np.sqrt(dt) * intra_sv
-    drifts = []
-
-    for i_sample in range(samples):
-        drift = np.array([])
-        crossed = False
-        iter = 0
-        y_0 = starting_points[i_sample]
-        # drifting...
-        if "sv" in params and params["sv"] != 0:
-            drift_rate = norm.rvs(v, params["sv"])
-        else:
-            drift_rate = v
 
-        if "v_switch" in params:
-            if "V_switch" in params and params["V_switch"] != 0:
-                drift_rate_switch = norm.rvs(params["v_switch"], params["V_switch"])
-            else:
-                drift_rate_switch = params["v_switch"]
-
-        prob_up = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rate)
-
-        while not crossed:
-            # Generate nn steps
-            iter += 1
-            if iter == 2 and switch:
-                prob_up = 0.5 * (1 + np.sqrt(dt) / intra_sv * drift_rate_switch)
-            position = ((rand(nn) < prob_up) * 2 - 1) * step_size
-            position[0] += y_0
-            position = np.cumsum(position)
-            # Find boundary crossings
-            cross_idx = np.where((position < 0) | (position > a))[0]
-            drift = np.concatenate((drift, position))
-            if cross_idx.shape[0] > 0:
-                crossed = True
-            else:
-                # If not crossed, set last position as starting point
-                # for next nn steps to continue drift
-                y_0 = position[-1]
-
-        # find the boundary interception
-        y2 = position[cross_idx[0]]
-        if cross_idx[0] != 0:
-            y1 = position[cross_idx[0] - 1]
-        else:
-            y1 = y_0
-        m = (y2 - y1) / dt  # slope
-        # y = m*x + b
-        b = y2 - m * ((iter - 1) * nn + cross_idx[0]) * dt  # intercept
-        if y2 < 0:
-            rt = (0 - b) / m
-        else:
-            rt = (a - b) / m
-        rts[i_sample] = (rt + start_delay[i_sample]) * np.sign(y2)
-
-        delay = start_delay[i_sample] / dt
-        drifts.append(
-            np.concatenate(
-                (
-                    np.ones(int(delay)) * starting_points[i_sample],
-                    drift[: int(abs(rt) / dt)],
-                )
-            )
-        )
+    out = _simulate_drift_process(
+        params["v"],
+        params.get("sv", 0),
+        params["a"],
+        params.get("z", 0.5),
+        params.get("sz", 0),
+        params["t"],
+        params.get("st", 0),
+        size=samples,
+        dt=dt,
+        intra_sv=intra_sv,
+        v_switch=params.get("v_switch"),
+        V_switch=params.get("V_switch", 0),
+        t_switch=params.get("t_switch", 0),
+        return_trajectories=return_trajectories,
+    )
 
-    return rts, drifts
+    if return_trajectories:
+        return out
+    return out, None
 
 
 def pdf_with_params(rt, params):
@@ -377,7 +438,7 @@ def pdf_with_params(rt, params):
     )
 
 
-def _gen_rts_from_cdf(params, samples=1000):
+def _gen_rts_from_cdf(params, samples=1000, range_=(-6, 6), dt=1e-2):
     """Returns simulated RTs sampled from the inverse of the CDF.
 
     :Arguments:
@@ -387,20 +448,27 @@ def _gen_rts_from_cdf(params, samples=1000):
      :Optional:
          samples : int
              How many samples to generate.
+         range_ : tuple
+             Minimum (negative) and maximum (positve) RTs of the CDF grid.
+         dt : float
+             Spacing of the CDF grid.
 
      :SeeAlso:
-         gen_rts
+         gen_rts, hddm.wfpt.gen_rts_from_cdf
 
     """
-    v = params["v"]
-    V = params["sv"]
-    z = params["z"]
-    Z = params["sz"]
-    t = params["t"]
-    T = params["st"]
-    a = params["a"]
-    return hddm.likelihoods.wfpt.ppf(
-        np.random.rand(samples), args=(v, V, a, z, Z, t, T)
+    return hddm.wfpt.gen_rts_from_cdf(
+        params["v"],
+        params["sv"],
+        params["a"],
+        params["z"],
+        params["sz"],
+        params["t"],
+        params["st"],
+        samples,
+        range_[0],
+        range_[1],
+        dt,
     )
 
 
@@ -477,6 +545,195 @@ def gen_rand_data(params=None, n_fast_outliers=0, n_slow_outliers=0, **kwargs):
     return data, subj_params
 
 
+def _gen_rl_subj_params(alpha, pos_alpha, scaler, subjs):
+    """Learning rates and drift scalers of each subject, drawn around the group
+    values if subjs > 1. pos_alpha=nan means pos_alpha equals alpha."""
+    if subjs == 1:
+        alpha = np.array([alpha], dtype=float).ravel()
+        scaler = np.array([scaler], dtype=float).ravel()
+        if np.isnan(pos_alpha):
+            pos_alpha = alpha
+        else:
+            pos_alpha = np.array([pos_alpha], dtype=float).ravel()
+        return alpha, pos_alpha, scaler
+
+    alpha_subj = np.minimum(
+        np.minimum(
+            np.maximum(0.001, np.random.normal(loc=alpha, scale=0.05, size=subjs)),
+            alpha + alpha,
+        ),
+        1,
+    )
+    scaler_subj = np.random.normal(loc=scaler, scale=0.25, size=subjs)
+    if np.isnan(pos_alpha):
+        pos_alpha_subj = alpha_subj
+    else:
+        pos_alpha_subj = np.maximum(
+            0.001, np.random.normal(loc=pos_alpha, scale=0.05, size=subjs)
+        )
+    return alpha_subj, pos_alpha_subj, scaler_subj
+
+
+def _gen_bandit_rewards(
+    subjs,
+    size,
+    p_upper,
+    p_lower,
+    mu_upper,
+    mu_lower,
+    sd_upper,
+    sd_lower,
+    binary_outcome,
+    rng=np.random,
+):
+    """Rewards of the upper and lower option, each (subjs, size)."""
+    shape = (subjs, size)
+    if binary_outcome:
+        rew_up = rng.binomial(1, p_upper, shape).astype(float)
+        rew_low = rng.binomial(1, p_lower, shape).astype(float)
+    else:
+        rew_up = rng.normal(mu_upper, sd_upper, shape)
+        rew_low = rng.normal(mu_lower, sd_lower, shape)
+    return rew_up, rew_low
+
+
+def _bandit_frame(columns, subjs, size, split_by):
+    """Stack (subjs, size) arrays into the long format of the RL generators."""
+    data = pd.DataFrame(
+        {name: np.ravel(values) for name, values in columns.items()},
+        index=np.tile(np.arange(size), subjs),
+    )
+    data["subj_idx"] = np.repeat(np.arange(subjs), size)
+    data["split_by"] = split_by
+    data["trial"] = np.tile(np.arange(1, size + 1), subjs)
+    return data
+
+
+def simulate_rlssm_bandit(
+    model,
+    ssm_params,
+    rl_params,
+    size,
+    p_upper=1,
+    p_lower=0,
+    dual=False,
+    q_init=0.5,
+    mu_upper=1,
+    mu_lower=0,
+    sd_upper=0.1,
+    sd_lower=0.1,
+    binary_outcome=True,
+    random_state=None,
+):
+    """Simulate a batch of RLSSM agents on the 2-armed bandit task in lockstep.
+
+    Every agent learns Q-values with the Rescorla-Wagner rule and decides with
+    the sequential sampling model, with drift scaler * (q_up - q_low). All
+    agents are stepped through the trials together, with a single simulator()
+    call per trial.
+
+    :Arguments:
+        model: str
+            String that determines which sequential sampling model to use.
+        ssm_params: numpy.ndarray
+            (n_agents, n_ssm_params) sequential sampling model parameters in the
+            order of model_config, with the drift scaler in place of the drift.
+        rl_params: numpy.ndarray
+            (n_agents, n_rl_params) learning rates in the order of model_config_rl.
+        size: int or numpy.ndarray
+            Number of trials, or the number of trials of each agent.
+
+    :Optional:
+        p_upper, p_lower: float or numpy.ndarray
+            Probability of reward for the upper and lower action (per agent).
+        dual: bool <default=False>
+            Flag to denote if use of separate learning rates for positive and negative RPEs.
+        q_init: float <default=0.5>
+            Initial q-values.
+        mu_upper, mu_lower, sd_upper, sd_lower: float
+            Mean and std. dev. of the (normal) rewards if binary_outcome is False.
+        binary_outcome: bool <default=True>
+            Denotes if the reward scheme is binary (as opposed to non-binary).
+        random_state: None or int
+            Seed. If None, numpy's global random state is used. The output is
+            identical for identical seeds.
+
+    :Returns:
+        sim: dict
+            (n_agents, n_trials) arrays 'q_up', 'q_low', 'sim_drift', 'rew_up',
+            'rew_low', 'response', 'rt' and 'feedback'. Trials past the number of
+            trials of an agent are nan.
+    """
+    rng = np.random if random_state is None else np.random.RandomState(random_state)
+    ssm_params = np.atleast_2d(np.asarray(ssm_params, dtype=float))
+    rl_params = np.atleast_2d(np.asarray(rl_params, dtype=float))
+    n_agents = ssm_params.shape[0]
+    sizes = np.broadcast_to(size, n_agents)
+    n_trials = int(sizes.max()) if n_agents else 0
+
+    scaler = ssm_params[:, 0]
+    alpha = rl_params[:, 0]
+    pos_alpha = rl_params[:, 1] if dual else alpha
+
+    rew_up, rew_low = _gen_bandit_rewards(
+        n_agents,
+        n_trials,
+        np.reshape(p_upper, (-1, 1)),
+        np.reshape(p_lower, (-1, 1)),
+        mu_upper,
+        mu_lower,
+        sd_upper,
+        sd_lower,
+        binary_outcome,
+        rng=rng,
+    )
+    sim = {
+        name: np.full((n_agents, n_trials), np.nan)
+        for name in ("q_up", "q_low", "sim_drift", "response", "rt", "feedback")
+    }
+    q_up = np.full(n_agents, q_init, dtype=float)
+    q_low = np.full(n_agents, q_init, dtype=float)
+    theta = ssm_params.copy()
+
+    for i in range(n_trials):
+        active = np.flatnonzero(sizes > i)
+        sim["q_up"][active, i] = q_up[active]
+        sim["q_low"][active, i] = q_low[active]
+        theta[active, 0] = (q_up[active] - q_low[active]) * scaler[active]
+        sim["sim_drift"][active, i] = theta[active, 0]
+
+        # simulate all agents with given params
+        rts, choices, _ = simulator(
+            theta=theta[active],
+            model=model,
+            n_samples=1,
+            delta_t=0.001,
+            max_t=20,
+            no_noise=False,
+            bin_dim=None,
+            bin_pointwise=False,
+            random_state=rng.randint(2**31 - 1),
+        )
+        # flip the responses to [1,0]
+        upper = np.ravel(choices) >= 1
+        sim["response"][active, i] = upper
+        sim["rt"][active, i] = np.ravel(rts)
+
+        # update the q-value of the chosen option
+        feedback = np.where(upper, rew_up[active, i], rew_low[active, i])
+        q_chosen = np.where(upper, q_up[active], q_low[active])
+        alfa = np.where(feedback > q_chosen, pos_alpha[active], alpha[active])
+        q_chosen = q_chosen + alfa * (feedback - q_chosen)
+        q_up[active] = np.where(upper, q_chosen, q_up[active])
+        q_low[active] = np.where(upper, q_low[active], q_chosen)
+        sim["feedback"][active, i] = feedback
+
+    past_end = np.arange(n_trials) >= sizes[:, None]
+    sim["rew_up"] = np.where(past_end, np.nan, rew_up)
+    sim["rew_low"] = np.where(past_end, np.nan, rew_low)
+    return sim
+
+
 def gen_rand_rlssm_data_MAB_RWupdate(
     model,
     ssm_param,
@@ -494,6 +751,7 @@ def gen_rand_rlssm_data_MAB_RWupdate(
     sd_lower=0.1,
     binary_outcome=True,
     uncertainty=False,
+    random_state=None,
 ):
     """Generate RLSSM datasets on 2-armed bandit task.
 
@@ -528,6 +786,95 @@ def gen_rand_rlssm_data_MAB_RWupdate(
             Std. dev. of the (normal) reward distribution for the lower action/choice.
         binary_outcome: bool <default=True>
             Denotes if the reward scheme is binary (as opposed to non-binary). Non-binary rewards are sampled from normal distributions.
+        random_state: int <default=None>
+            Seed, see simulate_rlssm_bandit(). All subjects are simulated in lockstep.
+
+
+    :Returns:
+        all_data: Pandas.Dataframe
+            Pandas DataFrame containing all the simulated data.
+    """
+    sim = simulate_rlssm_bandit(
+        model,
+        np.tile(np.asarray(ssm_param, dtype=float), (subjs, 1)),
+        np.tile(np.asarray(rl_param, dtype=float), (subjs, 1)),
+        size,
+        p_upper=p_upper,
+        p_lower=p_lower,
+        dual=dual,
+        q_init=q_init,
+        mu_upper=mu_upper,
+        mu_lower=mu_lower,
+        sd_upper=sd_upper,
+        sd_lower=sd_lower,
+        binary_outcome=binary_outcome,
+        random_state=random_state,
+    )
+    return _bandit_frame(
+        {
+            name: sim[name]
+            for name in ("q_up", "q_low", "sim_drift", "response", "rt", "feedback")
+        },
+        subjs,
+        size,
+        split_by,
+    )
+
+
+def gen_rand_rlssm_reg_data_MAB_RWupdate(
+    model,
+    ssm_param,
+    rl_param,
+    neural,
+    dual=False,
+    size=1,
+    p_upper=1,
+    p_lower=0,
+    q_init=0.5,
+    subjs=1,
+    split_by=0,
+    mu_upper=1,
+    mu_lower=0,
+    sd_upper=0.1,
+    sd_lower=0.1,
+    binary_outcome=True,
+    uncertainty=False,
+):
+    """Generate RLSSM regression datasets on 2-armed bandit task.
+
+    :Arguments:
+        model: str
+            String that determines which sequential sampling model to use.
+        ssm_param: list
+            List of sequential sampling model parameters (in the order of what you define in model_config).
+        rl_param: list
+            List of reinforcement learning parameters (in the order of what you define in model_config_rl).
+        neural: float
+            (Linear) coefficient for regression function on 'a'.
+        dual: bool <default=False>
+            Flag to denote if use of separate learning rates for positive and negative RPEs.
+        size: int <default=1>
+            Number of trials to simulate.
+        p_upper: float <default=1>
+            Probability of reward for the upper action/choice.
+        p_lower: float <default=0>
+            Probability of reward for the lower action/choice.
+        q_init: int <default=0.5>
+            Initial q-values.
+        subjs: int <default=1>
+            Number of subjects to simulate.
+        split_by: int <default=0>
+            Denotes the condition number/index in the experiment.
+        mu_upper: float <default=1>
+            Mean of the (normal) reward distribution for the upper action/choice.
+        mu_lower: float <default=0>
+            Mean of the (normal) reward distribution for the lower action/choice.
+        sd_upper: float <default=0.1>
+            Std. dev. of the (normal) reward distribution for the upper action/choice.
+        sd_lower: float <default=0.1>
+            Std. dev. of the (normal) reward distribution for the lower action/choice.
+        binary_outcome: bool <default=True>
+            Denotes if the reward scheme is binary (as opposed to non-binary). Non-binary rewards are sampled from normal distributions.
 
 
     :Returns:
@@ -551,6 +898,7 @@ def gen_rand_rlssm_data_MAB_RWupdate(
         response = np.tile([0.5], n)
         feedback = np.tile([0.5], n)
         rt = np.tile([0], n)
+        neural_reg = np.random.normal(0, 1, size=n)
         if binary_outcome:
             rew_up = np.random.binomial(1, p_upper, n).astype(float)
             rew_low = np.random.binomial(1, p_lower, n).astype(float)
@@ -571,6 +919,7 @@ def gen_rand_rlssm_data_MAB_RWupdate(
             "subj_idx": subj_idx,
             "split_by": split_by,
             "trial": 1,
+            "neural_reg": neural_reg,
         }
         df = pd.DataFrame(data=d)
         df = df[
@@ -586,11 +935,18 @@ def gen_rand_rlssm_data_MAB_RWupdate(
                 "subj_idx",
                 "split_by",
                 "trial",
+                "neural_reg",
             ]
         ]
 
         # Get sim_params for passing into the simulator
-        sim_params = np.append([df.loc[0, "sim_drift"]], ssm_param[1:])
+        sim_params = np.concatenate(
+            (
+                [df.loc[0, "sim_drift"]],
+                [ssm_param[1] + neural * df.loc[0, "neural_reg"]],
+                ssm_param[2:],
+            )
+        )
 
         # simulate model with given params
         res = simulator(
@@ -647,7 +1003,14 @@ def gen_rand_rlssm_data_MAB_RWupdate(
             df.loc[i, "sim_drift"] = (df.loc[i, "q_up"] - df.loc[i, "q_low"]) * (scaler)
 
             # Get sim_params for passing into the simulator
-            sim_params = np.append([df.loc[i, "sim_drift"]], ssm_param[1:])
+            # sim_params = np.append([df.loc[i, "sim_drift"]], ssm_param[1:])
+            sim_params = np.concatenate(
+                (
+                    [df.loc[i, "sim_drift"]],
+                    [ssm_param[1] + neural * df.loc[i, "neural_reg"]],
+                    ssm_param[2:],
+                )
+            )
 
             # simulate model with given params
             res = simulator(
@@ -694,22 +1057,24 @@ def gen_rand_rlssm_data_MAB_RWupdate(
             "subj_idx",
             "split_by",
             "trial",
+            "neural_reg",
         ]
     ]
 
     return all_data
 
 
-def gen_rand_rlssm_reg_data_MAB_RWupdate(
-    model,
-    ssm_param,
-    rl_param,
-    neural,
-    dual=False,
+def gen_rand_rlddm_data(
+    a,
+    t,
+    scaler,
+    alpha,
     size=1,
     p_upper=1,
     p_lower=0,
+    z=0.5,
     q_init=0.5,
+    pos_alpha=float("nan"),
     subjs=1,
     split_by=0,
     mu_upper=1,
@@ -719,233 +1084,65 @@ def gen_rand_rlssm_reg_data_MAB_RWupdate(
     binary_outcome=True,
     uncertainty=False,
 ):
-    """Generate RLSSM regression datasets on 2-armed bandit task.
-
-    :Arguments:
-        model: str
-            String that determines which sequential sampling model to use.
-        ssm_param: list
-            List of sequential sampling model parameters (in the order of what you define in model_config).
-        rl_param: list
-            List of reinforcement learning parameters (in the order of what you define in model_config_rl).
-        neural: float
-            (Linear) coefficient for regression function on 'a'.
-        dual: bool <default=False>
-            Flag to denote if use of separate learning rates for positive and negative RPEs.
-        size: int <default=1>
-            Number of trials to simulate.
-        p_upper: float <default=1>
-            Probability of reward for the upper action/choice.
-        p_lower: float <default=0>
-            Probability of reward for the lower action/choice.
-        q_init: int <default=0.5>
-            Initial q-values.
-        subjs: int <default=1>
-            Number of subjects to simulate.
-        split_by: int <default=0>
-            Denotes the condition number/index in the experiment.
-        mu_upper: float <default=1>
-            Mean of the (normal) reward distribution for the upper action/choice.
-        mu_lower: float <default=0>
-            Mean of the (normal) reward distribution for the lower action/choice.
-        sd_upper: float <default=0.1>
-            Std. dev. of the (normal) reward distribution for the upper action/choice.
-        sd_lower: float <default=0.1>
-            Std. dev. of the (normal) reward distribution for the lower action/choice.
-        binary_outcome: bool <default=True>
-            Denotes if the reward scheme is binary (as opposed to non-binary). Non-binary rewards are sampled from normal distributions.
-
+    """Generate RLDDM datasets on the 2-armed bandit task.
 
-    :Returns:
-        all_data: Pandas.Dataframe
-            Pandas DataFrame containing all the simulated data.
+    Q-learning runs trial by trial in hddm.wfpt.bandit_q_learning (subjects in
+    parallel) with the choices drawn from the exact boundary probabilities of
+    the DDM. The RTs do not affect learning and are drawn afterwards for all
+    trials at once with exact_wfpt_decision_times().
     """
+    if subjs > 1:
+        t = np.maximum(0.05, np.random.normal(loc=t, scale=0.05, size=subjs))
+        a = np.maximum(0.05, np.random.normal(loc=a, scale=0.15, size=subjs))
+    a = np.full(subjs, np.ravel(a), dtype=float)
+    t = np.full(subjs, np.ravel(t), dtype=float)
+    z = np.full(subjs, z, dtype=float)
+    alpha, pos_alpha, scaler = _gen_rl_subj_params(alpha, pos_alpha, scaler, subjs)
+    rew_up, rew_low = _gen_bandit_rewards(
+        subjs,
+        size,
+        p_upper,
+        p_lower,
+        mu_upper,
+        mu_lower,
+        sd_upper,
+        sd_lower,
+        binary_outcome,
+    )
 
-    scaler = ssm_param[0]
-    alpha = rl_param[0]
-    if dual:
-        pos_alfa = rl_param[1]
-    else:
-        pos_alfa = alpha
-
-    all_data = []
+    response = np.empty((subjs, size))
+    q_up, q_low, sim_drift, _, feedback = hddm.wfpt.bandit_q_learning(
+        scaler,
+        alpha,
+        pos_alpha,
+        a,
+        z,
+        rew_up,
+        rew_low,
+        np.random.uniform(size=(subjs, size)),
+        response,
+        q_init=q_init,
+    )
+    rt = t[:, None] + exact_wfpt_decision_times(
+        response, sim_drift, a[:, None], z[:, None]
+    )
 
-    for s in range(0, subjs):
-        n = size
-        q_up = np.tile([q_init], n)
-        q_low = np.tile([q_init], n)
-        response = np.tile([0.5], n)
-        feedback = np.tile([0.5], n)
-        rt = np.tile([0], n)
-        neural_reg = np.random.normal(0, 1, size=n)
-        if binary_outcome:
-            rew_up = np.random.binomial(1, p_upper, n).astype(float)
-            rew_low = np.random.binomial(1, p_lower, n).astype(float)
-        else:
-            rew_up = np.random.normal(mu_upper, sd_upper, n)
-            rew_low = np.random.normal(mu_lower, sd_lower, n)
-        sim_drift = np.tile([0], n)
-        subj_idx = np.tile([s], n)
-        d = {
+    return _bandit_frame(
+        {
             "q_up": q_up,
             "q_low": q_low,
             "sim_drift": sim_drift,
-            "rew_up": rew_up,
-            "rew_low": rew_low,
             "response": response,
             "rt": rt,
             "feedback": feedback,
-            "subj_idx": subj_idx,
-            "split_by": split_by,
-            "trial": 1,
-            "neural_reg": neural_reg,
-        }
-        df = pd.DataFrame(data=d)
-        df = df[
-            [
-                "q_up",
-                "q_low",
-                "sim_drift",
-                "rew_up",
-                "rew_low",
-                "response",
-                "rt",
-                "feedback",
-                "subj_idx",
-                "split_by",
-                "trial",
-                "neural_reg",
-            ]
-        ]
-
-        # Get sim_params for passing into the simulator
-        sim_params = np.concatenate(
-            (
-                [df.loc[0, "sim_drift"]],
-                [ssm_param[1] + neural * df.loc[0, "neural_reg"]],
-                ssm_param[2:],
-            )
-        )
-
-        # simulate model with given params
-        res = simulator(
-            theta=sim_params,
-            model=model,
-            n_samples=1,
-            delta_t=0.001,  # n_trials
-            max_t=20,
-            no_noise=False,
-            bin_dim=None,
-            bin_pointwise=False,
-        )
-        # get the results in desired df format [rt, response] -- from np.array (1, 2)
-        tres = np.transpose(np.squeeze(np.array(list(res[0:2])), axis=1))
-        data = pd.DataFrame(tres, columns=["rt", "response"])
-        # flip the responses to [1,0]
-        data.loc[data["response"] < 1, "response"] = 0
-
-        df.loc[0, "response"] = data.response[0]
-        df.loc[0, "rt"] = data.rt[0]
-        if data.response[0] == 1.0:
-            df.loc[0, "feedback"] = df.loc[0, "rew_up"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_up"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            df.loc[0, "feedback"] = df.loc[0, "rew_low"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_low"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-
-        for i in range(1, n):
-            df.loc[i, "trial"] = i + 1
-            df.loc[i, "q_up"] = (
-                df.loc[i - 1, "q_up"] * (1 - df.loc[i - 1, "response"])
-            ) + (
-                (df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_up"]
-                    + (alfa * (df.loc[i - 1, "rew_up"] - df.loc[i - 1, "q_up"]))
-                )
-            )
-            df.loc[i, "q_low"] = (
-                df.loc[i - 1, "q_low"] * (df.loc[i - 1, "response"])
-            ) + (
-                (1 - df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_low"]
-                    + (alfa * (df.loc[i - 1, "rew_low"] - df.loc[i - 1, "q_low"]))
-                )
-            )
-            df.loc[i, "sim_drift"] = (df.loc[i, "q_up"] - df.loc[i, "q_low"]) * (scaler)
-
-            # Get sim_params for passing into the simulator
-            # sim_params = np.append([df.loc[i, "sim_drift"]], ssm_param[1:])
-            sim_params = np.concatenate(
-                (
-                    [df.loc[i, "sim_drift"]],
-                    [ssm_param[1] + neural * df.loc[i, "neural_reg"]],
-                    ssm_param[2:],
-                )
-            )
-
-            # simulate model with given params
-            res = simulator(
-                theta=sim_params,
-                model=model,
-                n_samples=1,
-                delta_t=0.001,  # n_trials
-                max_t=20,
-                no_noise=False,
-                bin_dim=None,
-                bin_pointwise=False,
-            )
-            # get the results in desired df format [rt, response] -- from np.array (1, 2)
-            tres = np.transpose(np.squeeze(np.array(list(res[0:2])), axis=1))
-            data = pd.DataFrame(tres, columns=["rt", "response"])
-            # flip the responses to [1,0]
-            data.loc[data["response"] < 1, "response"] = 0
-
-            df.loc[i, "response"] = data.response[0]
-            df.loc[i, "rt"] = data.rt[0]
-            if data.response[0] == 1.0:
-                df.loc[i, "feedback"] = df.loc[i, "rew_up"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_up"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-            else:
-                df.loc[i, "feedback"] = df.loc[i, "rew_low"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_low"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-
-        all_data.append(df)
-    all_data = pd.concat(all_data, axis=0)
-    all_data = all_data[
-        [
-            "q_up",
-            "q_low",
-            "sim_drift",
-            "response",
-            "rt",
-            "feedback",
-            "subj_idx",
-            "split_by",
-            "trial",
-            "neural_reg",
-        ]
-    ]
-
-    return all_data
+        },
+        subjs,
+        size,
+        split_by,
+    )
 
 
-def gen_rand_rlddm_data(
-    a,
-    t,
+def gen_rand_rl_data(
     scaler,
     alpha,
     size=1,
@@ -961,333 +1158,53 @@ def gen_rand_rlddm_data(
     sd_upper=0.1,
     sd_lower=0.1,
     binary_outcome=True,
-    uncertainty=False,
 ):
-    all_data = []
-    tg = t
-    ag = a
-    alphag = alpha
-    pos_alphag = pos_alpha
-    scalerg = scaler
-    for s in range(0, subjs):
-        t = (
-            np.maximum(0.05, np.random.normal(loc=tg, scale=0.05, size=1))
-            if subjs > 1
-            else tg
-        )
-        a = (
-            np.maximum(0.05, np.random.normal(loc=ag, scale=0.15, size=1))
-            if subjs > 1
-            else ag
-        )
-        alpha = (
-            np.minimum(
-                np.minimum(
-                    np.maximum(0.001, np.random.normal(loc=alphag, scale=0.05, size=1)),
-                    alphag + alphag,
-                ),
-                1,
-            )
-            if subjs > 1
-            else alphag
-        )
-        scaler = (
-            np.random.normal(loc=scalerg, scale=0.25, size=1) if subjs > 1 else scalerg
-        )
-        if np.isnan(pos_alpha):
-            pos_alfa = alpha
-        else:
-            pos_alfa = (
-                np.maximum(0.001, np.random.normal(loc=pos_alphag, scale=0.05, size=1))
-                if subjs > 1
-                else pos_alphag
-            )
-        n = size
-        q_up = np.tile([q_init], n)
-        q_low = np.tile([q_init], n)
-        response = np.tile([0.5], n)
-        feedback = np.tile([0.5], n)
-        rt = np.tile([0], n)
-        if binary_outcome:
-            rew_up = np.random.binomial(1, p_upper, n).astype(float)
-            rew_low = np.random.binomial(1, p_lower, n).astype(float)
-        else:
-            rew_up = np.random.normal(mu_upper, sd_upper, n)
-            rew_low = np.random.normal(mu_lower, sd_lower, n)
-        sim_drift = np.tile([0], n)
-        subj_idx = np.tile([s], n)
-        d = {
-            "q_up": q_up,
-            "q_low": q_low,
-            "sim_drift": sim_drift,
-            "rew_up": rew_up,
-            "rew_low": rew_low,
-            "response": response,
-            "rt": rt,
-            "feedback": feedback,
-            "subj_idx": subj_idx,
-            "split_by": split_by,
-            "trial": 1,
-        }
-        df = pd.DataFrame(data=d)
-        df = df[
-            [
-                "q_up",
-                "q_low",
-                "sim_drift",
-                "rew_up",
-                "rew_low",
-                "response",
-                "rt",
-                "feedback",
-                "subj_idx",
-                "split_by",
-                "trial",
-            ]
-        ]
+    """Generate choices (without RTs) of the RL model on the 2-armed bandit task.
 
-        data, params = hddm.generate.gen_rand_data(
-            {"a": a, "t": t, "v": df.loc[0, "sim_drift"], "z": z}, subjs=1, size=1
-        )
-        df.loc[0, "response"] = data.response[0]
-        df.loc[0, "rt"] = data.rt[0]
-        if data.response[0] == 1.0:
-            df.loc[0, "feedback"] = df.loc[0, "rew_up"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_up"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            df.loc[0, "feedback"] = df.loc[0, "rew_low"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_low"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-
-        for i in range(1, n):
-            df.loc[i, "trial"] = i + 1
-            df.loc[i, "q_up"] = (
-                df.loc[i - 1, "q_up"] * (1 - df.loc[i - 1, "response"])
-            ) + (
-                (df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_up"]
-                    + (alfa * (df.loc[i - 1, "rew_up"] - df.loc[i - 1, "q_up"]))
-                )
-            )
-            df.loc[i, "q_low"] = (
-                df.loc[i - 1, "q_low"] * (df.loc[i - 1, "response"])
-            ) + (
-                (1 - df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_low"]
-                    + (alfa * (df.loc[i - 1, "rew_low"] - df.loc[i - 1, "q_low"]))
-                )
-            )
-            df.loc[i, "sim_drift"] = (df.loc[i, "q_up"] - df.loc[i, "q_low"]) * (scaler)
-            data, params = hddm.generate.gen_rand_data(
-                {"a": a, "t": t, "v": df.loc[i, "sim_drift"], "z": z}, subjs=1, size=1
-            )
-            df.loc[i, "response"] = data.response[0]
-            df.loc[i, "rt"] = data.rt[0]
-            if data.response[0] == 1.0:
-                df.loc[i, "feedback"] = df.loc[i, "rew_up"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_up"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-            else:
-                df.loc[i, "feedback"] = df.loc[i, "rew_low"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_low"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-
-        all_data.append(df)
-    all_data = pd.concat(all_data, axis=0)
-    all_data = all_data[
-        [
-            "q_up",
-            "q_low",
-            "sim_drift",
-            "response",
-            "rt",
-            "feedback",
-            "subj_idx",
-            "split_by",
-            "trial",
-        ]
-    ]
-
-    return all_data
+    The probability p of an upper response is that of a DDM with a=1, or 0.5
+    while |sim_drift| < 0.01. See gen_rand_rlddm_data().
+    """
+    alpha, pos_alpha, scaler = _gen_rl_subj_params(alpha, pos_alpha, scaler, subjs)
+    rew_up, rew_low = _gen_bandit_rewards(
+        subjs,
+        size,
+        p_upper,
+        p_lower,
+        mu_upper,
+        mu_lower,
+        sd_upper,
+        sd_lower,
+        binary_outcome,
+    )
 
+    response = np.empty((subjs, size))
+    q_up, q_low, sim_drift, p, feedback = hddm.wfpt.bandit_q_learning(
+        scaler,
+        alpha,
+        pos_alpha,
+        np.ones(subjs),
+        np.full(subjs, z, dtype=float),
+        rew_up,
+        rew_low,
+        np.random.uniform(size=(subjs, size)),
+        response,
+        q_init=q_init,
+        flat_eps=0.01,
+    )
 
-def gen_rand_rl_data(
-    scaler,
-    alpha,
-    size=1,
-    p_upper=1,
-    p_lower=0,
-    z=0.5,
-    q_init=0.5,
-    pos_alpha=float("nan"),
-    subjs=1,
-    split_by=0,
-    mu_upper=1,
-    mu_lower=0,
-    sd_upper=0.1,
-    sd_lower=0.1,
-    binary_outcome=True,
-):
-    all_data = []
-    alphag = alpha
-    pos_alphag = pos_alpha
-    scalerg = scaler
-    for s in range(0, subjs):
-        alpha = (
-            np.minimum(
-                np.minimum(
-                    np.maximum(0.001, np.random.normal(loc=alphag, scale=0.05, size=1)),
-                    alphag + alphag,
-                ),
-                1,
-            )
-            if subjs > 1
-            else alphag
-        )
-        scaler = (
-            np.random.normal(loc=scalerg, scale=0.25, size=1) if subjs > 1 else scalerg
-        )
-        if np.isnan(pos_alpha):
-            pos_alfa = alpha
-        else:
-            pos_alfa = (
-                np.maximum(0.001, np.random.normal(loc=pos_alphag, scale=0.05, size=1))
-                if subjs > 1
-                else pos_alphag
-            )
-        n = size
-        q_up = np.tile([q_init], n)  # initialize q
-        q_low = np.tile([q_init], n)  # initialize q
-        response = np.tile([0.5], n)
-        feedback = np.tile([0.5], n)
-        rt = np.tile([0], n)
-        if binary_outcome:
-            rew_up = np.random.binomial(1, p_upper, n).astype(float)
-            rew_low = np.random.binomial(1, p_lower, n).astype(float)
-        else:
-            rew_up = np.random.normal(mu_upper, sd_upper, n)
-            rew_low = np.random.normal(mu_lower, sd_lower, n)
-        sim_drift = np.tile([0], n)
-        p = np.tile([0.5], n)
-        subj_idx = np.tile([s], n)
-        d = {
+    return _bandit_frame(
+        {
             "q_up": q_up,
             "q_low": q_low,
             "p": p,
             "sim_drift": sim_drift,
-            "rew_up": rew_up,
-            "rew_low": rew_low,
             "response": response,
             "feedback": feedback,
-            "subj_idx": subj_idx,
-            "split_by": split_by,
-            "trial": 1,
-        }
-        df = pd.DataFrame(data=d)
-        df = df[
-            [
-                "q_up",
-                "q_low",
-                "p",
-                "sim_drift",
-                "rew_up",
-                "rew_low",
-                "response",
-                "feedback",
-                "subj_idx",
-                "split_by",
-                "trial",
-            ]
-        ]
-        if df.loc[0, "sim_drift"] == 0:
-            df.loc[0, "p"] = 0.5
-        else:
-            df.loc[0, "p"] = (np.exp(-2 * z * df.loc[0, "sim_drift"]) - 1) / (
-                np.exp(-2 * df.loc[0, "sim_drift"]) - 1
-            )
-        df.loc[0, "response"] = np.random.binomial(1, df.loc[0, "p"], 1)
-        if df.loc[0, "response"] == 1.0:
-            df.loc[0, "feedback"] = df.loc[0, "rew_up"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_up"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            df.loc[0, "feedback"] = df.loc[0, "rew_low"]
-            if df.loc[0, "feedback"] > df.loc[0, "q_low"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-
-        for i in range(1, n):
-            df.loc[i, "trial"] = i + 1
-            df.loc[i, "q_up"] = (
-                df.loc[i - 1, "q_up"] * (1 - df.loc[i - 1, "response"])
-            ) + (
-                (df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_up"]
-                    + (alfa * (df.loc[i - 1, "rew_up"] - df.loc[i - 1, "q_up"]))
-                )
-            )
-            df.loc[i, "q_low"] = (
-                df.loc[i - 1, "q_low"] * (df.loc[i - 1, "response"])
-            ) + (
-                (1 - df.loc[i - 1, "response"])
-                * (
-                    df.loc[i - 1, "q_low"]
-                    + (alfa * (df.loc[i - 1, "rew_low"] - df.loc[i - 1, "q_low"]))
-                )
-            )
-            df.loc[i, "sim_drift"] = (df.loc[i, "q_up"] - df.loc[i, "q_low"]) * (scaler)
-            if 0.01 > df.loc[i, "sim_drift"] > -0.01:
-                df.loc[i, "p"] = 0.5
-            else:
-                df.loc[i, "p"] = (np.exp(-2 * z * df.loc[i, "sim_drift"]) - 1) / (
-                    np.exp(-2 * df.loc[i, "sim_drift"]) - 1
-                )
-            df.loc[i, "response"] = np.random.binomial(1, df.loc[i, "p"], 1)
-            if df.loc[i, "response"] == 1.0:
-                df.loc[i, "feedback"] = df.loc[i, "rew_up"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_up"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-            else:
-                df.loc[i, "feedback"] = df.loc[i, "rew_low"]
-                if df.loc[i, "feedback"] > df.loc[i, "q_low"]:
-                    alfa = pos_alfa
-                else:
-                    alfa = alpha
-
-        all_data.append(df)
-    all_data = pd.concat(all_data, axis=0)
-    all_data = all_data[
-        [
-            "q_up",
-            "q_low",
-            "p",
-            "sim_drift",
-            "response",
-            "feedback",
-            "subj_idx",
-            "split_by",
-            "trial",
-        ]
-    ]
-
-    return all_data
+        },
+        subjs,
+        size,
+        split_by,
+    )
 
 
 # function that takes the data as input to simulate the same trials that the subject received
@@ -1296,71 +1213,37 @@ def gen_rand_rl_data(
 def gen_rand_rlddm_onestep_data(
     a, t, scaler, alpha, data, z=0.5, pos_alpha=float("nan")
 ):
-    asub = a
-    tsub = t
     df = data.reset_index()
     n = df.shape[0]
-    df["sim_drift"] = 0
-    df["sim_response"] = 0
-    df["sim_rt"] = 0
-    df["q_up"] = df["q_init"]
-    df["q_low"] = df["q_init"]
-    df["rew_up"] = df["feedback"]
-    df["rew_low"] = df["feedback"]
     if np.isnan(pos_alpha):
-        pos_alfa = alpha
-    else:
-        pos_alfa = pos_alpha
-    sdata, params = hddm.generate.gen_rand_data(
-        {"a": asub, "t": tsub, "v": df.loc[0, "sim_drift"], "z": z}, subjs=1, size=1
+        pos_alpha = alpha
+
+    # Q-values follow the observed responses and feedback
+    response = df["response"].values.astype(float).reshape(1, n)
+    feedback = df["feedback"].values.astype(float).reshape(1, n)
+    q_up, q_low, sim_drift, p_upper, _ = hddm.wfpt.bandit_q_learning(
+        np.array([scaler], dtype=float),
+        np.array([alpha], dtype=float),
+        np.array([pos_alpha], dtype=float),
+        np.array([a], dtype=float),
+        np.array([z], dtype=float),
+        feedback,
+        feedback,
+        np.empty((1, n)),
+        response,
+        q_init=df["q_init"].iloc[0],
+        simulate=False,
     )
-    df.loc[0, "sim_response"] = sdata.response[0]
-    if df.response[0] == 1:
-        if df.loc[0, "feedback"] > df.loc[0, "q_up"]:
-            alfa = pos_alfa
-        else:
-            alfa = alpha
-    else:
-        if df.loc[0, "feedback"] > df.loc[0, "q_low"]:
-            alfa = pos_alfa
-        else:
-            alfa = alpha
-    df.loc[0, "sim_rt"] = sdata.rt[0]
-
-    for i in range(1, n):
-        df.loc[i, "trial"] = i + 1
-        df.loc[i, "q_up"] = (
-            df.loc[i - 1, "q_up"] * (1 - df.loc[i - 1, "response"])
-        ) + (
-            (df.loc[i - 1, "response"])
-            * (
-                df.loc[i - 1, "q_up"]
-                + (alfa * (df.loc[i - 1, "rew_up"] - df.loc[i - 1, "q_up"]))
-            )
-        )
-        df.loc[i, "q_low"] = (df.loc[i - 1, "q_low"] * (df.loc[i - 1, "response"])) + (
-            (1 - df.loc[i - 1, "response"])
-            * (
-                df.loc[i - 1, "q_low"]
-                + (alfa * (df.loc[i - 1, "rew_low"] - df.loc[i - 1, "q_low"]))
-            )
-        )
-        df.loc[i, "sim_drift"] = (df.loc[i, "q_up"] - df.loc[i, "q_low"]) * (scaler)
-        sdata, params = hddm.generate.gen_rand_data(
-            {"a": asub, "t": tsub, "v": df.loc[i, "sim_drift"], "z": z}, subjs=1, size=1
-        )
-        df.loc[i, "sim_response"] = sdata.response[0]
-        df.loc[i, "sim_rt"] = sdata.rt[0]
-        if df.response[i] == 1.0:
-            if df.loc[i, "feedback"] > df.loc[i, "q_up"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
-        else:
-            if df.loc[i, "feedback"] > df.loc[i, "q_low"]:
-                alfa = pos_alfa
-            else:
-                alfa = alpha
+    sim_response = (np.random.uniform(size=n) < p_upper[0]).astype(int)
+
+    df["sim_drift"] = sim_drift[0]
+    df["sim_response"] = sim_response
+    df["sim_rt"] = t + exact_wfpt_decision_times(sim_response, sim_drift[0], a, z)
+    df["q_up"] = q_up[0]
+    df["q_low"] = q_low[0]
+    df["rew_up"] = df["feedback"]
+    df["rew_low"] = df["feedback"]
+    df.loc[1:, "trial"] = np.arange(2, n + 1)
     return df
 
 
@@ -4,6 +4,7 @@ from scipy import stats
 from hddm.simulators import *
 
 from kabuki.utils import stochastic_from_dist
+from wfpt import LRUCache
 
 from hddm.model_config import model_config
 
@@ -80,8 +81,13 @@ def general_WienerCont(err=1e-4, n_st=2, n_sz=2, use_adaptive=1, simps_err=1e-3)
     return stochastic_from_dist(name="Wiener Diffusion Contaminant Process", logp=_like)
 
 
+# CDFs of the wfpt nodes (cdf_vec), shared by all nodes. Keyed by the
+# parents' values, the wiener_params and the CDF range.
+cdf_cache = LRUCache(maxsize=1024)
+
+
 def generate_wfpt_stochastic_class(
-    wiener_params=None, sampling_method="cssm", cdf_range=(-5, 5), sampling_dt=1e-4
+    wiener_params=None, sampling_method="exact", cdf_range=(-5, 5), sampling_dt=1e-4
 ):
     """
     create a wfpt stochastic class by creating a pymc nodes and then adding quantile functions.
@@ -89,8 +95,11 @@ def generate_wfpt_stochastic_class(
     :Arguments:
         wiener_params: dict <default=None>
             dictonary of wiener_params for wfpt likelihoods
-        sampling_method: str <default='cssm'>
-            an argument used by hddm.generate.gen_rts
+        sampling_method: str <default='exact'>
+            'exact' samples first-passage times of the DDM without discretization,
+            'cssm' simulates them with ssms, 'cdf' (inverse CDF on a cached grid,
+            see hddm.wfpt.gen_rts_from_cdf) and 'drift' are passed to
+            hddm.generate.gen_rts
         cdf_range: sequence <default=(-5,5)>
             an argument used by hddm.generate.gen_rts
         sampling_dt: float <default=1e-4>
@@ -163,20 +172,22 @@ def generate_wfpt_stochastic_class(
             "cdf",
             "drift",
             "cssm",
+            "exact",
         ], "Sampling method is invalid!"
 
         if sampling_method == "cdf" or sampling_method == "drift":
-            return hddm.utils.flip_errors(
-                hddm.generate.gen_rts(
-                    method=sampling_method,
-                    size=self.shape,
-                    dt=sampling_dt,
-                    range_=cdf_range,
-                    structured=True,
-                    **self.parents.value
-                )
+            sampled_rts = hddm.generate.gen_rts(
+                method=sampling_method,
+                size=self.shape,
+                dt=sampling_dt,
+                range_=cdf_range,
+                structured=True,
+                **self.parents.value
             )
-        elif sampling_method == "cssm":
+            if keep_negative_responses:
+                sampled_rts = hddm.utils.flip_errors(sampled_rts)
+            return sampled_rts
+        elif sampling_method == "cssm" or sampling_method == "exact":
             keys_tmp = self.parents.value.keys()
             cnt = 0
             theta = np.zeros(len(list(keys_tmp)), dtype=np.float32)
@@ -190,6 +201,7 @@ def generate_wfpt_stochastic_class(
                 model="full_ddm_hddm_base",
                 n_samples=self.shape[0],
                 max_t=20,
+                backend="exact" if sampling_method == "exact" else "ssms",
             )
 
             if add_outliers:
@@ -228,6 +240,16 @@ def generate_wfpt_stochastic_class(
         out = hddm.wfpt.pdf_array(x, **self.parents)
         return out
 
+    # create cdf_vec function, memoized across nodes
+    def cdf_vec(self):
+        params = dict(list(self.parents.value.items()) + list(wp.items()))
+        key = tuple((name, float(params[name])) for name in sorted(params))
+        key += (cdf_range[1],)
+        return cdf_cache.get(
+            key,
+            lambda: hddm.wfpt.gen_cdf_using_pdf(time=cdf_range[1], **params),
+        )
+
     # create cdf function
     def cdf(self, x):
         return hddm.cdfdif.dmat_cdf_array(x, w_outlier=wp["w_outlier"], **self.parents)
@@ -237,11 +259,10 @@ def generate_wfpt_stochastic_class(
 
     # add pdf and cdf_vec to the class
     wfpt.pdf = pdf
-    wfpt.cdf_vec = lambda self: hddm.wfpt.gen_cdf_using_pdf(
-        time=cdf_range[1], **dict(list(self.parents.items()) + list(wp.items()))
-    )
+    wfpt.cdf_vec = cdf_vec
     wfpt.cdf = cdf
     wfpt.random = random
+    wfpt.wiener_params = wp
 
     # add quantiles functions
     add_quantiles_functions_to_pymc_class(wfpt)
@@ -433,5 +454,80 @@ def add_quantiles_functions_to_pymc_class(pymc_class):
     pymc_class.theoretical_quantiles = theoretical_quantiles
 
 
+class QuantileObjective(object):
+    """Chi-square / G^2 objective of many wfpt nodes, evaluated in one call.
+
+    The quantile statistics of the nodes are extracted once into flat arrays,
+    so that each evaluation only gathers the parents' values and calls
+    hddm.cdfdif.quantile_scores.
+
+    :Arguments:
+        obs_nodes : sequence
+            Observed wfpt nodes.
+
+    :Optional:
+        quantiles : sequence
+            The quantiles, e.g. (0.1, 0.3, 0.5, 0.7, 0.9).
+        compute_stats : bool <default=True>
+            Compute the statistics with the nodes' compute_quantiles_stats. If False,
+            they have to be set already (e.g. with set_quantiles_stats).
+    """
+
+    params = ("v", "sv", "a", "z", "sz", "t", "st", "p_outlier")
+
+    def __init__(
+        self, obs_nodes, quantiles=(0.1, 0.3, 0.5, 0.7, 0.9), compute_stats=True
+    ):
+        self.obs_nodes = list(obs_nodes)
+        if compute_stats:
+            for obs in self.obs_nodes:
+                obs.compute_quantiles_stats(quantiles)
+
+        emp_rt = [np.asarray(obs._emp_rt, dtype=np.double) for obs in self.obs_nodes]
+        self.x = np.concatenate(emp_rt)
+        self.offsets = np.concatenate(
+            ([0], np.cumsum([len(rt) for rt in emp_rt]))
+        ).astype(np.intp)
+        self.freq_obs = np.concatenate(
+            [np.asarray(obs._freq_obs, dtype=np.double) for obs in self.obs_nodes]
+        )
+        self.n_samples = np.array(
+            [obs._n_samples for obs in self.obs_nodes], dtype=np.double
+        )
+        self.w_outlier = np.array(
+            [obs.wiener_params["w_outlier"] for obs in self.obs_nodes], dtype=np.double
+        )
+
+    def parameters(self):
+        """Current (v, sv, a, z, sz, t, st, p_outlier, w_outlier) of every node."""
+        values = [obs.parents.value for obs in self.obs_nodes]
+        theta = np.empty((len(values), len(self.params) + 1))
+        theta[:, :-1] = [[value[name] for name in self.params] for value in values]
+        theta[:, -1] = self.w_outlier
+        return theta
+
+    def scores(self, method="chisquare", theta=None):
+        """Per-node statistics, the same as the nodes' chisquare() or gsquare()."""
+        if theta is None:
+            theta = self.parameters()
+        return hddm.cdfdif.quantile_scores(
+            self.x,
+            self.offsets,
+            self.freq_obs,
+            self.n_samples,
+            theta,
+            gsquare=(method == "gsquare"),
+        )
+
+    def __call__(self, method="chisquare", theta=None):
+        """Objective to minimize: the summed chi-square or the negative summed G^2."""
+        if method == "chisquare":
+            return np.sum(self.scores("chisquare", theta))
+        elif method == "gsquare":
+            return -np.sum(self.scores("gsquare", theta))
+        else:
+            raise ValueError("unknown optimzation method")
+
+
 # create default Wfpt class
 Wfpt = generate_wfpt_stochastic_class()
@@ -185,12 +185,7 @@ def make_mlp_likelihood(model=None, model_config=None, wiener_params=None, **kwa
         return "Not yet implemented"
 
     def make_likelihood():
-        likelihood_str = make_likelihood_str_mlp(
-            config=model_config, wiener_params=wiener_params
-        )
-        exec(likelihood_str)
-        my_fun = locals()["custom_likelihood"]
-        return my_fun
+        return make_likelihood_fun_mlp(config=model_config, wiener_params=wiener_params)
 
     # TODO: Allow for rt's of -999 in LAN likelihoods
     def make_likelihood_missing_data():
@@ -229,15 +224,12 @@ def make_mlp_likelihood_rlssm(
     """
 
     def make_likelihood():
-        likelihood_str = make_likelihood_str_mlp_rlssm(
+        return make_likelihood_fun_mlp_rlssm(
             model=model,
             config=model_config,
             config_rl=model_config_rl,
             wiener_params=wiener_params,
         )
-        exec(likelihood_str)
-        my_fun = locals()["custom_likelihood"]
-        return my_fun
 
     likelihood_ = make_likelihood()
 
@@ -283,6 +275,7 @@ def make_mlp_likelihood_reg(
         """
         param_dict = deepcopy(self.parents.value)
         del param_dict["reg_outcomes"]
+        reg_positions = param_dict.pop("reg_positions", None)
 
         param_data = np.zeros(
             (self.value.shape[0], len(model_config["params"])), dtype=np.float32
@@ -291,20 +284,19 @@ def make_mlp_likelihood_reg(
         cnt = 0
         for tmp_str in model_config["params"]:
             if tmp_str in self.parents["reg_outcomes"]:
-                # param_data[:, cnt] = param_dict[tmp_str].values
-                param_data[:, cnt] = param_dict[tmp_str].loc[self.value.index].values
+                param_data[:, cnt] = hddm.utils.align_reg_outcome(
+                    param_dict[tmp_str], reg_positions, tmp_str, self.value.index
+                )
 
                 for linked_indirect_regressor in param_links[tmp_str]:
-                    # param_data[:, cnt] = (
-                    #     param_data[:, cnt]
-                    #     + param_dict[linked_indirect_regressor].values
-                    # )
-
                     param_data[:, cnt] = (
                         param_data[:, cnt]
-                        + param_dict[linked_indirect_regressor]
-                        .loc[self.value.index]
-                        .values
+                        + hddm.utils.align_reg_outcome(
+                            param_dict[linked_indirect_regressor],
+                            reg_positions,
+                            linked_indirect_regressor,
+                            self.value.index,
+                        )
                     )
 
                 for linked_indirect_beta in param_links_betas[tmp_str]:
@@ -351,22 +343,18 @@ def make_mlp_likelihood_reg(
 
     def make_likelihood():
         if indirect_betas_present or indirect_regressors_present:
-            likelihood_str = make_reg_likelihood_str_mlp(
+            return make_reg_likelihood_fun_mlp(
                 config=model_config,
                 wiener_params=wiener_params,
                 param_links=param_links,
                 param_links_betas=param_links_betas,
             )
         else:
-            likelihood_str = make_reg_likelihood_str_mlp_basic(
+            return make_reg_likelihood_fun_mlp(
                 config=model_config,
                 wiener_params=wiener_params,
             )
 
-        exec(likelihood_str)
-        my_fun = locals()["custom_likelihood_reg"]
-        return my_fun
-
     # TODO: Allow for missing data in LAN likelihoods
     def make_likelihood_missing_data():
         return
@@ -413,17 +401,13 @@ def make_mlp_likelihood_reg_nn_rl(
                 "Indirect regressors are not yet implemented for RLSSM models."
             )
         else:
-            likelihood_str = make_reg_likelihood_str_mlp_basic_nn_rl(
+            return make_reg_likelihood_fun_mlp_basic_nn_rl(
                 model=model,
                 config=model_config,
                 config_rl=model_config_rl,
                 wiener_params=wiener_params,
             )
 
-        exec(likelihood_str)
-        my_fun = locals()["custom_likelihood_reg"]
-        return my_fun
-
     param_links, indirect_regressors_present = __prepare_indirect_regressors(
         model_config=model_config
     )
@@ -10,6 +10,8 @@
 """
 
 # AF - New:
+import os
+import time
 import warnings
 from copy import deepcopy
 from hddm.simulators import *
@@ -17,7 +19,9 @@ from hddm.model_config import model_config
 
 
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
+import cloudpickle
 import numpy as np
 import pymc as pm
 import pandas as pd
@@ -26,7 +30,12 @@ import hddm
 import kabuki
 import inspect
 
+from hddm import columnar
+from hddm.online_stats import OnlineStats
+from hddm.telemetry import SamplingTelemetry
+
 from kabuki.hierarchical import Knode
+from kabuki.utils import flatten
 from scipy.optimize import fmin_powell, fmin
 
 # AF-TODO: This should be changed to use
@@ -39,7 +48,121 @@ except ImportError:
     pass
 
 
+def _optimize_subject_model(model, method, quantiles, n_runs, seed):
+    """Fit a single subject model, used by AccumulatorModel.optimize_subjects."""
+    np.random.seed(seed)
+    results, _ = model._optimization_single(
+        method=method, quantiles=quantiles, n_runs=n_runs, compute_stats=True
+    )
+    return results
+
+
+def _positions_to_slice(positions):
+    """Return contiguous integer positions as a slice, so that indexing with
+    them is a view, otherwise the positions themselves."""
+    if positions.shape[0] > 0 and np.array_equal(
+        positions, np.arange(positions[0], positions[0] + positions.shape[0])
+    ):
+        return slice(positions[0], positions[0] + positions.shape[0])
+    return positions
+
+
+def _group_positions(data, depends):
+    """Integer positions of the rows of every group of data grouped by depends,
+    keyed by the tuple of group values in the order of data.groupby(depends)."""
+    if len(depends) == 0:
+        return OrderedDict([((), np.arange(len(data)))])
+    groups = OrderedDict()
+    for key, positions in data.groupby(list(depends)).indices.items():
+        if not isinstance(key, tuple):
+            key = (key,)
+        groups[key] = positions
+    return groups
+
+
+def _create_knode(knode, groups, group_data):
+    """Create the pymc nodes of a knode, like kabuki's Knode.create().
+
+    groups maps the group values to the integer positions of their rows and
+    group_data caches the data of each group, shared between the knodes with
+    the same depends. Observed values are selected from one column subset of
+    the data (a view for contiguous groups) and the node database is built
+    in one go instead of row by row.
+    """
+    knode.init_nodes_db()
+    if knode.observed:
+        observed_data = knode.data[knode.col_name]
+        if not knode.pass_dataframe:
+            observed_data = observed_data.values
+
+    names = []
+    rows = []
+    for uniq_elem, positions in groups.items():
+        rows_slice = _positions_to_slice(positions)
+        if uniq_elem not in group_data:
+            group_data[uniq_elem] = knode.data.iloc[rows_slice]
+
+        kwargs = knode.kwargs.copy()
+        for name, parent in knode.parents.items():
+            kwargs[name] = parent.get_node(knode.depends, uniq_elem)
+
+        # Same coercion as kabuki (e.g. integer subj_idx next to a float column)
+        tag, subj_idx = knode.create_tag_and_subj_idx(knode.depends, uniq_elem)
+        node_name = knode.create_node_name(tag, subj_idx=subj_idx)
+
+        if knode.observed:
+            if knode.pass_dataframe:
+                kwargs["value"] = observed_data.iloc[rows_slice]
+            else:
+                kwargs["value"] = observed_data[rows_slice]
+
+        # Deterministic nodes take their parents as a dict (see Knode.create)
+        if knode.pymc_node is pm.Deterministic:
+            parents_dict = {}
+            for name, parent in knode.parents.items():
+                parents_dict[name] = kwargs.pop(name)
+            kwargs["parents"] = parents_dict
+            if knode.observed:
+                kwargs["parents"]["value"] = kwargs["value"]
+            if "doc" not in kwargs:
+                kwargs["doc"] = node_name
+
+        node = knode.create_node(node_name, kwargs, group_data[uniq_elem])
+        if node is None:
+            continue
+        knode.nodes[uniq_elem] = node
+
+        row = {
+            "knode_name": knode.name,
+            "observed": knode.observed,
+            "stochastic": isinstance(node, pm.Stochastic) and not knode.observed,
+            "subj": knode.subj,
+            "node": node,
+            "tag": tag,
+            "depends": knode.depends,
+            "hidden": knode.hidden,
+        }
+        row.update(zip(knode.depends, uniq_elem))
+        names.append(node.__name__)
+        rows.append(row)
+
+    knode.nodes_db = pd.DataFrame(
+        rows, index=names, columns=knode.nodes_db.columns, dtype=object
+    )
+
+
 class AccumulatorModel(kabuki.Hierarchical):
+    def __new__(cls, *args, **kwargs):
+        self = super(AccumulatorModel, cls).__new__(cls)
+        # Constructor arguments of the instantiated class, used by save_skeleton()
+        kwargs = dict(kwargs)
+        if args:
+            self._init_data, args = args[0], args[1:]
+        else:
+            self._init_data = kwargs.pop("data", None)
+        self._init_spec = {"args": args, "kwargs": kwargs}
+        return self
+
     def __init__(self, data, **kwargs):
         # Flip sign for lower boundary RTs
         if self.nn:
@@ -71,11 +194,289 @@ class AccumulatorModel(kabuki.Hierarchical):
                 print("Set model to ddm")
 
         self.std_depends = kwargs.pop("std_depends", False)
+        self.online_stats = None
+        self.telemetry = None
         super(AccumulatorModel, self).__init__(data, **kwargs)
 
-    def _create_an_average_model(self):
+    def _create_an_average_model(self, data=None):
         raise NotImplementedError("This method has to be overloaded. See HDDMBase.")
 
+    def create_model(self, max_retries=8):
+        """Create the pymc nodes of all knodes.
+
+        Same as kabuki's Hierarchical.create_model(), but the data are grouped
+        once per distinct set of depends columns into integer positions that
+        all knodes share, see _create_knode(). The time spent on every knode
+        is kept for construction_report().
+
+        :Arguments:
+            max_retries : int
+                How often to retry when model creation
+                failed (due to bad starting values).
+        """
+
+        def _create():
+            self._construction_times = []
+            groups = {}
+            group_data = {}
+            for knode in self.knodes:
+                i_t = time.time()
+                depends = tuple(knode.depends)
+                if depends not in groups:
+                    groups[depends] = _group_positions(self.data, depends)
+                    group_data[depends] = {}
+                _create_knode(knode, groups[depends], group_data[depends])
+                self._construction_times.append(
+                    (knode.name, len(knode.nodes), time.time() - i_t)
+                )
+
+        for tries in range(max_retries):
+            try:
+                _create()
+            except (pm.ZeroProbability, ValueError):
+                continue
+            break
+        else:
+            print("After %f retries, still no good fit found." % (tries))
+            _create()
+
+        # create node container
+        i_t = time.time()
+        self.create_nodes_db()
+        self._construction_times.append(("nodes_db", 0, time.time() - i_t))
+
+        # Check whether all user specified column names (via depends_on) where used by the depends_on.
+        assert set(flatten(list(self.depends.values()))).issubset(
+            set(flatten(self.nodes_db.depends))
+        ), "One of the column names specified via depends_on was not picked up. Check whether you specified the correct parameter value."
+
+    def construction_report(self):
+        """Time spent on creating the nodes of each knode when the model was
+        built, slowest first.
+
+        :Returns:
+            pandas.DataFrame with the columns knode, nodes (the number of pymc
+            nodes) and seconds.
+        """
+        report = pd.DataFrame(
+            getattr(self, "_construction_times", []),
+            columns=["knode", "nodes", "seconds"],
+        )
+        return report.sort_values("seconds", ascending=False).reset_index(drop=True)
+
+    def __getstate__(self):
+        d = super(AccumulatorModel, self).__getstate__()
+        # The data are saved as self.data already
+        d.pop("_init_data", None)
+        return d
+
+    def __setstate__(self, d):
+        # Same as kabuki's Hierarchical.__setstate__(), which builds the model twice
+        self.__dict__.update(d)
+        self._setup_model()
+
+        # backwards compat
+        if not hasattr(self, "sampled"):
+            self.sampled = True
+
+        if self.sampled:
+            self.load_db(d["dbname"], db=d["db"])
+            self.gen_stats()
+        else:
+            self.mcmc()
+
+    def mcmc(self, *args, **kwargs):
+        """Returns pymc.MCMC object of model, see kabuki's Hierarchical.mcmc().
+
+        Besides the pymc backends, db='columnar' stores the traces in the
+        directory dbname with hddm.columnar.Database.
+
+        If the model was loaded with warm_start=True, the step methods continue
+        with the tuning state (e.g. proposal sds) they had when it was saved.
+        """
+        if kwargs.get("db", None) == "columnar":
+            dbname = kwargs.pop("dbname", None)
+            if dbname is None:
+                dbname = "MCMC.columnar"
+            kwargs["db"] = columnar.Database(dbname)
+
+        mc = super(AccumulatorModel, self).mcmc(*args, **kwargs)
+
+        step_method_states = getattr(self, "_step_method_states", None)
+        if step_method_states:
+            mc.assign_step_methods()
+            for step_method in mc.step_methods:
+                if step_method._id in step_method_states:
+                    step_method.__dict__.update(step_method_states[step_method._id])
+            self._step_method_states = None
+
+        return mc
+
+    def load_db(self, dbname, verbose=0, db="sqlite"):
+        """Load samples from a database created by an earlier model
+        run, see kabuki's Hierarchical.load_db(). In addition to the pymc
+        backends, db can be 'columnar' (see hddm.columnar).
+        """
+        self.online_stats = None
+        if db != "columnar":
+            return super(AccumulatorModel, self).load_db(
+                dbname, verbose=verbose, db=db
+            )
+
+        self.mc = pm.MCMC(self.nodes_db.node, db=columnar.load(dbname), verbose=verbose)
+        self.mc.restore_sampler_state()
+        return self
+
+    def sample(self, *args, **kwargs):
+        """Sample from posterior, see kabuki's Hierarchical.sample().
+
+        :Optional:
+            online_stats : bool <default=False>
+                Summarize the samples of every scalar, unobserved node while
+                sampling (see hddm.online_stats). The running summary is
+                available as model.online_stats.summary() during and after
+                sampling, and gen_stats() / print_stats() use it instead of
+                reading the traces. The quantiles are approximate and 'mc err'
+                is not computed.
+            telemetry : bool <default=False>
+                Record how often the likelihood (or value) of every node is
+                computed and how long it takes, and the steps, time and
+                counters of every step method (see hddm.telemetry). Available
+                as model.telemetry, e.g. model.telemetry.node_report().
+            telemetry_log : str <default=None>
+                File to which a JSON snapshot of the telemetry is appended
+                every telemetry_interval seconds while sampling.
+            telemetry_interval : float <default=10>
+                Seconds between two snapshots in telemetry_log.
+        """
+        online_stats = kwargs.pop("online_stats", False)
+        telemetry = kwargs.pop("telemetry", False)
+        telemetry_log = kwargs.pop("telemetry_log", None)
+        telemetry_interval = kwargs.pop("telemetry_interval", 10.0)
+        self.online_stats = None
+        self.telemetry = None
+        if not (online_stats or telemetry):
+            return super(AccumulatorModel, self).sample(*args, **kwargs)
+
+        if self.mc is None:
+            self.mcmc(db=kwargs.pop("db", "ram"), dbname=kwargs.pop("dbname", None))
+
+        if online_stats:
+            nodes = [
+                node
+                for node in self.nodes_db.loc[
+                    self.nodes_db["observed"] == False, "node"
+                ]
+                if np.ndim(node.value) == 0
+            ]
+            self.online_stats = OnlineStats([node.__name__ for node in nodes])
+
+            # pymc.MCMC calls tally() for every sample that is kept
+            tally = self.mc.tally
+
+            def tally_online():
+                tally()
+                self.online_stats.tally([node.value for node in nodes])
+
+            self.mc.tally = tally_online
+
+        if telemetry:
+            self.telemetry = SamplingTelemetry(
+                self, log_fname=telemetry_log, log_interval=telemetry_interval
+            )
+            self.telemetry.start()
+
+        try:
+            return super(AccumulatorModel, self).sample(*args, **kwargs)
+        finally:
+            if online_stats:
+                del self.mc.tally
+                self.online_stats.flush()
+            if telemetry:
+                self.telemetry.stop()
+
+    def append_stats_to_nodes_db(self, *args, **kwargs):
+        """Add the posterior summaries of the nodes to nodes_db, see kabuki's
+        Hierarchical.append_stats_to_nodes_db(). Uses the running summaries if
+        the model was sampled with online_stats=True.
+        """
+        online_stats = getattr(self, "online_stats", None)
+        if online_stats is None or args or kwargs:
+            return super(AccumulatorModel, self).append_stats_to_nodes_db(
+                *args, **kwargs
+            )
+
+        stats = online_stats.summary()
+        stats = stats[~self.nodes_db.loc[stats.index, "hidden"].astype(bool)]
+        for column in stats.columns:
+            self.nodes_db.loc[stats.index, column] = stats[column]
+        self.nodes_db.loc[stats.index, "mc err"] = np.nan
+
+    def get_step_method_states(self):
+        """Tuning state of the step methods of the current sampler, keyed by
+        the step method id (e.g. 'Metropolis_v' or 'SliceStep_a')."""
+        if self.mc is None:
+            return {}
+
+        states = {}
+        for step_method in self.mc.step_methods:
+            state = step_method.current_state()
+            for attr in ("width", "adaptive_scale_factor", "proposal_sd"):
+                if hasattr(step_method, attr):
+                    state[attr] = getattr(step_method, attr)
+            states[step_method._id] = state
+        return states
+
+    def save_skeleton(self, fname, data_fname=None):
+        """Save the model in a compact form: the constructor arguments, the
+        data (or the name of a csv file holding them), the current node values
+        and the tuning state of the step methods. Traces are not saved.
+
+        The model is rebuilt by hddm.load(fname), with warm_start=True the
+        sampler continues from the saved node values and tuning state, so that
+        no new burn-in is needed.
+
+        :Arguments:
+            fname : str
+                File name to save to.
+
+        :Optional:
+            data_fname : str
+                csv file holding the data passed to the constructor. The file
+                is only referenced by the skeleton. If it does not exist yet,
+                the data are written to it. If None, the data are saved with
+                the skeleton.
+        """
+        data = self._init_data
+        if data_fname is not None:
+            if not os.path.exists(data_fname):
+                if data is None:
+                    raise ValueError("%s does not exist." % data_fname)
+                pd.DataFrame(data).to_csv(data_fname, index=False)
+            data = None
+        elif data is None:
+            raise ValueError(
+                "The data of this model were not kept when it was loaded, "
+                "pass data_fname."
+            )
+
+        skeleton = {
+            "hddm_skeleton": 1,
+            "model_class": self.__class__,
+            "args": self._init_spec["args"],
+            "kwargs": self._init_spec["kwargs"],
+            "data": data,
+            "data_fname": data_fname,
+            "values": OrderedDict(
+                (name, np.copy(node["node"].value))
+                for name, node in self.iter_stochastics()
+            ),
+            "step_methods": self.get_step_method_states(),
+            "slice_widths": getattr(self, "slice_widths", None),
+        }
+        with open(fname, "wb") as f:
+            cloudpickle.dump(skeleton, f)
+
     def _quantiles_optimization(
         self, method, quantiles=(0.1, 0.3, 0.5, 0.7, 0.9), n_runs=3
     ):
@@ -253,6 +654,59 @@ class AccumulatorModel(kabuki.Hierarchical):
         self.bootstrap_stats = stats.sort_index()
         return results
 
+    def optimize_subjects(
+        self,
+        method="chisquare",
+        quantiles=(0.1, 0.3, 0.5, 0.7, 0.9),
+        n_runs=3,
+        n_jobs=1,
+    ):
+        """
+        Optimize every subject of a group model separately.
+
+        :Input:
+            method : str <default='chisquare'>
+                Optimization method ('ML', 'chisquare' or 'gsquare').
+
+            quantiles : tuple
+                A sequence of quantiles to be used for chi^2 and G^2.
+
+            n_runs : int <default=3>
+                Number of attempts to optimize each subject.
+
+            n_jobs : int <default=1>
+                Number of processes fitting subjects in parallel.
+
+        :Output:
+            results <DataFrame> - the parameter values of each subject (rows indexed by subj_idx).
+        """
+        if not self.is_group_model:
+            raise TypeError("optimize_subjects is only defined for group models")
+
+        subj_idx = np.unique(self.data["subj_idx"])
+        models = [
+            self._create_an_average_model(
+                data=self.data[self.data["subj_idx"] == subj]
+            )
+            for subj in subj_idx
+        ]
+        seeds = np.random.randint(2**31 - 1, size=len(models))
+        args = (
+            models,
+            [method] * len(models),
+            [quantiles] * len(models),
+            [n_runs] * len(models),
+            seeds,
+        )
+
+        if n_jobs == 1:
+            results = list(map(_optimize_subject_model, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(_optimize_subject_model, *args))
+
+        return pd.DataFrame(results, index=pd.Index(subj_idx, name="subj_idx"))
+
     def _run_optimization(self, method, quantiles, n_runs):
         """function used by optimize."""
 
@@ -304,24 +758,16 @@ class AccumulatorModel(kabuki.Hierarchical):
                 except pm.ZeroProbability:
                     return np.inf
 
-        # chi^2 method
-        elif method == "chisquare":
-
-            def objective(values):
-                for i, value in enumerate(values):
-                    parents[i].value = value
-                score = sum([obs.chisquare() for obs in obs_nodes])
-                if score < 0:
-                    kabuki.debug_here()
-                return score
-
-        # G^2 method
-        elif method == "gsquare":
+        # chi^2 and G^2 methods, all observed nodes in one compiled call
+        elif method in ("chisquare", "gsquare"):
+            quantile_objective = hddm.likelihoods.QuantileObjective(
+                obs_nodes, quantiles, compute_stats=False
+            )
 
             def objective(values):
                 for i, value in enumerate(values):
                     parents[i].value = value
-                return -sum([obs.gsquare() for obs in obs_nodes])
+                return quantile_objective(method)
 
         else:
             raise ValueError("unknown optimzation method")
@@ -1271,6 +1717,7 @@ class HDDMBase(AccumulatorModel):
         self.default_intervars = kwargs.pop(
             "default_intervars", {"sz": 0, "st": 0, "sv": 0}
         )
+        self.sampling_method = kwargs.pop("sampling_method", "exact")
 
         self._kwargs = kwargs
         # Check if self has model attribute
@@ -1384,9 +1831,8 @@ class HDDMBase(AccumulatorModel):
         self.cdf_range = (-cdf_bound, cdf_bound)
 
         # set wfpt class
-        # AF-TODO: Add argument to allow changing sampling_method (mostly to test cssm vs. cdf)
         self.wfpt_class = hddm.likelihoods.generate_wfpt_stochastic_class(
-            wp, cdf_range=self.cdf_range
+            wp, sampling_method=self.sampling_method, cdf_range=self.cdf_range
         )
 
         super(HDDMBase, self).__init__(data, **kwargs)
@@ -1398,7 +1844,9 @@ class HDDMBase(AccumulatorModel):
 
     def __setstate__(self, d):
         self.wfpt_class = hddm.likelihoods.generate_wfpt_stochastic_class(
-            d["wiener_params"], cdf_range=d["cdf_range"]
+            d["wiener_params"],
+            sampling_method=d.get("sampling_method", "exact"),
+            cdf_range=d["cdf_range"],
         )
         super(HDDMBase, self).__setstate__(d)
 
@@ -1542,13 +1990,14 @@ class HDDMBase(AccumulatorModel):
         """
         hddm.utils.plot_posterior_quantiles(self, *args, **kwargs)
 
-    def _create_an_average_model(self):
+    def _create_an_average_model(self, data=None):
         """
         create an average model for group model quantiles optimization.
 
         The function return an instance of the model that was initialize with the same parameters as the
         original model but with the is_group_model argument set to False.
         since it depends on the specifics of the class it should be implemented by the user for each new class.
+        If data is given (e.g. the data of a single subject), the model is created for it instead of self.data.
         """
 
         # this code only check that the arguments are as expected, i.e. the constructor was not change
@@ -1563,7 +2012,7 @@ class HDDMBase(AccumulatorModel):
 
         # create the avg model
         avg_model = self.__class__(
-            self.data,
+            self.data if data is None else data,
             include=self.include,
             is_group_model=False,
             p_outlier=self.p_outlier,
@@ -96,6 +96,11 @@ class HDDM(HDDMBase):
              * use_adaptive: Whether to use adaptive numerical integration <default=True>
              * simps_err: Error bound for Simpson integration <default=1e-3>
 
+        sampling_method : str <default='exact'>
+             How posterior predictive data is sampled from the wfpt node.
+             'exact' or 'cdf' (inverse CDF on a cached grid), see
+             hddm.likelihoods.generate_wfpt_stochastic_class.
+
     :Example:
         >>> data, params = hddm.generate.gen_rand_data() # gen data
         >>> model = hddm.HDDM(data) # create object
@@ -557,7 +562,7 @@ class HDDM(HDDMBase):
                     maxiter=5000,
                 )
 
-    def _create_an_average_model(self):
+    def _create_an_average_model(self, data=None):
         """
         create an average model for group model quantiles optimization.
         """
@@ -575,6 +580,9 @@ class HDDM(HDDMBase):
 
         # create the avg model
         avg_model = self.__class__(
-            self.data, include=self.include, is_group_model=False, **self._kwargs
+            self.data if data is None else data,
+            include=self.include,
+            is_group_model=False,
+            **self._kwargs
         )
         return avg_model
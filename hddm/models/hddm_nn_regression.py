@@ -1,7 +1,7 @@
 import hddm
 from hddm.models import HDDMRegressor
 from copy import deepcopy
-from kabuki import Knode
+from hddm.models.hddm_regression import KnodeRegressObserved
 
 try:
     from hddm.torch.mlp_inference_class import load_torch_mlp
@@ -153,7 +153,7 @@ class HDDMnnRegressor(HDDMRegressor):
     def _create_wfpt_knode(self, knodes):
         wfpt_parents = self._create_wfpt_parents_dict(knodes)
 
-        return Knode(
+        return KnodeRegressObserved(
             self.wfpt_nn_reg_class,
             "wfpt",
             observed=True,
@@ -7,6 +7,7 @@ from patsy import dmatrix
 
 import hddm
 from hddm.models import HDDM
+from hddm.models.base import _positions_to_slice
 import kabuki
 from kabuki import Knode
 from kabuki.utils import stochastic_from_dist
@@ -40,11 +41,15 @@ def generate_wfpt_reg_stochastic_class(
         }
     wp = wiener_params
 
-    def wiener_multi_like(value, v, sv, a, z, sz, t, st, reg_outcomes, p_outlier=0.05):
+    def wiener_multi_like(
+        value, v, sv, a, z, sz, t, st, reg_outcomes, reg_positions=None, p_outlier=0.05
+    ):
         """Log-likelihood for the full DDM using the interpolation method"""
         params = {"v": v, "sv": sv, "a": a, "z": z, "sz": sz, "t": t, "st": st}
         for reg_outcome in reg_outcomes:
-            params[reg_outcome] = params[reg_outcome].loc[value["rt"].index].values
+            params[reg_outcome] = hddm.utils.align_reg_outcome(
+                params[reg_outcome], reg_positions, reg_outcome, value.index
+            )
         return hddm.wfpt.wiener_like_multi(
             value["rt"].values,
             params["v"],
@@ -66,27 +71,35 @@ def generate_wfpt_reg_stochastic_class(
         add_model_parameters=False,
         keep_subj_idx=False,
     ):
-        assert sampling_method in ["drift", "cssm"], "Sampling method is invalid!"
+        assert sampling_method in [
+            "drift",
+            "cssm",
+            "exact",
+        ], "Sampling method is invalid!"
         # AF add: exchange this with new simulator
         param_dict = deepcopy(self.parents.value)
         del param_dict["reg_outcomes"]
+        reg_positions = param_dict.pop("reg_positions", None)
+        reg_params = {
+            p: hddm.utils.align_reg_outcome(
+                self.parents.value[p], reg_positions, p, self.value.index
+            )
+            for p in self.parents["reg_outcomes"]
+        }
         sampled_rts = self.value.copy()
 
         if sampling_method == "drift":
-            for i in self.value.index:
-                # get current params
-                for p in self.parents["reg_outcomes"]:
-                    param_dict[p] = np.asscalar(self.parents.value[p].loc[i])
-                # sample
-                samples = hddm.generate.gen_rts(
-                    method=sampling_method, size=1, dt=sampling_dt, **param_dict
-                )
-
-                sampled_rts.loc[i, "rt"] = hddm.utils.flip_errors(samples).rt.iloc[0]
+            # One vectorized simulation over the trial-wise parameters
+            param_dict.update(reg_params)
+            sampled_rts["rt"] = hddm.generate._simulate_drift_process(
+                *[param_dict[p] for p in ("v", "sv", "a", "z", "sz", "t", "st")],
+                size=self.value.shape[0],
+                dt=sampling_dt
+            )
 
             return sampled_rts
 
-        if sampling_method == "cssm":
+        if sampling_method == "cssm" or sampling_method == "exact":
             param_data = np.zeros(
                 (
                     self.value.shape[0],
@@ -97,17 +110,17 @@ def generate_wfpt_reg_stochastic_class(
             cnt = 0
             for tmp_str in model_config["full_ddm_hddm_base"]["params"]:
                 if tmp_str in self.parents["reg_outcomes"]:
-                    # NOTE: Need to use .loc here to subset the regression parameters
-                    # to account for eventual grouping
-                    param_data[:, cnt] = (
-                        param_dict[tmp_str].loc[self.value.index].values
-                    )
+                    param_data[:, cnt] = reg_params[tmp_str]
                 else:
                     param_data[:, cnt] = param_dict[tmp_str]
                 cnt += 1
 
             sim_out = simulator(
-                theta=param_data, model="full_ddm_hddm_base", n_samples=1, max_t=20
+                theta=param_data,
+                model="full_ddm_hddm_base",
+                n_samples=1,
+                max_t=20,
+                backend="exact" if sampling_method == "exact" else "ssms",
             )
 
             sim_out_proc = hddm_preprocess(
@@ -127,7 +140,7 @@ def generate_wfpt_reg_stochastic_class(
     return stoch
 
 
-wfpt_reg_like = generate_wfpt_reg_stochastic_class(sampling_method="cssm")  # "drift"
+wfpt_reg_like = generate_wfpt_reg_stochastic_class(sampling_method="exact")  # "cssm"
 
 ################################################################################################
 
@@ -140,6 +153,33 @@ class KnodeRegress(kabuki.hierarchical.Knode):
         # Initialize kabuki.hierarchical.Knode
         super(KnodeRegress, self).__init__(*args, **kwargs)
 
+    def set_data(self, data):
+        super(KnodeRegress, self).set_data(data)
+        # Design matrix of the full data, built by the first create_node call
+        self._design_matrix = None
+
+    def _get_design_matrix(self, model):
+        """Design matrix of the full data, shared by all nodes of this knode.
+
+        The rows are stored in the order in which create() groups the data, so
+        that the rows of every node are a contiguous block of one array.
+        """
+        if getattr(self, "_design_matrix", None) is None:
+            design_matrix = dmatrix(
+                model, data=self.data, return_type="dataframe", NA_action="raise"
+            )
+            if len(self.depends) == 0:
+                order = np.arange(len(self.data))
+            else:
+                order = np.concatenate(
+                    list(self.data.groupby(self.depends).indices.values())
+                )
+            self._design_matrix = (
+                np.ascontiguousarray(design_matrix.values[order], dtype=np.float64),
+                design_matrix.index[order],
+            )
+        return self._design_matrix
+
     def create_node(self, name, kwargs, data):
         reg = kwargs["regressor"]
 
@@ -152,35 +192,64 @@ class KnodeRegress(kabuki.hierarchical.Knode):
 
         parents = {"args": args}
 
+        # Rows of this node in the shared design matrix (a view if contiguous)
+        full_design_matrix, design_index = self._get_design_matrix(reg["model"])
+        positions = design_index.get_indexer(data.index)
+        design_matrix = full_design_matrix[_positions_to_slice(positions)]
+
+        if design_matrix.shape[1] != len(args):
+            raise NotImplementedError(
+                "Missing columns in design matrix. You need data for all conditions for all subjects."
+            )
+
         def func(
             args,
-            design_matrix=dmatrix(
-                reg["model"],
-                data=self.data,  # Note: data is hardcoded here
-                return_type="dataframe",
-                NA_action="raise",
-            ),
+            design_matrix=design_matrix,
             link_func=reg["link_func"],
-            # knode_data=data, AF-NOTE: I think this can be dropped
+            index=data.index,
         ):
-            # Convert parents to matrix
-            params = np.matrix(args)
-            design_matrix = design_matrix.loc[data.index]
-
-            # Apply design matrix to input data
-            if design_matrix.shape[1] != params.shape[1]:
-                raise NotImplementedError(
-                    "Missing columns in design matrix. You need data for all conditions for all subjects."
-                )
-
             # predictor is the final regression outcome --> our parameter of interest
-            predictor = link_func(design_matrix.dot(params.T)[0])
+            predictor = design_matrix.dot(np.asarray(args, dtype=np.float64))
+            if link_func is not id_link:
+                # Link functions receive a pandas.Series (they may look up covariates by index)
+                predictor = np.asarray(link_func(pd.Series(predictor, index=index)))
             return predictor
 
         # Build pymc node based on the information provided
-        return self.pymc_node(
+        node = self.pymc_node(
             func, kwargs["doc"], name, parents=parents, trace=self.keep_regressor_trace
         )
+        # Rows of the data the (array valued) regression outcome refers to
+        node.reg_index = data.index
+        return node
+
+
+class KnodeRegressObserved(Knode):
+    """Observed knode of regression models.
+
+    Computes, once at build time, the integer positions linking the output of
+    each regressor deterministic to the rows of the observed node and passes
+    them to the likelihood as the reg_positions parent. Contiguous positions
+    are passed as a slice, so that alignment is a view.
+    """
+
+    def create_node(self, node_name, kwargs, data):
+        reg_positions = {}
+        for reg_outcome in kwargs["reg_outcomes"]:
+            reg_node = kwargs.get(reg_outcome)
+            if not hasattr(reg_node, "reg_index"):
+                continue
+
+            positions = reg_node.reg_index.get_indexer(data.index)
+            if np.any(positions < 0):
+                raise ValueError(
+                    "Regression outcome %s is not defined for all trials of %s."
+                    % (reg_outcome, node_name)
+                )
+            reg_positions[reg_outcome] = _positions_to_slice(positions)
+
+        kwargs["reg_positions"] = reg_positions
+        return super(KnodeRegressObserved, self).create_node(node_name, kwargs, data)
 
 
 class HDDMRegressor(HDDM):
@@ -305,7 +374,7 @@ class HDDMRegressor(HDDM):
                     )
             else:
                 model_str = model
-                link_func = lambda x: x
+                link_func = id_link
 
             # Find separator
             separator = model_str.find("~")
@@ -338,7 +407,7 @@ class HDDMRegressor(HDDM):
 
     def _create_wfpt_knode(self, knodes):
         wfpt_parents = self._create_wfpt_parents_dict(knodes)
-        return Knode(
+        return KnodeRegressObserved(
             self.wfpt_reg_class,
             "wfpt",
             observed=True,
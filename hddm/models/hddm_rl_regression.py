@@ -118,7 +118,7 @@ class KnodeRegress(kabuki.hierarchical.Knode):
 
         def func(
             args,
-            design_matrix=dmatrix(reg["model"], data=data),
+            design_matrix=dm,
             link_func=reg["link_func"],
         ):
             # convert parents to matrix
@@ -66,7 +66,7 @@ class HDDMTransformed(HDDMBase):
 
         return knodes
 
-    def _create_an_average_model(self):
+    def _create_an_average_model(self, data=None):
         """
         create an average model for group model quantiles optimization.
         """
@@ -82,6 +82,9 @@ class HDDMTransformed(HDDMBase):
 
         # create the avg model
         avg_model = self.__class__(
-            self.data, include=self.include, is_group_model=False, **self._kwargs
+            self.data if data is None else data,
+            include=self.include,
+            is_group_model=False,
+            **self._kwargs
         )
         return avg_model
@@ -0,0 +1,197 @@
+"""
+Streaming posterior summaries, used by model.sample(online_stats=True).
+
+Samples are collected in a small buffer and folded into running
+summaries block by block: Welford/Chan updates for mean and variance and a
+merging t-digest for quantiles. Neither needs the traces, so the summaries
+are available while sampling and cost O(nodes) memory however long the
+chain is. All summaries can be merged, e.g. to combine chains.
+"""
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["RunningMoments", "QuantileSketch", "OnlineStats"]
+
+
+class RunningMoments(object):
+    """Running mean and variance of vectors of values.
+
+    :Arguments:
+        size : int
+            Number of values in each sample.
+    """
+
+    def __init__(self, size):
+        self.n = 0
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+
+    def update(self, x):
+        """Add a block of samples (array of shape (n_samples, size))."""
+        x = np.asarray(x, dtype=np.float64)
+        if x.shape[0] == 0:
+            return
+        block = RunningMoments(x.shape[1])
+        block.n = x.shape[0]
+        block.mean = x.mean(axis=0)
+        block.m2 = ((x - block.mean) ** 2).sum(axis=0)
+        self.merge(block)
+
+    def merge(self, other):
+        """Add the samples summarized by another RunningMoments."""
+        n = self.n + other.n
+        if n == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.n / n
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.n * other.n / n
+        self.n = n
+
+    @property
+    def var(self):
+        """Variance of the samples (ddof=0, as in pymc's stats())."""
+        if self.n == 0:
+            return np.full(self.mean.shape, np.nan)
+        return self.m2 / self.n
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+
+class QuantileSketch(object):
+    """Mergeable quantile sketch of a scalar value (merging t-digest).
+
+    The values are summarized by at most about compression / 2 centroids,
+    which are small in the tails and large around the median, so extreme
+    quantiles stay accurate.
+
+    :Arguments:
+        compression : int <default=200>
+            Larger values give more centroids and more accurate quantiles.
+    """
+
+    def __init__(self, compression=200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def n(self):
+        return self.weights.sum()
+
+    def update(self, x):
+        """Add a block of values (1d array)."""
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if x.shape[0] == 0:
+            return
+        self.min = min(self.min, x.min())
+        self.max = max(self.max, x.max())
+        self._compress(
+            np.concatenate([self.means, x]),
+            np.concatenate([self.weights, np.ones(x.shape[0])]),
+        )
+
+    def merge(self, other):
+        """Add the values summarized by another QuantileSketch."""
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+
+    def _compress(self, means, weights):
+        if means.shape[0] == 0:
+            return
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # Centre of each centroid on the quantile scale, mapped to the k1 scale
+        # of the t-digest. Centroids within one unit of k are merged.
+        q = (np.cumsum(weights) - weights / 2.0) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        _, bins = np.unique(np.floor(k), return_inverse=True)
+        self.weights = np.bincount(bins, weights=weights)
+        self.means = np.bincount(bins, weights=means * weights) / self.weights
+
+    def quantile(self, q):
+        """Estimate the quantiles q (floats in [0, 1])."""
+        q = np.asarray(q, dtype=np.float64)
+        if self.weights.shape[0] == 0:
+            return np.full(q.shape, np.nan)
+        total = self.weights.sum()
+        centres = np.cumsum(self.weights) - self.weights / 2.0
+        positions = np.concatenate([[0.0], centres, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return np.interp(q * total, positions, values)
+
+
+class OnlineStats(object):
+    """Running summaries (mean, std and quantiles) of a set of scalar nodes.
+
+    :Arguments:
+        names : list of str
+            Names of the nodes, in the order of the values passed to tally().
+
+    :Optional:
+        buffer_size : int <default=1000>
+            Number of samples collected before the summaries are updated.
+        compression : int <default=200>
+            See QuantileSketch.
+    """
+
+    quantiles = (2.5, 25, 50, 75, 97.5)
+
+    def __init__(self, names, buffer_size=1000, compression=200):
+        self.names = list(names)
+        self.moments = RunningMoments(len(self.names))
+        self.sketches = [QuantileSketch(compression) for name in self.names]
+        self._buffer = np.empty((buffer_size, len(self.names)))
+        self._n_buffered = 0
+
+    @property
+    def n(self):
+        """Number of samples summarized so far."""
+        return self.moments.n + self._n_buffered
+
+    def tally(self, values):
+        """Add one sample (one value per node)."""
+        self._buffer[self._n_buffered] = values
+        self._n_buffered += 1
+        if self._n_buffered == self._buffer.shape[0]:
+            self.flush()
+
+    def flush(self):
+        """Fold the buffered samples into the summaries."""
+        block = self._buffer[: self._n_buffered]
+        self.moments.update(block)
+        for i, sketch in enumerate(self.sketches):
+            sketch.update(block[:, i])
+        self._n_buffered = 0
+
+    def merge(self, other):
+        """Add the samples summarized by another OnlineStats of the same
+        nodes (e.g. another chain)."""
+        if other.names != self.names:
+            raise ValueError("Can only merge summaries of the same nodes.")
+        self.flush()
+        other.flush()
+        self.moments.merge(other.moments)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+    def summary(self):
+        """Return a DataFrame with the mean, std and quantiles of each node,
+        with the columns of model.gen_stats()."""
+        self.flush()
+        mean = self.moments.mean if self.moments.n else np.nan
+        stats = pd.DataFrame({"mean": mean, "std": self.moments.std}, index=self.names)
+        q = np.array(self.quantiles) / 100.0
+        quantiles = np.array([sketch.quantile(q) for sketch in self.sketches])
+        for i, quantile in enumerate(self.quantiles):
+            stats["%sq" % quantile] = quantiles[:, i] if len(self.names) else []
+        return stats
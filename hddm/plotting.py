@@ -10,6 +10,7 @@ import arviz as az
 
 import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 # import pymc as pm
 # import hddm
@@ -2459,6 +2460,30 @@ def get_mean_correct_responses_rlssm(trials, nbins, data):
     return mean_correct_responses, up_err, low_err
 
 
+def _simulate_rlssm_batch(
+    model_ssm, ssm_params, rl_params, sizes, p_lower, p_upper, seed
+):
+    """Simulate a batch of (posterior sample, subject, condition) cells in lockstep
+    for gen_ppc_rlssm, returns the trials of all cells one after another."""
+    sim = simulate_rlssm_bandit(
+        model_ssm,
+        ssm_params,
+        rl_params,
+        sizes,
+        p_upper=p_upper,
+        p_lower=p_lower,
+        random_state=seed,
+    )
+    played = np.arange(sim["response"].shape[1]) < sizes[:, None]
+    trial = np.broadcast_to(np.arange(1, played.shape[1] + 1), played.shape)
+    return (
+        sim["response"][played],
+        sim["rt"][played],
+        trial[played],
+        sim["feedback"][played],
+    )
+
+
 def gen_ppc_rlssm(
     model_ssm,
     config_ssm,
@@ -2472,6 +2497,9 @@ def gen_ppc_rlssm(
     save_data=False,
     save_name=None,
     save_path=None,
+    n_jobs=1,
+    random_state=None,
+    batch_size=None,
 ):
     """Generates data (for posterior predictives) using samples from the given trace as parameters.
 
@@ -2512,6 +2540,18 @@ def gen_ppc_rlssm(
         save_path: str <default=None>
             Specifies path to save the data.
 
+        n_jobs: int <default=1>
+            Number of processes simulating batches in parallel.
+
+        random_state: int <default=None>
+            Seed. Every batch is simulated from its own seed drawn from it, so the
+            output does not depend on n_jobs.
+
+        batch_size: int <default=None>
+            Number of posterior samples whose (subject, condition) cells are
+            simulated in lockstep, with one simulator call per trial. Defaults to
+            all samples in a single batch; set it to use more than one process.
+
 
     Return:
         ppc_sdata: pandas.DataFrame
@@ -2526,61 +2566,79 @@ def gen_ppc_rlssm(
 
         return transformed_param_val
 
-    sim_data = pd.DataFrame()
-
-    nsamples += 1
-    for i in tqdm(range(1, nsamples)):
-        sample = np.random.randint(0, traces.shape[0] - 1)
-
-        for subj in data.subj_idx.unique():
-            sub_data = pd.DataFrame()
-
-            for cond in np.unique(data.split_by):
-                sampled_param_ssm = list()
-                for p in config_ssm["params"]:
-                    p_val = traces.loc[sample, p + "_subj." + str(subj)]
-                    p_val = transform_param(p, p_val)
-                    sampled_param_ssm.append(p_val)
+    rng = np.random if random_state is None else np.random.RandomState(random_state)
+    samples = rng.randint(0, traces.shape[0] - 1, size=nsamples)
+
+    subjs = data.subj_idx.unique()
+    conds = np.unique(data.split_by)
+    cond_sizes = data.groupby(["subj_idx", "split_by"]).trial.nunique()
+
+    # Parameters of all posterior samples, one (nsamples, n_params) array per subject
+    params = list(config_ssm["params"]) + list(config_rl["params"])
+    n_ssm = len(config_ssm["params"])
+    subj_params = {}
+    for subj in subjs:
+        columns = [p + "_subj." + str(subj) for p in params]
+        values = traces.loc[samples, columns].values.astype(float)
+        subj_params[subj] = np.column_stack(
+            [transform_param(p, values[:, j]) for j, p in enumerate(params)]
+        )
 
-                sampled_param_rl = list()
-                for p in config_rl["params"]:
-                    p_val = traces.loc[sample, p + "_subj." + str(subj)]
-                    p_val = transform_param(p, p_val)
-                    sampled_param_rl.append(p_val)
+    # One cell per (sample, subject, condition) in the order of the output
+    cells = [
+        (i, subj, cond, cond_sizes.get((subj, cond), 0))
+        for i in range(nsamples)
+        for subj in subjs
+        for cond in conds
+    ]
+    cells = [cell for cell in cells if cell[3] > 0]
+
+    # Batches of posterior samples, simulated in lockstep
+    if batch_size is None:
+        batch_size = max(nsamples, 1)
+    batches = {}
+    for cell in cells:
+        batches.setdefault(cell[0] // batch_size, []).append(cell)
+    batches = list(batches.values())
+    seeds = rng.randint(2**31 - 1, size=len(batches))
+    args = (
+        [model_ssm] * len(batches),
+        [np.array([subj_params[s][i, :n_ssm] for i, s, _, _ in b]) for b in batches],
+        [np.array([subj_params[s][i, n_ssm:] for i, s, _, _ in b]) for b in batches],
+        [np.array([size for _, _, _, size in b]) for b in batches],
+        [np.array([p_lower[cond] for _, _, cond, _ in b]) for b in batches],
+        [np.array([p_upper[cond] for _, _, cond, _ in b]) for b in batches],
+        seeds,
+    )
 
-                cond_size = len(
-                    data[
-                        (data["subj_idx"] == subj) & (data["split_by"] == cond)
-                    ].trial.unique()
-                )
-                ind_cond_data = gen_rand_rlssm_data_MAB_RWupdate(
-                    model_ssm,
-                    sampled_param_ssm,
-                    sampled_param_rl,
-                    size=cond_size,
-                    p_lower=p_lower[cond],
-                    p_upper=p_upper[cond],
-                    subjs=1,
-                    split_by=cond,
+    if n_jobs == 1:
+        results = list(tqdm(map(_simulate_rlssm_batch, *args), total=len(batches)))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                tqdm(
+                    executor.map(_simulate_rlssm_batch, *args),
+                    total=len(batches),
                 )
+            )
 
-                # append the conditions
-                # sub_data = sub_data.append([ind_cond_data], ignore_index=False)
-                sub_data = pd.concat([sub_data, ind_cond_data], ignore_index=False)
-
-            # assign subj_idx
-            sub_data["subj_idx"] = subj
-
-            # identify the simulated data
-            sub_data["samp"] = i
-
-            # append data from each subject
-            # sim_data = sim_data.append(sub_data, ignore_index=True)
-            sim_data = pd.concat([sim_data, sub_data], ignore_index=True)
-
-    ppc_sdata = sim_data[
-        ["subj_idx", "response", "split_by", "rt", "trial", "feedback", "samp"]
-    ].copy()
+    # Assemble all cells at once
+    sizes = [size for _, _, _, size in cells]
+    response, rt, trial, feedback = [
+        np.concatenate([res[j] for res in results]) if results else np.empty(0)
+        for j in range(4)
+    ]
+    ppc_sdata = pd.DataFrame(
+        {
+            "subj_idx": np.repeat([subj for _, subj, _, _ in cells], sizes),
+            "response": response,
+            "split_by": np.repeat([cond for _, _, cond, _ in cells], sizes),
+            "rt": rt,
+            "trial": trial,
+            "feedback": feedback,
+            "samp": np.repeat([i + 1 for i, _, _, _ in cells], sizes),
+        }
+    )
 
     if save_data:
         if save_name is None:
@@ -1,7 +1,12 @@
+import numpy as np
 import ssms
+from scipy.special import log_ndtr
 from hddm.model_config import model_config
 from ssms.basic_simulators import boundary_functions
 
+# Models with constant boundaries that the exact backend can sample
+_EXACT_MODELS = ("ddm_hddm_base", "full_ddm_hddm_base")
+
 
 def simulator(**kwargs):
     """Basic data simulator for the models included in HDDM.
@@ -20,6 +25,11 @@ def simulator(**kwargs):
             Maximum reaction the simulator can reach
         no_noise: bool <default=False>
             Turn noise of (useful for plotting purposes mostly)
+        backend: str <default='ssms'>
+            'ssms' simulates Euler-Maruyama paths with the ssm-simulators package.
+            'exact' draws first-passage times of the constant-boundary DDM
+            ('ddm_hddm_base', 'full_ddm_hddm_base') without discretization, see
+            exact_wfpt_sample(). delta_t and max_t do not apply to it.
 
     :Return: tuple
         can be (rts, responses, metadata)
@@ -27,10 +37,250 @@ def simulator(**kwargs):
         or     (rts binned pointwise, responses, metadata)
 
     """
+    backend = kwargs.pop("backend", "ssms")
+
     # Fix weibull issue with ssms
     if "model" in kwargs:
         if kwargs["model"] == "weibull":
             kwargs["model"] = "weibull_cdf"
 
+    if backend == "exact":
+        return _exact_simulator(**kwargs)
+    elif backend != "ssms":
+        raise ValueError("backend has to be 'ssms' or 'exact', got %s" % backend)
+
     data_tmp = ssms.basic_simulators.simulator(**kwargs)
     return (data_tmp["rts"], data_tmp["choices"], data_tmp["metadata"])
+
+
+def _exact_simulator(
+    theta, model="full_ddm_hddm_base", n_samples=1000, random_state=None, **kwargs
+):
+    """simulator() for backend='exact', mirrors the output of the ssms backend."""
+    if model not in _EXACT_MODELS:
+        raise ValueError(
+            "The exact backend supports the models %s, got %s" % (_EXACT_MODELS, model)
+        )
+    if kwargs.get("no_noise", False) or kwargs.get("bin_dim", None):
+        raise NotImplementedError(
+            "no_noise and bin_dim are not supported by the exact backend"
+        )
+
+    theta = np.asarray(theta, dtype=np.float32)
+    if theta.ndim < 2:
+        theta = np.expand_dims(theta, axis=0)
+    n_trials = theta.shape[0]
+
+    params = dict(zip(model_config[model]["params"], theta.T))
+    # (n_samples, n_trials) samples, trial parameters broadcast over samples
+    rts, choices = exact_wfpt_sample(
+        size=(n_samples, n_trials),
+        random_state=random_state,
+        **{name: np.asarray(value, dtype=np.float64) for name, value in params.items()}
+    )
+    rts = rts.astype(np.float32)[:, :, None]
+    # ssms codes the lower boundary as -1
+    choices = np.where(choices == 1, 1, -1).astype(np.intc)[:, :, None]
+
+    # Output compatibility
+    if n_trials == 1:
+        rts, choices = np.squeeze(rts, axis=1), np.squeeze(choices, axis=1)
+    if n_trials > 1 and n_samples == 1:
+        rts, choices = np.squeeze(rts, axis=0), np.squeeze(choices, axis=0)
+
+    metadata = {**params}
+    metadata.update(
+        {
+            "s": 1.0,
+            "n_samples": n_samples,
+            "simulator": "exact_wfpt",
+            "possible_choices": [-1, 1],
+            "model": model,
+        }
+    )
+    return (rts, choices, metadata)
+
+
+def exact_wfpt_sample(
+    v, a, z, t, sv=0.0, sz=0.0, st=0.0, size=None, random_state=None, tol=1e-10
+):
+    """Sample (rt, choice) from the DDM with constant boundaries without
+    discretizing the diffusion.
+
+    Trial-wise drift, starting point and non-decision time are drawn as in
+    hddm.wfpt.full_pdf (v ~ N(v, sv), z ~ U(z - sz/2, z + sz/2),
+    t ~ U(t - st/2, t + st/2)). The boundary is then drawn from its exact
+    probability and the first-passage time by inverting the series expansion
+    of its conditional CDF (small-time series for t < a**2, large-time series
+    otherwise).
+
+    :Arguments:
+        v, a, z, t : float or numpy.ndarray
+            Drift, boundary separation, relative starting point, non-decision time.
+            Arrays are broadcast against size.
+
+    :Optional:
+        sv, sz, st : float or numpy.ndarray
+            Inter-trial variability of drift, starting point and non-decision time.
+        size : int or tuple
+            Number of samples. Defaults to the broadcast shape of the parameters.
+        random_state : None or int
+            Seed. If None, numpy's global random state is used.
+        tol : float
+            Tolerance of the inverted CDF.
+
+    :Returns:
+        rts : numpy.ndarray
+        choices : numpy.ndarray
+            1 for the upper and 0 for the lower boundary.
+    """
+    rng = np.random if random_state is None else np.random.RandomState(random_state)
+    if size is None:
+        size = np.broadcast(v, a, z, t, sv, sz, st).shape
+    v, a, z, t, sv, sz, st = [
+        np.broadcast_to(np.asarray(x, dtype=np.float64), size)
+        for x in (v, a, z, t, sv, sz, st)
+    ]
+
+    v = v + sv * rng.standard_normal(size)
+    z = z + sz * (rng.uniform(size=size) - 0.5)
+    t = t + st * (rng.uniform(size=size) - 0.5)
+
+    upper = rng.uniform(size=size) < 1.0 - _wfpt_p_lower(v, a, z)
+    rts = exact_wfpt_decision_times(
+        upper, v, a, z, random_state=None if random_state is None else rng, tol=tol
+    )
+    return t + rts, upper.astype(int)
+
+
+def exact_wfpt_decision_times(choices, v, a, z, random_state=None, tol=1e-10):
+    """Sample decision times of the DDM with constant boundaries conditional on
+    the boundary that was reached, by inverting its conditional CDF.
+
+    :Arguments:
+        choices : numpy.ndarray
+            1 (or True) for the upper and 0 for the lower boundary.
+        v, a, z : float or numpy.ndarray
+            Drift, boundary separation and relative starting point, broadcast
+            against choices.
+
+    :Optional:
+        random_state : None, int or numpy.random.RandomState
+            Seed or random state. If None, numpy's global random state is used.
+        tol : float
+            Tolerance of the inverted CDF.
+
+    :Returns:
+        rts : numpy.ndarray
+            Decision times (without non-decision time) in the shape of choices.
+    """
+    if random_state is None:
+        rng = np.random
+    elif isinstance(random_state, np.random.RandomState):
+        rng = random_state
+    else:
+        rng = np.random.RandomState(random_state)
+    upper = np.asarray(choices).astype(bool)
+    size = upper.shape
+    v, a, z = [
+        np.broadcast_to(np.asarray(x, dtype=np.float64), size) for x in (v, a, z)
+    ]
+    # Upper boundary crossings are lower boundary crossings of the mirrored process
+    v = np.where(upper, -v, v)
+    w = np.where(upper, 1.0 - z, z)
+
+    u = rng.uniform(size=size).ravel()
+    rts = _wfpt_invert_cdf(u, v.ravel(), a.ravel(), w.ravel(), tol)
+    return rts.reshape(size)
+
+
+def _wfpt_p_lower(v, a, w):
+    # Probability to reach the lower boundary, starting at w * a with drift v
+    va = v * a
+    small = np.abs(va) < 1e-8
+    va = np.where(small, 1.0, va)
+    return np.where(small, 1.0 - w, np.expm1(2.0 * va * (1.0 - w)) / np.expm1(2.0 * va))
+
+
+def _wfpt_lower(t, v, a, w, density=False):
+    """Defective CDF (or density) of first-passage times through the lower boundary."""
+    t = np.maximum(t, 1e-300)
+    small = t < a ** 2
+    out = np.zeros(t.shape)
+
+    # Small-time series: method of images, each term a (drift-shifted) Wald CDF
+    if np.any(small):
+        ts, vs, as_, ws = t[small], v[small], a[small], w[small]
+        x0 = ws * as_
+        total = np.zeros(ts.shape)
+        for k in range(-7, 8):
+            d = x0 + 2 * k * as_
+            sign = np.sign(d)
+            if density:
+                total += d * np.exp(-vs * x0 - vs ** 2 * ts / 2 - d ** 2 / (2 * ts))
+            else:
+                mu = -sign * vs
+                sqrt_t = np.sqrt(ts)
+                log_terms = np.logaddexp(
+                    log_ndtr((mu * ts - np.abs(d)) / sqrt_t),
+                    2 * mu * np.abs(d) + log_ndtr((-mu * ts - np.abs(d)) / sqrt_t),
+                )
+                total += sign * np.exp(2 * k * as_ * vs + log_terms)
+        if density:
+            total /= np.sqrt(2 * np.pi * ts ** 3)
+        out[small] = total
+
+    # Large-time series
+    large = ~small
+    if np.any(large):
+        tl, vl, al, wl = t[large], v[large], a[large], w[large]
+        total = np.zeros(tl.shape)
+        for k in range(1, 9):
+            lam = vl ** 2 / 2 + (k * np.pi / al) ** 2 / 2
+            term = k * np.sin(k * np.pi * wl) * np.exp(-vl * wl * al - lam * tl)
+            total += term if density else term / lam
+        total *= np.pi / al ** 2
+        out[large] = total if density else _wfpt_p_lower(vl, al, wl) - total
+    return out
+
+
+def _wfpt_invert_cdf(u, v, a, w, tol=1e-10, max_iter=100):
+    """Lower boundary first-passage times at quantiles u of their conditional CDF."""
+    p_lower = _wfpt_p_lower(v, a, w)
+    target = u * p_lower
+
+    # Bracket the root
+    lo = np.zeros(u.shape)
+    hi = a ** 2
+    for _ in range(max_iter):
+        below = _wfpt_lower(hi, v, a, w) < target
+        if not np.any(below):
+            break
+        lo = np.where(below, hi, lo)
+        hi = np.where(below, 2 * hi, hi)
+
+    # Newton steps, falling back to bisection when leaving the bracket
+    x = (lo + hi) / 2
+    todo = np.arange(u.shape[0])
+    for _ in range(max_iter):
+        xs, ts = x[todo], target[todo]
+        vs, as_, ws = v[todo], a[todo], w[todo]
+        err = _wfpt_lower(xs, vs, as_, ws) - ts
+        lo[todo] = np.where(err < 0, xs, lo[todo])
+        hi[todo] = np.where(err > 0, xs, hi[todo])
+
+        converged = (np.abs(err) <= tol * p_lower[todo]) | (
+            hi[todo] - lo[todo] <= tol * xs
+        )
+        dens = _wfpt_lower(xs, vs, as_, ws, density=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = xs - err / dens
+        bisect = ~((step > lo[todo]) & (step < hi[todo]))
+        x[todo] = np.where(
+            converged, xs, np.where(bisect, (lo[todo] + hi[todo]) / 2, step)
+        )
+
+        todo = todo[~converged]
+        if todo.shape[0] == 0:
+            break
+    return x
@@ -33,24 +33,26 @@ def hddm_preprocess(
     """
     # Define dataframe if simulator output is normal (comes out as list tuple [rts, choices, metadata])
     if len(simulator_data) == 3:
-        df = pd.DataFrame(simulator_data[0].astype(np.double), columns=["rt"])
-        df["response"] = simulator_data[1].astype(int)
+        columns = OrderedDict()
+        columns["rt"] = np.asarray(simulator_data[0], dtype=np.double).ravel()
+        response = np.asarray(simulator_data[1]).astype(int).ravel()
 
     if not keep_negative_responses:
-        df.loc[df["response"] == -1.0, "response"] = 0.0
+        response[response == -1] = 0
+    columns["response"] = response
     if keep_subj_idx:
-        df["subj_idx"] = subj_id
+        columns["subj_idx"] = subj_id
 
     # Add ground truth parameters to dataframe
     if add_model_parameters:
         for param in model_config[simulator_data[2]["model"]]["params"]:
             if len(simulator_data[2][param]) > 1:
-                df[param] = simulator_data[2][param]
+                columns[param] = simulator_data[2][param]
             else:
-                # print(param)
-                # print(simulator_data[2][param][0])
-                df[param] = simulator_data[2][param][0]
-    return df
+                columns[param] = simulator_data[2][param][0]
+
+    # Convert to a DataFrame once
+    return pd.DataFrame(columns)
 
 
 def _add_outliers(
@@ -190,6 +192,7 @@ def simulator_single_subject(
     bin_dim=None,
     bin_pointwise=False,
     verbose=0,
+    random_state=None,
 ):
     """Generate a hddm-ready dataset from a single set of parameters
 
@@ -220,6 +223,8 @@ def simulator_single_subject(
             in the form of a histogram. Binning pointwise gives each trial's RT and index which is the respective bin-number.
             This is expected when you are using the 'cnn' network to fit the dataset later. If pointwise is not chosen,
             then the takes the form of a histogram, with bin-wise frequencies.
+        random_state: int <default=None>
+            Seed passed on to the simulator.
 
     Return: tuple of (pandas.DataFrame, dict, list)
         The first part of the tuple holds a DataFrame with a 'reaction time' column and a 'response' column. Ready to be fit with hddm.
@@ -320,6 +325,7 @@ def simulator_single_subject(
         max_t=max_t,
         bin_dim=bin_dim,
         bin_pointwise=bin_pointwise,
+        random_state=random_state,
     )
 
     # Add outliers
@@ -669,27 +675,52 @@ def simulator_h_c(
         # Construct subject data
         full_parameter_dict = group_level_parameter_dict.copy()
 
-        # Subject part -----------------------
-        full_data = []
         # Condition --------------------------
         if conditions_df is None:
             n_conditions = 1
         else:
             n_conditions = conditions_df.shape[0]
 
+        # Preallocate the columns of all conditions x subjects x trials,
+        # rows are blocks of n_trials_per_subject trials (subjects within conditions)
+        n_rows = n_conditions * n_subjects * n_trials_per_subject
+        columns = OrderedDict()
+        columns["subj_idx"] = np.tile(
+            np.repeat(np.arange(n_subjects), n_trials_per_subject), n_conditions
+        )
+        if regression_covariates is not None:
+            for key_tmp in regression_covariates.keys():
+                columns[key_tmp] = np.empty(n_rows)
+        if conditions_df is not None:
+            for key_tmp in conditions_df.keys():
+                columns[key_tmp] = np.repeat(
+                    conditions_df[key_tmp].values, n_subjects * n_trials_per_subject
+                )
+        for param in model_config[model]["params"]:
+            columns[param] = np.empty(n_rows)
+
         for condition_id in range(n_conditions):
             # remainder_set = 0
             regressor_set = 0
 
+            # Condition labels of the depends_on parameters
+            condition_elems = {}
+            if depends_on is not None:
+                for depends_tmp in depends_on.keys():
+                    condition_elems[depends_tmp] = ".".join(
+                        conditions_df[depends_on[depends_tmp]].iloc[condition_id]
+                    )
+
             for subj_idx in range(n_subjects):
-                # Parameter vector
-                subj_data = pd.DataFrame(index=np.arange(0, n_trials_per_subject, 1))
-                subj_data["subj_idx"] = str(subj_idx)
+                start = (condition_id * n_subjects + subj_idx) * n_trials_per_subject
+                subj_rows = slice(start, start + n_trials_per_subject)
 
                 # Fixed part
                 if fixed_at_default is not None:
                     for fixed_tmp in fixed_at_default:
-                        subj_data[fixed_tmp] = group_level_parameter_dict[fixed_tmp]
+                        columns[fixed_tmp][subj_rows] = group_level_parameter_dict[
+                            fixed_tmp
+                        ]
 
                 # Group only part
                 if group_only is not None:
@@ -697,9 +728,9 @@ def simulator_h_c(
                         if group_only_tmp in list(depends_on.keys()):
                             pass
                         else:
-                            subj_data[group_only_tmp] = group_level_parameter_dict[
-                                group_only_tmp
-                            ]
+                            columns[group_only_tmp][
+                                subj_rows
+                            ] = group_level_parameter_dict[group_only_tmp]
 
                 # Remainder part
                 if remainder is not None:
@@ -721,20 +752,16 @@ def simulator_h_c(
                                 remainder_tmp + "_subj." + str(subj_idx)
                             ] = np.random.normal(loc=tmp_mean, scale=tmp_std)
 
-                        subj_data[remainder_tmp] = full_parameter_dict[
+                        columns[remainder_tmp][subj_rows] = full_parameter_dict[
                             remainder_tmp + "_subj." + str(subj_idx)
                         ]
 
                 # Depends on part
                 if depends_on is not None:
-                    # conditions_tmp = conditions_df.iloc[condition_id]
                     for depends_tmp in depends_on.keys():
-                        conditions_df_tmp = conditions_df[depends_on[depends_tmp]].iloc[
-                            condition_id
-                        ]
-                        condition_elem = ".".join(conditions_df_tmp)
+                        condition_elem = condition_elems[depends_tmp]
 
-                        # Add parameters to subject dataframe
+                        # Add parameters to subject data
                         if depends_tmp not in group_only:
                             tmp_mean = group_level_parameter_dict[
                                 depends_tmp + "(" + condition_elem + ")"
@@ -759,24 +786,14 @@ def simulator_h_c(
                                 )
 
                             # Assign the parameter to subject data
-                            subj_data[depends_tmp] = full_parameter_dict[
-                                depends_tmp
-                                + "_subj("
-                                + condition_elem
-                                + ")."
-                                + str(subj_idx)
+                            columns[depends_tmp][subj_rows] = full_parameter_dict[
+                                tmp_param_name
                             ]
                         else:
-                            subj_data[depends_tmp] = full_parameter_dict[
+                            columns[depends_tmp][subj_rows] = full_parameter_dict[
                                 depends_tmp + "(" + condition_elem + ")"
                             ]
 
-                        # Add the respective stimulus columns
-                        for condition_key_tmp in conditions_df_tmp.keys():
-                            subj_data[condition_key_tmp] = conditions_df_tmp[
-                                condition_key_tmp
-                            ]
-
                 # Regressor part
                 if regression_covariates is not None:
                     cov_df = make_covariate_df(
@@ -785,7 +802,7 @@ def simulator_h_c(
 
                     # Add cov_df to subject data
                     for key_tmp in cov_df.keys():
-                        subj_data[key_tmp] = cov_df[key_tmp].copy()
+                        columns[key_tmp][subj_rows] = cov_df[key_tmp].values
 
                 if regression_models is not None:
                     for reg_model in regression_models:
@@ -844,24 +861,20 @@ def simulator_h_c(
                                     reg_param_names_tmp[k]
                                 ] = reg_params_tmp[k]
 
-                        subj_data[outcome] = (design_matrix * reg_params_tmp).sum(
+                        columns[outcome][subj_rows] = (
+                            np.asarray(design_matrix) * reg_params_tmp
+                        ).sum(
                             axis=1
                         )  # AF-TD: This should probably include a noise term here (parameter really defined as coming from a linear model + noise)
 
-                # Append full data:
-                full_data.append(subj_data.copy())
-
             remainder_set = 1
             regressor_set = 1
 
-        full_data = pd.concat(full_data)
-        parameters = full_data[model_config[model]["params"]]
-
-        # Run the actual simulations
-        # print(parameters)
-
+        # Run the actual simulations, all parameter rows in a single call
         sim_data = simulator(
-            theta=parameters.values,
+            theta=np.column_stack(
+                [columns[param] for param in model_config[model]["params"]]
+            ),
             model=model,
             n_samples=1,
             delta_t=0.001,
@@ -872,53 +885,31 @@ def simulator_h_c(
         )
 
         # Post-processing
-        full_data["rt"] = sim_data[0].astype(np.float64)
-        full_data["response"] = sim_data[1].astype(np.float64)
-        full_data.loc[full_data["response"] < 0, ["response"]] = 0.0
+        rt = np.asarray(sim_data[0], dtype=np.float64).reshape(n_rows)
+        response = np.asarray(sim_data[1], dtype=np.float64).reshape(n_rows)
 
         # Add in outliers
         if p_outlier > 0:
-            # print('passing through outlier creation')
             outlier_idx = np.random.choice(
-                list(data.index),
-                replace=False,
-                size=int(p_outlier * len(list(data.index))),
+                n_rows, replace=False, size=int(p_outlier * n_rows)
             )
-            outlier_data = np.zeros((outlier_idx.shape[0], 2))
-
             # Outlier rts
-            outlier_data[:, 0] = np.random.uniform(
-                low=0.0, high=outlier_max_t, size=outlier_data.shape[0]
+            rt[outlier_idx] = np.random.uniform(
+                low=0.0, high=outlier_max_t, size=outlier_idx.shape[0]
             )
-
             # Outlier choices
-            outlier_data[:, 1] = np.random.choice(
-                sim_data[2]["possible_choices"], size=outlier_data.shape[0]
+            response[outlier_idx] = np.random.choice(
+                sim_data[2]["possible_choices"], size=outlier_idx.shape[0]
             )
+        response[response < 0] = 0.0
 
-            # Exchange data for outliers
-            full_data.iloc[
-                outlier_idx,
-                [
-                    list(full_data.keys()).index("rt"),
-                    list(full_data.keys()).index("response"),
-                ],
-            ] = outlier_data
-
-            # Identify outliers in dataframe
-            full_data["outlier"] = 0
-            full_data[outlier_idx, [list(full_data.keys()).index("outlier")]] = 1
-
-        full_data_cols = ["rt", "response", "subj_idx"]
-
-        if regression_covariates is not None:
-            full_data_cols += [key for key in regression_covariates.keys()]
-        if conditions is not None:
-            full_data_cols += [key for key in conditions.keys()]
-
-        full_data_cols += model_config[model]["params"]
-        full_data = full_data[full_data_cols]
-        full_data.reset_index(drop=True, inplace=True)
+        # Convert to a DataFrame once
+        columns["subj_idx"] = pd.Categorical.from_codes(
+            columns["subj_idx"], categories=[str(i) for i in range(n_subjects)]
+        )
+        full_data = pd.DataFrame(
+            OrderedDict([("rt", rt), ("response", response)] + list(columns.items()))
+        )
 
         # AF-Comment: Does this cover all corner cases?
         # If n_subjects is 1 --> we overwrite the group parameters with the subj.0 parameters
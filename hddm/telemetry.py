@@ -0,0 +1,187 @@
+"""
+Sampling telemetry, used by model.sample(telemetry=True).
+
+While sampling, every node of the model counts how often its likelihood
+(stochastics, e.g. wfpt or LAN likelihoods) or value (deterministics, e.g.
+regression outcomes) is actually computed, i.e. not taken from pymc's
+cache, and how long that took. Every step method counts its steps and
+their time, together with its own statistics (accepted/rejected proposals
+of Metropolis steps, likelihood evaluations of the slice sampler).
+"""
+
+import json
+import time
+from collections import OrderedDict
+from copy import copy
+
+import pandas as pd
+
+__all__ = ["SamplingTelemetry"]
+
+# Counters of the step methods reported next to the timing
+_STEP_METHOD_COUNTERS = ("accepted", "rejected", "neval")
+
+
+class SamplingTelemetry(object):
+    """Per-node and per-step-method timing of one pymc.MCMC run.
+
+    :Arguments:
+        model : AccumulatorModel
+            Model with a pymc.MCMC sampler (model.mc).
+
+    :Optional:
+        log_fname : str <default=None>
+            If given, a snapshot of the telemetry (see to_dict()) is appended
+            to this file as one line of JSON every log_interval seconds and
+            when sampling ends.
+        log_interval : float <default=10>
+            Seconds between two snapshots.
+    """
+
+    def __init__(self, model, log_fname=None, log_interval=10.0):
+        self.log_fname = log_fname
+        self.log_interval = log_interval
+        self.elapsed = 0.0
+        self.nodes = OrderedDict()
+        self.step_methods = OrderedDict()
+
+        self._mc = model.mc
+        self._knodes = model.nodes_db["knode_name"]
+        self._restore = []
+
+    def start(self):
+        """Instrument the nodes and step methods of the sampler."""
+        self._start_time = time.perf_counter()
+        self._next_log = self._start_time + self.log_interval
+
+        for node in self._mc.stochastics | self._mc.observed_stochastics:
+            self._instrument_node(node, node._logp, "logp")
+        for node in self._mc.deterministics:
+            self._instrument_node(node, node._value, "value")
+
+        # Step methods are assigned lazily by pymc, make sure they exist
+        self._mc.assign_step_methods()
+        for step_method in self._mc.step_methods:
+            self._instrument_step_method(step_method)
+
+    def stop(self):
+        """Remove the instrumentation and write the last snapshot."""
+        for restore in self._restore:
+            restore()
+        self._restore = []
+        self.elapsed = time.perf_counter() - self._start_time
+        if self.log_fname is not None:
+            self.write_log()
+        # Do not keep the sampler alive (and out of pickles)
+        self._mc = None
+        self._knodes = None
+
+    def _instrument_node(self, node, lazy_function, computes):
+        stats = {
+            "knode": self._knodes.get(node.__name__, None),
+            "kind": node.__class__.__name__,
+            "computes": computes,
+            "evaluations": 0,
+            "seconds": 0.0,
+        }
+        self.nodes[node.__name__] = stats
+        fun = lazy_function.fun
+
+        # pymc's LazyFunction only calls fun when the cached value is outdated
+        def timed_fun(**kwargs):
+            start = time.perf_counter()
+            try:
+                return fun(**kwargs)
+            finally:
+                stats["evaluations"] += 1
+                stats["seconds"] += time.perf_counter() - start
+
+        def restore():
+            lazy_function.fun = fun
+
+        lazy_function.fun = timed_fun
+        self._restore.append(restore)
+
+    def _instrument_step_method(self, step_method):
+        stats = {
+            "class": step_method.__class__.__name__,
+            "stochastics": sorted(s.__name__ for s in step_method.stochastics),
+            "steps": 0,
+            "seconds": 0.0,
+        }
+        counters = [c for c in _STEP_METHOD_COUNTERS if hasattr(step_method, c)]
+        for counter in counters:
+            stats[counter] = 0
+        self.step_methods[step_method._id] = stats
+        step = step_method.step
+        own_step = "step" in step_method.__dict__
+
+        # Counters are accumulated step by step: pymc's tune() resets them
+        # between steps (e.g. accepted/rejected of Metropolis)
+        def timed_step():
+            counts = [copy(getattr(step_method, c)) for c in counters]
+            start = time.perf_counter()
+            try:
+                return step()
+            finally:
+                now = time.perf_counter()
+                stats["steps"] += 1
+                stats["seconds"] += now - start
+                for counter, count in zip(counters, counts):
+                    stats[counter] += getattr(step_method, counter) - count
+                if self.log_fname is not None and now >= self._next_log:
+                    self._next_log = now + self.log_interval
+                    self.elapsed = now - self._start_time
+                    self.write_log()
+
+        def restore():
+            if own_step:
+                step_method.step = step
+            else:
+                del step_method.step
+
+        step_method.step = timed_step
+        self._restore.append(restore)
+
+    def node_report(self):
+        """Return a DataFrame with the number of evaluations and the time
+        spent on every node, most expensive first."""
+        report = pd.DataFrame(
+            list(self.nodes.values()),
+            index=pd.Index(list(self.nodes.keys()), name="node"),
+            columns=["knode", "kind", "computes", "evaluations", "seconds"],
+        ).reset_index()
+        evaluations = report["evaluations"].where(report["evaluations"] > 0)
+        report["seconds_per_evaluation"] = report["seconds"] / evaluations
+        return report.sort_values("seconds", ascending=False).reset_index(drop=True)
+
+    def step_method_report(self):
+        """Return a DataFrame with the number of steps, the time spent and
+        the counters of every step method, most expensive first."""
+        columns = ["class", "stochastics", "steps", "seconds"]
+        for stats in self.step_methods.values():
+            columns += [c for c in stats if c not in columns]
+        report = pd.DataFrame(
+            list(self.step_methods.values()),
+            index=pd.Index(list(self.step_methods.keys()), name="step_method"),
+            columns=columns,
+        ).reset_index()
+        if "accepted" in report:
+            report["acceptance_rate"] = report["accepted"] / (
+                report["accepted"] + report["rejected"]
+            )
+        return report.sort_values("seconds", ascending=False).reset_index(drop=True)
+
+    def to_dict(self):
+        """Snapshot of the telemetry as a JSON serializable dict."""
+        return {
+            "time": time.time(),
+            "elapsed": self.elapsed,
+            "nodes": self.nodes,
+            "step_methods": self.step_methods,
+        }
+
+    def write_log(self):
+        """Append a snapshot to log_fname as one line of JSON."""
+        with open(self.log_fname, "a") as f:
+            f.write(json.dumps(self.to_dict(), default=float) + "\n")
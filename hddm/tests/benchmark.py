@@ -117,4 +117,51 @@ def check_outlier_model(seed=None, p_outlier=0.05):
     return data
 
 
-data = check_outlier_model(seed=1, p_outlier=0)
+def benchmark_mlp_likelihood(model="angle", size=1000, repeats=200):
+    """Per-call latency of the exec-generated LAN regression likelihood
+    (make_reg_likelihood_str_mlp_basic) vs. the compiled one
+    (make_reg_likelihood_fun_mlp). The network forward pass is replaced by a
+    trivial function so that only the likelihood overhead is timed."""
+
+    class NullNetwork(object):
+        def predict_on_batch(self, data):
+            return np.zeros((data.shape[0], 1), dtype=np.float32)
+
+    config = hddm.model_config.model_config[model]
+    wiener_params = {"w_outlier": 0.1}
+    data = pd.DataFrame(
+        {
+            "rt": np.random.rand(size).astype(np.float32) + 0.3,
+            "response": np.random.choice([-1.0, 1.0], size).astype(np.float32),
+        }
+    )
+    params = dict(zip(config["params"], config["params_default"]))
+    params["v"] = pd.Series(np.zeros(2 * size), index=np.arange(2 * size))
+
+    namespace = {"hddm": hddm, "np": np, "warnings": None}
+    exec(
+        hddm.utils.make_reg_likelihood_str_mlp_basic(
+            config=config, wiener_params=wiener_params
+        ),
+        namespace,
+    )
+    likelihoods = {
+        "exec": namespace["custom_likelihood_reg"],
+        "compiled": hddm.utils.make_reg_likelihood_fun_mlp(
+            config=config, wiener_params=wiener_params
+        ),
+    }
+
+    timings = {}
+    for name, likelihood in likelihoods.items():
+        tic = time.time()
+        for i in range(repeats):
+            likelihood(data, reg_outcomes={"v"}, network=NullNetwork(), **params)
+        timings[name] = (time.time() - tic) / repeats * 1e6
+        print("%s: %.1f us per call" % (name, timings[name]))
+
+    return timings
+
+
+if __name__ == "__main__":
+    data = check_outlier_model(seed=1, p_outlier=0)
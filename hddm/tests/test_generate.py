@@ -3,6 +3,7 @@ import unittest
 import hddm
 from scipy.stats import ks_2samp, kstest
 import numpy as np
+import pandas as pd
 
 from nose import SkipTest
 
@@ -49,8 +50,151 @@ class TestGenerate(unittest.TestCase):
             print("p_value: %f" % p_value)
             self.assertTrue(p_value > 0.05)
 
+    def test_cdf_grid_cache(self):
+        params = hddm.generate.gen_rand_params(include=["z", "sz", "sv"])
+        args = [params[name] for name in ("v", "sv", "a", "z", "sz")]
+        x, cdf = hddm.wfpt.cdf_grid(*args)
+        self.assertIs(hddm.wfpt.cdf_grid(*args)[1], cdf)
+        self.assertFalse(cdf.flags.writeable)
+        self.assertAlmostEqual(cdf[-1], 1.0)
+        self.assertTrue(np.all(np.diff(cdf) >= 0))
+
+        cache_size = hddm.wfpt.cdf_grid_cache.maxsize
+        try:
+            hddm.wfpt.cdf_grid_cache.resize(2)
+            for dt in (1e-2, 2e-2, 5e-2):
+                hddm.wfpt.cdf_grid(*args, dt=dt)
+            self.assertEqual(len(hddm.wfpt.cdf_grid_cache), 2)
+            self.assertIsNot(hddm.wfpt.cdf_grid(*args)[1], cdf)
+        finally:
+            hddm.wfpt.cdf_grid_cache.resize(cache_size)
+
+    def test_gen_rts_from_cdf_grid_arguments(self):
+        params = hddm.generate.gen_rand_params(include=["z", "sz", "st", "sv"])
+        args = [params[name] for name in ("v", "sv", "a", "z", "sz", "t", "st")]
+        np.random.seed(100)
+        expected = hddm.wfpt.gen_rts_from_cdf(*args, samples=100, cdf_lb=-4, dt=0.05)
+        np.random.seed(100)
+        rts = hddm.generate._gen_rts_from_cdf(
+            params, samples=100, range_=(-4, 6), dt=0.05
+        )
+        np.testing.assert_array_equal(rts, expected)
+
+    def test_cdf_py_samples_to_cdf_samples(self):
+        np.random.seed(100)
+        params = hddm.generate.gen_rand_params(include=["z", "sz", "st", "sv"])
+        [D, p_value] = ks_2samp(
+            hddm.generate.gen_rts(method="cdf_py", **params).rt.values,
+            hddm.generate.gen_rts(method="cdf", **params).rt.values,
+        )
+        print("p_value: %f" % p_value)
+        self.assertTrue(p_value > 0.05)
+
+    def test_simulate_drift_process_trialwise(self):
+        np.random.seed(100)
+        params = [
+            hddm.generate.gen_rand_params(include=["z", "sz", "st", "sv"])
+            for _ in range(2)
+        ]
+        size = 1000
+        # Interleave two parameter sets over trials, simulated in small chunks
+        trial_params = [
+            np.tile([params[0][name], params[1][name]], size)
+            for name in ("v", "sv", "a", "z", "sz", "t", "st")
+        ]
+        rts = hddm.generate._simulate_drift_process(
+            *trial_params, dt=1e-4, max_elements=50000
+        )
+        self.assertEqual(rts.shape, (2 * size,))
+        for i, params_i in enumerate(params):
+            [D, p_value] = ks_2samp(
+                hddm.generate.gen_rts(
+                    method="cdf", size=size, structured=False, **params_i
+                ),
+                rts[i::2],
+            )
+            print("p_value: %f" % p_value)
+            self.assertTrue(p_value > 0.05)
+
+    def test_simulated_drift_trajectories(self):
+        np.random.seed(100)
+        params = hddm.generate.gen_rand_params(include=["z", "st"])
+        dt = 1e-3
+        rts, trajectories = hddm.generate._gen_rts_from_simulated_drift(
+            params, samples=100, dt=dt
+        )
+        self.assertEqual(len(trajectories), 100)
+        for rt, trajectory in zip(rts, trajectories):
+            # Trajectories span the RT and stay within the boundaries
+            self.assertLessEqual(abs(len(trajectory) * dt - abs(rt)), 2 * dt)
+            self.assertTrue(np.all((trajectory >= 0) & (trajectory <= params["a"])))
+
+        rts_only, no_trajectories = hddm.generate._gen_rts_from_simulated_drift(
+            params, samples=100, dt=dt, return_trajectories=False
+        )
+        self.assertIsNone(no_trajectories)
+        self.assertEqual(rts_only.shape, (100,))
+
     def test_generate_breakdown(self):
         hddm.generate.gen_rand_data(subjs=10)
         hddm.generate.gen_rand_data(subjs=1)
         hddm.generate.gen_rand_data(n_fast_outliers=5, n_slow_outliers=5)
         hddm.generate.gen_rand_data(size=100)
+
+    def test_gen_rand_rlddm_data(self):
+        np.random.seed(3)
+        data = hddm.generate.gen_rand_rlddm_data(
+            a=1.5,
+            t=0.3,
+            scaler=3,
+            alpha=0.2,
+            size=100,
+            p_upper=0.8,
+            p_lower=0.2,
+            subjs=20,
+        )
+        self.assertEqual(data.shape, (2000, 9))
+        np.testing.assert_array_equal(data.trial, np.tile(np.arange(1, 101), 20))
+        self.assertTrue(np.all(data.rt > 0.05))
+
+        # Q-values of a subject follow the Rescorla-Wagner updates of its choices
+        subj = data[data.subj_idx == 0]
+        upper = subj.response.values[:-1] == 1
+        delta_up = (subj.feedback - subj.q_up).values[:-1]
+        alpha = np.diff(subj.q_up)[upper & (delta_up != 0)] / delta_up[
+            upper & (delta_up != 0)
+        ]
+        np.testing.assert_allclose(alpha, alpha[0])
+        np.testing.assert_array_equal(np.diff(subj.q_up)[~upper], 0)
+        np.testing.assert_array_equal(np.diff(subj.q_low)[upper], 0)
+        scaler = (subj.sim_drift / (subj.q_up - subj.q_low))[subj.q_up != subj.q_low]
+        np.testing.assert_allclose(scaler, scaler.iloc[0])
+
+        # and choices the boundary probabilities of the DDM
+        va = np.where(data.sim_drift == 0, 1e-10, data.sim_drift * 1.5)
+        p_upper = (1 - np.exp(-va)) / (1 - np.exp(-2 * va))
+        self.assertLess(np.abs(data.response.mean() - p_upper.mean()), 0.05)
+
+    def test_gen_rand_rlssm_data_MAB_RWupdate(self):
+        kwargs = dict(size=50, p_upper=0.8, p_lower=0.2, subjs=10, random_state=2)
+        data = hddm.generate.gen_rand_rlssm_data_MAB_RWupdate(
+            "angle", [2.0, 1.5, 0.5, 0.3, 0.2], [0.3], **kwargs
+        )
+        self.assertEqual(data.shape, (500, 9))
+        self.assertTrue(np.all(data.rt > 0.3))
+        np.testing.assert_array_equal(data.subj_idx, np.repeat(np.arange(10), 50))
+
+        # subjects are simulated in lockstep, reproducibly under a seed
+        data_again = hddm.generate.gen_rand_rlssm_data_MAB_RWupdate(
+            "angle", [2.0, 1.5, 0.5, 0.3, 0.2], [0.3], **kwargs
+        )
+        pd.testing.assert_frame_equal(data, data_again)
+
+        # Q-values follow the Rescorla-Wagner updates of the simulated choices
+        subj = data[data.subj_idx == 4]
+        upper = subj.response.values[:-1] == 1
+        q_up, feedback = subj.q_up.values[:-1][upper], subj.feedback.values[:-1][upper]
+        np.testing.assert_allclose(
+            subj.q_up.values[1:][upper], q_up + 0.3 * (feedback - q_up)
+        )
+        np.testing.assert_allclose(subj.sim_drift, 2.0 * (subj.q_up - subj.q_low))
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import hddm
 import os
 import shutil
@@ -171,6 +172,39 @@ class ModelLoad(unittest.TestCase):
                 print("Skipping n > 2 choice models for this test for now !")
         pass
 
+    def test_regressor_logp(self):
+        def id_link(x):
+            return x
+
+        # The observed nodes get the regression rows as reg_positions
+        model_ = hddm.HDDMnnRegressor(
+            self.cav_data,
+            [{"model": "v ~ 1 + theta", "link_func": id_link}],
+            include=hddm.model_config.model_config["ddm"]["hddm_include"],
+            model="ddm",
+        )
+        self.assertTrue(np.isfinite(model_.mcmc().logp))
+
+        data = hddm.generate.gen_rand_rlssm_reg_data_MAB_RWupdate(
+            "angle",
+            [2.0, 1.5, 0.5, 0.3, 0.2],
+            [0.3],
+            neural=0.2,
+            size=20,
+            p_upper=0.8,
+            p_lower=0.2,
+            subjs=2,
+        )
+        data["q_init"] = 0.5
+        model_ = hddm.HDDMnnRLRegressor(
+            data,
+            [{"model": "a ~ 1 + neural_reg", "link_func": id_link}],
+            model="angle",
+            rl_rule="RWupdate",
+            include=["v", "a", "t", "z", "theta", "rl_alpha"],
+        )
+        self.assertTrue(np.isfinite(model_.mcmc().logp))
+
 
 if __name__ == "__main__":
     unittest.main()
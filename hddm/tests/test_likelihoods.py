@@ -126,6 +126,36 @@ class TestWfpt(unittest.TestCase):
             )
         ), "wiener_like_simple should have returned -np.Inf"
 
+    def test_wiener_like_multi(self):
+        np.random.seed(123)
+        size = 100
+        v = (rand(size) - 0.5) * 4
+        a, z, t = 2.0, 0.4, 0.3
+        rts = (rand(size) * 2 + t + 0.1) * np.sign(rand(size) - 0.5)
+        rts[:2] = [999.0, -999.0]
+
+        multi_logp = hddm.wfpt.wiener_like_multi(
+            rts, v, 0, a, z, 0, t, 0, 1e-4, ["v"], p_outlier=0.05, w_outlier=0.1
+        )
+
+        p_ub = (np.exp(-2 * a * z * v[:2]) - 1) / (np.exp(-2 * a * v[:2]) - 1)
+        summed_logp = np.log(p_ub[0]) + np.log(1 - p_ub[1])
+        for i in range(2, size):
+            summed_logp += hddm.wfpt.wiener_like(
+                rts[i : i + 1], v[i], 0, a, z, 0, t, 0, 1e-4,
+                p_outlier=0.05, w_outlier=0.1,
+            )
+
+        np.testing.assert_almost_equal(multi_logp, summed_logp)
+
+        # Scalar parameters are broadcast without copying
+        params = hddm.wfpt.multi_params_matrix(size, 1.0, 0, a, z, 0, t, 0)
+        self.assertEqual(params.strides[0], 0)
+        np.testing.assert_almost_equal(
+            hddm.wfpt.wiener_like_multi_array(rts[2:], params[2:], 1e-4),
+            hddm.wfpt.wiener_like(rts[2:], 1.0, 0, a, z, 0, t, 0, 1e-4),
+        )
+
     def test_pdf_sv(self, samples=50):
         """Test if our wfpt pdf_sv implementation produces the same value as numerical integration over v"""
         func = lambda v_i, value, err, v, sv, z, a: hddm.wfpt.full_pdf(
@@ -548,5 +578,107 @@ class TestWfptFull(unittest.TestCase):
             st = 0.1
 
 
+class TestCdfdif(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(123)
+        n_sets = 5
+        self.params = {
+            "v": (rand(n_sets) - 0.5) * 4,
+            "sv": rand(n_sets) * 0.4 + 0.1,
+            "a": 1.5 + rand(n_sets),
+            "z": 0.4 + rand(n_sets) * 0.2,
+            "sz": rand(n_sets) * 0.2,
+            "t": 0.2 + rand(n_sets) * 0.2,
+            "st": rand(n_sets) * 0.2,
+            "p_outlier": rand(n_sets) * 0.1,
+        }
+        self.x = np.linspace(-3, 3, 61)
+
+    def test_cdf_matches_pdf(self):
+        for i in range(2):
+            params = {name: value[i] for name, value in self.params.items()}
+            del params["p_outlier"]
+            cdf = hddm.cdfdif.dmat_cdf_array(
+                self.x, p_outlier=0, w_outlier=0.1, **params
+            )
+            pdf = lambda x: hddm.wfpt.full_pdf(x, err=1e-8, **params)
+            for x, y in zip(self.x[::10], cdf[::10]):
+                np.testing.assert_almost_equal(y, quad(pdf, -10, x, limit=200)[0], 3)
+
+    def test_batch(self):
+        cdfs = hddm.cdfdif.dmat_cdf_batch(self.x, w_outlier=0.1, **self.params)
+        self.assertEqual(cdfs.shape, (5, self.x.shape[0]))
+        for i in range(5):
+            params = {name: value[i] for name, value in self.params.items()}
+            np.testing.assert_array_equal(
+                cdfs[i], hddm.cdfdif.dmat_cdf_array(self.x, w_outlier=0.1, **params)
+            )
+
+        # scalars broadcast against the arrays
+        params = dict(self.params, sv=0.2)
+        cdfs = hddm.cdfdif.dmat_cdf_batch(self.x, w_outlier=0.1, **params)
+        self.assertEqual(cdfs.shape, (5, self.x.shape[0]))
+
+        params = dict(self.params, z=np.array([0.5, 0.5, 0.5, 0.5, 1.2]))
+        self.assertRaises(
+            ValueError,
+            hddm.cdfdif.dmat_cdf_batch,
+            self.x,
+            w_outlier=0.1,
+            **params
+        )
+
+
+class TestCDFCache(unittest.TestCase):
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        calls = []
+        compute = lambda value: lambda: calls.append(value) or value
+
+        key = (("a", 2.0), ("v", 1.0), 5)
+        self.assertEqual(cache.get(key, compute(1)), 1)
+        self.assertEqual(cache.get(key, compute(2)), 1)
+        cache.get("b", compute(3))
+        cache.get(key, compute(4))
+        cache.get("c", compute(5))  # evicts "b", the least recently used
+        self.assertEqual(cache.get("b", compute(6)), 6)
+        self.assertEqual(calls, [1, 3, 5, 6])
+        self.assertEqual(
+            cache.info(), {"hits": 2, "misses": 4, "maxsize": 2, "size": 2}
+        )
+
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(cache.info()["hits"], 0)
+
+        # cached arrays are shared and read-only
+        x, cdf = cache.get("d", lambda: (np.arange(3.0), np.ones(3)))
+        self.assertFalse(x.flags.writeable or cdf.flags.writeable)
+        self.assertRaises(ValueError, cdf.__setitem__, 0, 0.0)
+
+    def test_theoretical_quantiles(self):
+        data, params = hddm.generate.gen_rand_data(size=200, subjs=1)
+        m = hddm.HDDM(data)
+        node = m.get_observeds()["node"][0]
+
+        cdf_cache.clear()
+        q_lower, q_upper, p_upper = node.theoretical_quantiles()
+        self.assertEqual(cdf_cache.info()["misses"], 1)
+        quantiles = node.theoretical_quantiles()
+        self.assertEqual(cdf_cache.info()["hits"], 1)
+        np.testing.assert_array_equal(quantiles[0], q_lower)
+        np.testing.assert_array_equal(quantiles[1], q_upper)
+        self.assertEqual(quantiles[2], p_upper)
+
+        x, cdf = node.cdf_vec()
+        self.assertFalse(x.flags.writeable or cdf.flags.writeable)
+
+        # a changed parameter is a new entry, however small the change
+        m.nodes_db.loc["v", "node"].value += 1e-9
+        node.theoretical_quantiles()
+        self.assertEqual(cdf_cache.info()["misses"], 2)
+
+
 if __name__ == "__main__":
     print("Run nosetest.")
@@ -0,0 +1,148 @@
+import unittest
+import inspect
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+import hddm
+from hddm.utils import *
+
+
+class QuadraticNetwork(object):
+    """Deterministic stand-in for a LAN: log-likelihood is minus the squared norm of each input row."""
+
+    def predict_on_batch(self, data):
+        return -np.sum(np.square(data), axis=1, keepdims=True).astype(np.float32)
+
+
+def likelihood_from_str(fun_str, fun_name):
+    namespace = {"hddm": hddm, "np": np, "warnings": warnings}
+    make_likelihood_fun_from_str(fun_str, namespace)
+    return namespace[fun_name]
+
+
+class TestCompiledMLPLikelihoods(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.wiener_params = {"w_outlier": 0.1}
+        self.network = QuadraticNetwork()
+        self.size = 50
+        self.data = pd.DataFrame(
+            {
+                "rt": (np.random.rand(self.size) + 0.3).astype(np.float32),
+                "response": np.random.choice([-1.0, 1.0], self.size).astype(
+                    np.float32
+                ),
+                "covariate": np.random.randn(self.size),
+            },
+            index=np.arange(self.size) * 2 + 7,
+        )
+
+    def test_basic(self):
+        config = deepcopy(hddm.model_config.model_config["angle"])
+        params = dict(zip(config["params"], config["params_default"]))
+
+        like_str = likelihood_from_str(
+            make_likelihood_str_mlp(config=config, wiener_params=self.wiener_params),
+            "custom_likelihood",
+        )
+        like_fun = make_likelihood_fun_mlp(
+            config=config, wiener_params=self.wiener_params
+        )
+
+        self.assertEqual(
+            inspect.getfullargspec(like_fun).args,
+            inspect.getfullargspec(like_str).args,
+        )
+        for p_outlier in [0.0, 0.05]:
+            # Repeated calls reuse the cached buffers
+            for _ in range(2):
+                np.testing.assert_almost_equal(
+                    like_fun(
+                        self.data, p_outlier=p_outlier, network=self.network, **params
+                    ),
+                    like_str(
+                        self.data, p_outlier=p_outlier, network=self.network, **params
+                    ),
+                    decimal=4,
+                )
+
+    def test_regression(self):
+        config = deepcopy(hddm.model_config.model_config["angle"])
+        config["indirect_betas"] = {
+            "v_beta": {"links_to": {"v": "covariate"}},
+        }
+        params = dict(zip(config["params"], config["params_default"]))
+        params["v_beta"] = 0.1
+        # Regression outcome covers more trials (e.g. a whole subject) than the observed node
+        index = np.arange(2 * self.size) + 7
+        params["v"] = pd.Series(np.random.randn(2 * self.size) * 0.1, index=index)
+        param_links = {param: set() for param in config["params"]}
+        param_links_betas = {param: set() for param in config["params"]}
+        param_links_betas["v"].add(("v_beta", "covariate"))
+
+        kwargs = dict(
+            config=config,
+            wiener_params=self.wiener_params,
+            param_links=param_links,
+            param_links_betas=param_links_betas,
+        )
+        like_str = likelihood_from_str(
+            make_reg_likelihood_str_mlp(**kwargs), "custom_likelihood_reg"
+        )
+        like_fun = make_reg_likelihood_fun_mlp(**kwargs)
+
+        # reg_positions is passed by KnodeRegressObserved and has to be declared
+        # for PyMC2 to accept it as a parent
+        self.assertEqual(
+            inspect.getfullargspec(partial(like_fun, network=self.network)).args,
+            inspect.getfullargspec(like_str).args + ["reg_positions"],
+        )
+        for _ in range(2):
+            np.testing.assert_almost_equal(
+                like_fun(
+                    self.data, reg_outcomes={"v"}, network=self.network, **params
+                ),
+                like_str(
+                    self.data, reg_outcomes={"v"}, network=self.network, **params
+                ),
+                decimal=4,
+            )
+
+        # Array valued regression outcome aligned by positions computed at build time
+        reg_params = dict(params, v=params["v"].values)
+        for reg_positions in [
+            {"v": np.arange(self.size) * 2},
+            {"v": slice(0, 2 * self.size, 2)},
+        ]:
+            np.testing.assert_almost_equal(
+                like_fun(
+                    self.data,
+                    reg_outcomes={"v"},
+                    reg_positions=reg_positions,
+                    network=self.network,
+                    **reg_params
+                ),
+                like_str(
+                    self.data, reg_outcomes={"v"}, network=self.network, **params
+                ),
+                decimal=4,
+            )
+            np.testing.assert_array_equal(
+                align_reg_outcome(
+                    reg_params["v"], reg_positions, "v", self.data.index
+                ),
+                align_reg_outcome(params["v"], None, "v", self.data.index),
+            )
+
+        # Boundary violations of the regression outcome
+        params["v"] = params["v"] + 100
+        self.assertEqual(
+            like_fun(self.data, reg_outcomes={"v"}, network=self.network, **params),
+            -np.inf,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
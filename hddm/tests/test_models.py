@@ -1,7 +1,10 @@
 from copy import copy
 import itertools
+import json
 import kabuki
 import os
+import shutil
+import tempfile
 
 import unittest
 import pymc as pm
@@ -94,6 +97,49 @@ class TestSingleBreakdown(unittest.TestCase):
 
         return model.mc
 
+    def test_HDDM_construction(self):
+        params = {
+            "A": {"v": 0.5, "a": 2.0, "t": 0.3},
+            "B": {"v": 1.0, "a": 2.0, "t": 0.3},
+        }
+        data, _ = hddm.generate.gen_rand_data(params, size=10, subjs=3)
+        # Subjects and conditions are not contiguous in the data
+        data = pd.DataFrame(data).sample(frac=1, random_state=1)
+        model = hddm.HDDM(data, depends_on={"v": "condition"})
+
+        for subj, condition in itertools.product(range(3), ["A", "B"]):
+            node = model.nodes_db.loc["wfpt(%s).%d" % (condition, subj)]["node"]
+            rows = model.data[
+                (model.data.subj_idx == subj) & (model.data.condition == condition)
+            ]
+            pd.testing.assert_frame_equal(node.value, rows[["rt"]])
+            self.assertEqual(
+                node.parents["v"].__name__, "v_subj(%s).%d" % (condition, subj)
+            )
+
+        report = model.construction_report()
+        self.assertEqual(list(report.columns), ["knode", "nodes", "seconds"])
+        self.assertEqual(report.set_index("knode").loc["wfpt", "nodes"], 6)
+
+    def test_HDDM_construction_float_depends(self):
+        params = {
+            "A": {"v": 0.5, "a": 2.0, "t": 0.3},
+            "B": {"v": 1.0, "a": 2.0, "t": 0.3},
+        }
+        data, _ = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        data = pd.DataFrame(data)
+        data["cond"] = np.where(data.condition == "A", 0.1, 0.2)
+        model = hddm.HDDM(data, depends_on={"v": "cond"})
+        nodes_db = pd.concat([knode.nodes_db for knode in model.knodes])
+        self.assertIn("wfpt(0.1).0.0", nodes_db.index)
+
+        # Same node names and tags as kabuki's Knode.create()
+        for knode in model.knodes:
+            kabuki.Knode.create(knode)
+        kabuki_nodes_db = pd.concat([knode.nodes_db for knode in model.knodes])
+        self.assertEqual(list(nodes_db.index), list(kabuki_nodes_db.index))
+        self.assertEqual(list(nodes_db.tag), list(kabuki_nodes_db.tag))
+
     def test_HDDM_split_std(self):
         data, _ = hddm.generate.gen_rand_data(
             {
@@ -180,6 +226,106 @@ class TestSingleBreakdown(unittest.TestCase):
             os.remove("test.db")
             os.remove("test.model")
 
+    def test_HDDM_load_skeleton(self):
+        params = hddm.generate.gen_rand_params(include=["z"])
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        model = hddm.HDDM(data, include=["z"])
+        model.sample(50)
+
+        for data_fname in [None, "test.csv"]:
+            model.save_skeleton("test.skeleton", data_fname=data_fname)
+
+            m_load = hddm.load("test.skeleton")
+            self.assertEqual(list(m_load.nodes_db.index), list(model.nodes_db.index))
+
+            m_load = hddm.load("test.skeleton", warm_start=True)
+            for name, node in model.iter_stochastics():
+                np.testing.assert_allclose(
+                    m_load.nodes_db.loc[name, "node"].value, node["node"].value
+                )
+            m_load.sample(10)
+            os.remove("test.skeleton")
+        os.remove("test.csv")
+
+    def test_HDDM_columnar_db(self):
+        params = hddm.generate.gen_rand_params(include=["z"])
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        dbname = tempfile.mkdtemp()
+        model = hddm.HDDM(data, include=["z"])
+        model.mcmc(db="columnar", dbname=dbname).db.chunk_size = 7
+        model.sample(50, burn=10)
+        self.assertEqual(len(model.nodes_db.loc["v", "node"].trace()), 40)
+        stats = model.gen_stats()
+
+        m_load = hddm.HDDM(data, include=["z"])
+        m_load.load_db(dbname, db="columnar")
+        for name, node in model.iter_stochastics():
+            np.testing.assert_array_equal(
+                m_load.nodes_db.loc[name, "node"].trace(), node["node"].trace()
+            )
+        np.testing.assert_allclose(m_load.gen_stats()["mean"], stats["mean"])
+
+        model.save("test.model")
+        m_pickle = hddm.load("test.model")
+        np.testing.assert_array_equal(
+            m_pickle.nodes_db.loc["a", "node"].trace(),
+            model.nodes_db.loc["a", "node"].trace(),
+        )
+        os.remove("test.model")
+        shutil.rmtree(dbname)
+
+    def test_HDDM_online_stats(self):
+        params = hddm.generate.gen_rand_params(include=["z"])
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        model = hddm.HDDM(data, include=["z"])
+        model.sample(200, burn=10, online_stats=True)
+        self.assertEqual(model.online_stats.n, 190)
+        online = model.gen_stats()
+
+        model.online_stats = None
+        stats = model.gen_stats()
+        np.testing.assert_allclose(online["mean"], stats["mean"])
+        np.testing.assert_allclose(online["std"], stats["std"])
+        np.testing.assert_allclose(online["50q"], stats["50q"], atol=0.1)
+        self.assertTrue(online["mc err"].isnull().all())
+
+    def test_HDDM_telemetry(self):
+        params = hddm.generate.gen_rand_params(include=["z"])
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        model = hddm.HDDM(data, include=["z"])
+        model.sample(20, telemetry=True, telemetry_log="test.log")
+
+        nodes = model.telemetry.node_report().set_index("node")
+        self.assertTrue((nodes.loc[["wfpt.0", "wfpt.1"], "evaluations"] > 0).all())
+        steps = model.telemetry.step_method_report()
+        self.assertTrue((steps["steps"] == 20).all())
+        self.assertIn("SliceStep", set(steps["class"]))
+
+        with open("test.log") as f:
+            log = [json.loads(line) for line in f]
+        self.assertEqual(set(log[-1]["nodes"]), set(nodes.index))
+        os.remove("test.log")
+
+        model.sample(10)
+        self.assertIsNone(model.telemetry)
+
+    def test_HDDM_telemetry_metropolis(self):
+        params = hddm.generate.gen_rand_params()
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=2)
+        model = hddm.HDDM(data)
+        model.mcmc()
+        node = model.nodes_db.loc["a", "node"]
+        model.mc.remove_step_method(model.mc.step_method_dict[node])
+        model.mc.use_step_method(pm.Metropolis, node)
+
+        # Metropolis.tune() resets the counters every tune_interval steps
+        for i in range(2):
+            model.sample(150, tune_interval=50, telemetry=True)
+            steps = model.telemetry.step_method_report().set_index("step_method")
+            metropolis = steps.loc["Metropolis_a"]
+            self.assertEqual(metropolis["steps"], 150)
+            self.assertEqual(metropolis["accepted"] + metropolis["rejected"], 150)
+
     def test_HDDMTruncated_distributions(self):
         params = hddm.generate.gen_rand_params()
         data, params_subj = hddm.generate.gen_rand_data(subjs=4, params=params, size=10)
@@ -387,6 +533,22 @@ class TestHDDMRegressor(unittest.TestCase):
             len(np.unique(m.nodes_db.loc["wfpt.0"]["node"].parents["v"].value)), 1
         )
 
+    def test_shared_design_matrix(self):
+        params = hddm.generate.gen_rand_params()
+        data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=4)
+        # Subjects are not contiguous in the data
+        data = pd.DataFrame(data).sample(frac=1, random_state=1)
+        data["cov"] = np.random.randn(len(data))
+        m = hddm.HDDMRegressor(data, "v ~ cov", group_only_regressors=False)
+
+        for subj in range(4):
+            v = m.nodes_db.loc["wfpt.%d" % subj]["node"].parents["v"]
+            design_matrix = np.column_stack(
+                [np.ones(10), m.data.loc[v.reg_index, "cov"]]
+            )
+            args = [arg.value for arg in v.parents["args"]]
+            np.testing.assert_allclose(v.value, design_matrix.dot(args))
+
     def test_link_func_on_z(self):
         params = hddm.generate.gen_rand_params()
         data, params_true = hddm.generate.gen_rand_data(params, size=10, subjs=4)
@@ -689,6 +851,50 @@ def test_posterior_plots_breakdown():
     hddm.utils.post_pred_stats(data, ppc)
 
 
+def test_ppc_stats_array():
+    np.random.seed(1)
+    x = np.random.randn(50, 40) + 0.3
+    x[0] = np.abs(x[0])  # no lower boundary responses
+    x[1, :5] = np.nan
+    stats = hddm.utils.gen_ppc_stats()
+    expected = np.array([[func(row) for func in stats.values()] for row in x])
+    np.testing.assert_allclose(hddm.utils.ppc_stats_array(x), expected)
+    np.testing.assert_allclose(hddm.utils.ppc_stats_array(x[2]), expected[2])
+
+
+def test_post_pred_stats_streaming():
+    np.random.seed(1)
+    data, _ = hddm.generate.gen_rand_data(size=100, subjs=2)
+    m = hddm.HDDM(data)
+    m.sample(200, burn=10)
+    n_nodes = len(m.get_observeds())
+    stats = hddm.utils.gen_ppc_stats()
+
+    spill_path = os.path.join(tempfile.mkdtemp(), "ppc.csv")
+    sampled_stats = hddm.utils.post_pred_stats_streaming(
+        m,
+        samples=5,
+        call_compare=False,
+        spill_path=spill_path,
+        chunk_size=2,
+        progress_bar=False,
+    )
+    assert sampled_stats.shape == (n_nodes * 5, len(stats))
+
+    # the statistics are those of the spilled datasets
+    spilled = pd.read_csv(spill_path)
+    assert len(spilled) == len(data) * 5
+    assert list(spilled.columns) == ["rt", "response", "node", "sample"]
+    for (node, sample), sim_data in spilled.groupby(["node", "sample"]):
+        np.testing.assert_allclose(
+            sampled_stats.loc[(node, sample)].values,
+            [func(sim_data["rt"].values) for func in stats.values()],
+        )
+
+    evals = hddm.utils.post_pred_stats_streaming(m, samples=5, progress_bar=False)
+    assert list(evals.index) == list(stats.keys())
+
+
 class TestRecovery(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super(TestRecovery, self).__init__(*args, **kwargs)
@@ -699,6 +905,30 @@ class TestRecovery(unittest.TestCase):
     def runTest(self):
         return
 
+    def test_run_recovery_study(self):
+        from hddm.diag import run_recovery_study
+
+        param_sets = [hddm.generate.gen_rand_params() for _ in range(3)]
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            results = run_recovery_study(
+                param_sets[:2], path, size=100, seed=1, resume=False
+            )
+            self.assertEqual(list(results["task"]), [0, 1])
+            for name in ("v", "a", "t"):
+                np.testing.assert_allclose(
+                    results[name + "_true"], [p[name] for p in param_sets[:2]]
+                )
+                self.assertIn(name + "_est", results.columns)
+
+            # Resuming only fits the missing parameter set
+            resumed = run_recovery_study(param_sets, path, size=100, seed=1)
+            self.assertEqual(list(resumed["task"]), [0, 1, 2])
+            pd.testing.assert_frame_equal(resumed.iloc[:2], results)
+        finally:
+            os.remove(path)
+
 
 def extend_params(params):
     # Find list
@@ -3,6 +3,7 @@ import itertools
 import glob
 import os
 
+import time
 import unittest
 import pymc as pm
 import numpy as np
@@ -153,6 +154,71 @@ def test_gsquare_recovery_single_subject_from_true_starting_point():
     )
 
 
+def quantile_objective_model(seed=1, subjs=1):
+    """model with several conditions and all inter-trial variabilities"""
+    np.random.seed(seed)
+    include = set(["a", "v", "t", "z", "sv", "sz", "st"])
+    cond_params, _ = hddm.generate.gen_rand_params(
+        include=include, cond_dict={"v": [0, 0.5, 0.75, 1.0]}
+    )
+    samples, _ = hddm.generate.gen_rand_data(cond_params, size=200, subjs=subjs)
+    return hddm.models.HDDM(samples, include=include, depends_on={"v": "condition"})
+
+
+def test_quantile_objective_matches_nodes():
+    h = quantile_objective_model()
+    obs_nodes = h.get_observeds()["node"]
+    objective = hddm.likelihoods.QuantileObjective(obs_nodes)
+    for method in ("chisquare", "gsquare"):
+        node_scores = [getattr(obs, method)() for obs in obs_nodes]
+        np.testing.assert_allclose(objective.scores(method), node_scores)
+
+    # parameters out of the support
+    theta = objective.parameters()
+    theta[0, 3] = 1.5
+    np.testing.assert_equal(objective.scores("chisquare", theta)[0], np.inf)
+    np.testing.assert_equal(objective("gsquare", theta), np.inf)
+
+
+def benchmark_quantile_objective(n_evals=100, seed=1):
+    """
+    time the chi^2 objective over all observed nodes,
+    evaluated by the nodes' chisquare() methods and by QuantileObjective.
+    """
+    h = quantile_objective_model(seed=seed)
+    obs_nodes = h.get_observeds()["node"]
+    objective = hddm.likelihoods.QuantileObjective(obs_nodes)
+
+    tic = time.time()
+    for i in range(n_evals):
+        node_score = sum([obs.chisquare() for obs in obs_nodes])
+    node_time = time.time() - tic
+
+    tic = time.time()
+    for i in range(n_evals):
+        score = objective("chisquare")
+    objective_time = time.time() - tic
+
+    np.testing.assert_allclose(score, node_score)
+    print(
+        "chisquare objective: nodes %.4fs, QuantileObjective %.4fs, speedup %.1fx"
+        % (node_time, objective_time, node_time / objective_time)
+    )
+    return node_time / objective_time
+
+
+def test_optimize_subjects_in_parallel():
+    h = quantile_objective_model(subjs=3)
+    results = {}
+    for n_jobs in (1, 2):
+        np.random.seed(1)
+        results[n_jobs] = h.optimize_subjects(
+            method="chisquare", n_runs=1, n_jobs=n_jobs
+        )
+    assert list(results[1].index) == [0, 1, 2]
+    pd.testing.assert_frame_equal(results[1], results[2])
+
+
 def recovery_with_outliers(repeats=10, seed=1, random_p_outlier=True):
     """
     recover parameters with outliers for single subjects model.
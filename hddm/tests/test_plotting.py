@@ -3,6 +3,7 @@ import hddm
 import os
 import shutil
 import numpy as np
+import pandas as pd
 
 
 class NetworkInspectorTest(unittest.TestCase):
@@ -72,5 +73,62 @@ class NetworkInspectorTest(unittest.TestCase):
             )
 
 
+class PPCRLSSMTest(unittest.TestCase):
+    def test_gen_ppc_rlssm(self):
+        data = pd.DataFrame(
+            [
+                (subj, cond, trial)
+                for subj in range(3)
+                for cond in (0, 1)
+                for trial in range(1, 16)
+            ],
+            columns=["subj_idx", "split_by", "trial"],
+        )
+        traces = pd.DataFrame(
+            {
+                p + "_subj." + str(subj): np.random.uniform(low, high, size=20)
+                for p, low, high in [
+                    ("v", 1.0, 3.0),
+                    ("a", 1.0, 2.0),
+                    ("z", 0.4, 0.6),
+                    ("t", 0.2, 0.4),
+                    ("rl_alpha", -1.0, 1.0),
+                ]
+                for subj in range(3)
+            }
+        )
+        args = (
+            "ddm",
+            hddm.model_config.model_config["ddm"],
+            "RWupdate",
+            hddm.model_config_rl.model_config_rl["RWupdate"],
+            data,
+            traces,
+            2,
+            {0: 0.2, 1: 0.3},
+            {0: 0.8, 1: 0.7},
+        )
+
+        ppc_data = hddm.plotting.gen_ppc_rlssm(*args, random_state=1)
+        self.assertEqual(ppc_data.shape, (2 * len(data), 7))
+        np.testing.assert_array_equal(ppc_data.trial, np.tile(data.trial, 2))
+        np.testing.assert_array_equal(ppc_data.subj_idx, np.tile(data.subj_idx, 2))
+        np.testing.assert_array_equal(ppc_data.samp, np.repeat([1, 2], len(data)))
+        self.assertTrue(np.all(ppc_data.rt > 0))
+
+        # The output only depends on the seed and the batches, not on the number
+        # of processes
+        ppc_data_batches = hddm.plotting.gen_ppc_rlssm(
+            *args, random_state=1, batch_size=1
+        )
+        ppc_data_parallel = hddm.plotting.gen_ppc_rlssm(
+            *args, random_state=1, batch_size=1, n_jobs=2
+        )
+        pd.testing.assert_frame_equal(ppc_data_batches, ppc_data_parallel)
+        pd.testing.assert_frame_equal(
+            ppc_data, hddm.plotting.gen_ppc_rlssm(*args, random_state=1)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
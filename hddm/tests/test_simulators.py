@@ -1,7 +1,10 @@
 import unittest
 import numpy as np
 import pandas as pd
+from scipy import stats
 import hddm
+import cddm_data_simulation
+import ssms.basic_simulators.boundary_functions as bf
 
 # Help on function simulator_h_c in module hddm.simulators.hddm_dataset_generators:
 
@@ -156,6 +159,252 @@ class SimulatorTests(unittest.TestCase):
             self.assertTrue(np.unique(data[fixed_at_default_tmp]).shape[0], 1)
 
 
+    def test_simulator_h_c_columns(self):
+        conditions = {"c_one": ["high", "low"], "c_two": ["high", "low"]}
+        (
+            data,
+            full_parameter_dict,
+        ) = hddm.simulators.hddm_dataset_generators.simulator_h_c(
+            n_subjects=self.n_subjects,
+            n_trials_per_subject=self.n_samples_per_subject,
+            model="ddm_hddm_base",
+            conditions=conditions,
+            depends_on={"v": ["c_one", "c_two"]},
+            regression_models=["z ~ covariate_name"],
+            regression_covariates={
+                "covariate_name": {"type": "categorical", "range": (0, 4)}
+            },
+            group_only=["z"],
+            fixed_at_default=["t"],
+        )
+        self.assertEqual(
+            list(data.columns),
+            ["rt", "response", "subj_idx", "covariate_name", "c_one", "c_two"]
+            + hddm.model_config.model_config["ddm_hddm_base"]["params"],
+        )
+        self.assertEqual(
+            data.shape[0], 4 * self.n_subjects * self.n_samples_per_subject
+        )
+        self.assertEqual(data["subj_idx"].dtype.name, "category")
+        self.assertTrue(data["response"].isin([0, 1]).all())
+
+        # Every subject / condition block carries its own drift
+        for (subj, c_one, c_two), block in data.groupby(
+            ["subj_idx", "c_one", "c_two"], observed=True
+        ):
+            self.assertEqual(block.shape[0], self.n_samples_per_subject)
+            np.testing.assert_array_equal(
+                block["v"],
+                full_parameter_dict["v_subj(%s.%s).%s" % (c_one, c_two, subj)],
+            )
+
+    def test_hddm_preprocess(self):
+        out = hddm.simulators.simulator(
+            theta=[1.0, 1.5, 0.5, 0.3], model="ddm", n_samples=100
+        )
+        data = hddm.simulators.hddm_preprocess(out, add_model_parameters=True)
+        self.assertEqual(
+            list(data.columns), ["rt", "response", "subj_idx", "v", "a", "z", "t"]
+        )
+        np.testing.assert_array_equal(data["rt"], out[0].ravel())
+        np.testing.assert_array_equal(
+            data["response"], np.maximum(out[1].ravel(), 0)
+        )
+        np.testing.assert_array_equal(data["a"], 1.5)
+
+
+class CddmSimulatorTests(unittest.TestCase):
+    def setUp(self):
+        self.n_samples = 2000
+        self.n_trials = 3
+        self.params = [
+            np.array([0.5, 1.0, -0.5], dtype=np.float32),  # v
+            np.array([1.5, 1.0, 1.2], dtype=np.float32),  # a
+            np.array([0.5, 0.4, 0.6], dtype=np.float32),  # z
+            np.array([0.3, 0.2, 0.1], dtype=np.float32),  # t
+        ]
+
+    def simulate(self, random_state):
+        return cddm_data_simulation.ddm_flexbound(
+            *self.params,
+            n_samples=self.n_samples,
+            n_trials=self.n_trials,
+            boundary_fun=lambda t: np.ones(t.shape),
+            random_state=random_state
+        )
+
+    def test_philox_known_answers(self):
+        # Known-answer vectors of the Random123 reference implementation
+        kat = [
+            ([0, 0, 0, 0], [0, 0], [0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8]),
+            (
+                [0xFFFFFFFF] * 4,
+                [0xFFFFFFFF] * 2,
+                [0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD],
+            ),
+            (
+                [0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344],
+                [0xA4093822, 0x299F31D0],
+                [0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1],
+            ),
+        ]
+        for counter, key, expected in kat:
+            np.testing.assert_array_equal(
+                cddm_data_simulation.philox_block(counter, key), expected
+            )
+
+    def test_random_state(self):
+        rts, choices, _ = self.simulate(random_state=1)
+        self.assertEqual(rts.shape, (self.n_samples, self.n_trials, 1))
+        self.assertTrue(np.all(rts > self.params[3][None, :, None]))
+        self.assertTrue(set(np.unique(choices)) <= {-1, 1})
+
+        rts_same, choices_same, _ = self.simulate(random_state=1)
+        np.testing.assert_array_equal(rts, rts_same)
+        np.testing.assert_array_equal(choices, choices_same)
+
+        rts_other, _, _ = self.simulate(random_state=2)
+        self.assertFalse(np.array_equal(rts, rts_other))
+
+        # Without a random_state the key is drawn from numpy's global state
+        np.random.seed(10)
+        rts_global, _, _ = self.simulate(random_state=None)
+        np.random.seed(10)
+        rts_global_same, _, _ = self.simulate(random_state=None)
+        np.testing.assert_array_equal(rts_global, rts_global_same)
+
+    def test_streams_per_trial(self):
+        # Each (trial, sample) has its own stream: simulating a trial on its
+        # own reproduces the corresponding trial of a joint simulation
+        rts, _, _ = self.simulate(random_state=5)
+        rts_first, _, _ = cddm_data_simulation.ddm_flexbound(
+            *[param[:1] for param in self.params],
+            n_samples=self.n_samples,
+            n_trials=1,
+            boundary_fun=lambda t: np.ones(t.shape),
+            random_state=5
+        )
+        np.testing.assert_array_equal(rts[:, :1], rts_first)
+
+    def test_boundary_families(self):
+        # Analytic boundaries in the simulation loop match the precomputed table
+        # used for arbitrary boundary functions
+        def angle_table(t=1, theta=1):
+            return bf.angle(t=t, theta=theta)
+
+        theta = np.array([0.1, 0.5, 0.9], dtype=np.float32)
+        out = {}
+        for name, boundary_fun in (("analytic", bf.angle), ("table", angle_table)):
+            out[name] = cddm_data_simulation.ddm_flexbound(
+                *self.params,
+                n_samples=200,
+                n_trials=self.n_trials,
+                boundary_fun=boundary_fun,
+                boundary_multiplicative=False,
+                boundary_params={"theta": theta},
+                random_state=3
+            )
+        np.testing.assert_array_equal(out["analytic"][0], out["table"][0])
+        np.testing.assert_array_equal(out["analytic"][1], out["table"][1])
+        np.testing.assert_allclose(
+            out["analytic"][2]["boundary"], out["table"][2]["boundary"], atol=1e-5
+        )
+
+        t_s = np.arange(0, 2, 0.01).astype(np.float32)
+        table = cddm_data_simulation.boundary_table(
+            self.params[1],
+            t_s,
+            bf.weibull_cdf,
+            boundary_params={"alpha": np.ones(3), "beta": np.array([1.0, 2.0, 3.0])},
+        )
+        self.assertEqual(table.shape, (self.n_trials, t_s.shape[0]))
+        np.testing.assert_allclose(
+            table[2], self.params[1][2] * np.exp(-t_s / 3.0), rtol=1e-5
+        )
+
+
+class ExactSimulatorTests(unittest.TestCase):
+    def setUp(self):
+        self.n_samples = 20000
+        # v, a, z, t, sv, sz, st
+        self.params = [
+            (1.0, 2.0, 0.5, 0.3, 0.0, 0.0, 0.0),
+            (-2.0, 1.2, 0.3, 0.2, 0.0, 0.0, 0.0),
+            (0.0, 3.0, 0.5, 0.1, 0.0, 0.0, 0.0),
+            (0.5, 1.5, 0.6, 0.3, 1.0, 0.2, 0.1),
+        ]
+
+    def test_exact_matches_full_pdf(self):
+        x = np.linspace(-30, 30, 600001)
+        for v, a, z, t, sv, sz, st in self.params:
+            rts, choices = hddm.simulators.exact_wfpt_sample(
+                v, a, z, t, sv, sz, st, size=self.n_samples, random_state=1
+            )
+            cdf = np.cumsum(hddm.wfpt.pdf_array(x, v, sv, a, z, sz, t, st, 1e-8, False))
+            cdf *= x[1] - x[0]
+
+            p_upper = 1 - np.interp(0, x, cdf)
+            se = np.sqrt(p_upper * (1 - p_upper) / self.n_samples)
+            self.assertLess(abs(choices.mean() - p_upper), 4 * se + 1e-4)
+
+            signed_rts = np.where(choices == 1, rts, -rts)
+            p_value = stats.kstest(signed_rts, lambda q: np.interp(q, x, cdf)).pvalue
+            self.assertGreater(p_value, 1e-3)
+
+    def test_exact_backend(self):
+        theta = np.tile(
+            hddm.model_config.model_config["full_ddm_hddm_base"]["params_default"],
+            reps=(3, 1),
+        )
+        rts, choices, metadata = hddm.simulators.simulator(
+            theta=theta,
+            model="full_ddm_hddm_base",
+            n_samples=50,
+            backend="exact",
+            random_state=2,
+        )
+        self.assertEqual(rts.shape, (50, 3, 1))
+        self.assertEqual(rts.shape, choices.shape)
+        self.assertTrue(np.all(rts > 0))
+        self.assertTrue(set(np.unique(choices)) <= {-1, 1})
+        self.assertEqual(metadata["model"], "full_ddm_hddm_base")
+
+        rts_again = hddm.simulators.simulator(
+            theta=theta,
+            model="full_ddm_hddm_base",
+            n_samples=50,
+            backend="exact",
+            random_state=2,
+        )[0]
+        np.testing.assert_array_equal(rts, rts_again)
+
+        self.assertRaises(
+            ValueError,
+            hddm.simulators.simulator,
+            theta=np.ones((3, 5)),
+            model="angle",
+            backend="exact",
+        )
+
+    def test_exact_backend_response_coding(self):
+        # Lower boundary responses are coded as -1, as by the ssms backend
+        configs = [("ddm_hddm_base", "ssms"), ("ddm_hddm_base", "exact")]
+        configs += [("full_ddm_hddm_base", "exact")]
+        for model, backend in configs:
+            sim_out = hddm.simulators.simulator(
+                theta=hddm.model_config.model_config[model]["params_default"],
+                model=model,
+                n_samples=200,
+                backend=backend,
+            )
+            self.assertEqual(sim_out[2]["possible_choices"], [-1, 1])
+            self.assertEqual(sorted(np.unique(sim_out[1])), [-1, 1])
+            for keep_negative_responses, coding in [(True, [-1, 1]), (False, [0, 1])]:
+                data = hddm.simulators.hddm_preprocess(
+                    sim_out, keep_negative_responses=keep_negative_responses
+                )
+                self.assertEqual(sorted(data["response"].unique()), coding)
+
 if __name__ == "__main__":
     unittest.main()
 
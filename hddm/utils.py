@@ -5,6 +5,10 @@ import hddm
 import kabuki
 import pandas as pd
 import string
+import inspect
+import pickle
+import weakref
+from collections import OrderedDict
 from copy import deepcopy
 
 from kabuki.analyze import post_pred_gen, post_pred_compare_stats
@@ -486,6 +490,449 @@ def make_reg_likelihood_str_mlp_basic(
     return fun_str
 
 
+# Compiled likelihood factories
+# These build the same likelihoods as the make_*_str_mlp* functions above, but as closures.
+# Parameter positions are resolved once, and the network input matrix, casted data columns
+# and regression-outcome index positions are kept per observed dataset, so that a likelihood
+# call neither allocates nor goes through pandas indexing.
+
+
+def _likelihood_signature(value_name, arg_names, defaults, var_keyword=False):
+    """Build the signature PyMC2 / kabuki read the parent names from."""
+    kind = inspect.Parameter.POSITIONAL_OR_KEYWORD
+    parameters = [inspect.Parameter(value_name, kind)]
+    parameters += [inspect.Parameter(name, kind) for name in arg_names]
+    parameters += [
+        inspect.Parameter(name, kind, default=default) for name, default in defaults
+    ]
+    if var_keyword:
+        parameters.append(inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD))
+    return inspect.Signature(parameters)
+
+
+def _bind_likelihood_args(arg_names, defaults, args, kwargs):
+    bound = dict(defaults)
+    bound.update(zip(arg_names, args))
+    bound.update(kwargs)
+    return bound
+
+
+class _ObservedCache(object):
+    """Per observed dataset state of a compiled likelihood.
+
+    Entries are created by build(value) the first time a dataset is seen and
+    are dropped once the dataset is garbage collected.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._entries = {}
+
+    def __call__(self, value):
+        key = id(value)
+        entry = self._entries.get(key)
+        if entry is None or entry["ref"]() is not value:
+            entry = self._build(value)
+            entry["ref"] = weakref.ref(value, lambda _, key=key: self._entries.pop(key, None))
+            entry["positions"] = {}
+            self._entries[key] = entry
+        return entry
+
+
+def _gather_reg_outcome(entry, name, param, index, reg_positions=None):
+    """Align a regression outcome to the rows of an observed dataset.
+
+    Positions computed when the model was built (reg_positions) are used if
+    available. Otherwise the integer positions are computed once per dataset and
+    reused as long as the index of the regression outcome does not change. If
+    the outcome is already aligned, its values are returned without a copy.
+    """
+    if reg_positions is not None and name in reg_positions:
+        return np.asarray(param)[reg_positions[name]]
+
+    if not isinstance(param, pd.Series):
+        return param
+
+    cached = entry["positions"].get(name)
+    if cached is None or not (cached[0] is param.index or cached[0].equals(param.index)):
+        positions = param.index.get_indexer(index)
+        if np.any(positions < 0):
+            raise KeyError(
+                "Regression outcome %s is not defined for all observed trials." % name
+            )
+        if positions.shape[0] == param.shape[0] and np.array_equal(
+            positions, np.arange(positions.shape[0])
+        ):
+            positions = None
+        cached = (param.index, positions)
+        entry["positions"][name] = cached
+
+    if cached[1] is None:
+        return param.values
+    return param.values.take(cached[1])
+
+
+def align_reg_outcome(param, reg_positions, reg_outcome, index):
+    """Align the values of a regression outcome to the rows of an observed node.
+
+    reg_positions maps regression outcomes to the integer positions (or slice)
+    computed by KnodeRegressObserved at build time. Without positions, the
+    outcome is aligned by label, which requires a pandas.Series.
+    """
+    if reg_positions is None or reg_outcome not in reg_positions:
+        return param.loc[index].values
+    return np.asarray(param)[reg_positions[reg_outcome]]
+
+
+def make_likelihood_fun_mlp(config=None, wiener_params=None, fun_name="custom_likelihood"):
+    """Define a likelihood function that can be used as an mlp-likelihood
+    in the HDDMnn and HDDMnnStimCoding classes. Compiled counterpart of make_likelihood_str_mlp.
+
+    :Arguments:
+        config : dict <default = None>
+            Config dictionary for the model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config.
+    :Returns:
+        function:
+            The likelihood function as needed by HDDM to pass to PyMC2.
+            (Serves as a wrapper around the LAN forward pass)
+
+    """
+    params = list(config["params"])
+    n_params = len(params)
+    defaults = [
+        ("p_outlier", 0.0),
+        ("w_outlier", wiener_params["w_outlier"]),
+        ("network", None),
+    ]
+    arg_names = params + [name for name, _ in defaults]
+
+    def build(x):
+        data = np.zeros((x.shape[0], n_params + 2), dtype=np.float32)
+        data[:, n_params] = x["rt"].values
+        data[:, n_params + 1] = x["response"].values
+        return {"data": data}
+
+    observed = _ObservedCache(build)
+
+    def likelihood(x, *args, **kwargs):
+        bound = _bind_likelihood_args(arg_names, defaults, args, kwargs)
+        data = observed(x)["data"]
+        data[:, :n_params] = [bound[param] for param in params]
+        return hddm.wfpt.wiener_like_multi_nn_mlp(
+            data,
+            p_outlier=bound["p_outlier"],
+            w_outlier=bound["w_outlier"],
+            network=bound["network"],
+        )
+
+    likelihood.__name__ = fun_name
+    likelihood.__signature__ = _likelihood_signature("x", params, defaults)
+    return likelihood
+
+
+def make_likelihood_fun_mlp_rlssm(
+    model,
+    config=None,
+    config_rl=None,
+    wiener_params=None,
+    fun_name="custom_likelihood",
+):
+    """Define a likelihood function for RLSSMs. This can be used as an mlp-likelihood
+    in the HDDMnnRL class. Compiled counterpart of make_likelihood_str_mlp_rlssm.
+
+    :Arguments:
+        model : str
+            Name of the sequential sampling model used.
+        config : dict <default = None>
+            Config dictionary for the sequential sampling model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config.
+        config_rl : dict <default = None>
+            Config dictionary for the reinforcement learning model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config_rl.
+    :Returns:
+        function:
+            The likelihood function as needed by HDDM to pass to PyMC2.
+            (Serves as a wrapper around the LAN forward pass)
+
+    """
+    params_ssm = list(config["params"])
+    params_rl = list(config_rl["params"])
+    params_bnds = np.array(
+        [
+            list(config["param_bounds"][0]) + list(config_rl["param_bounds"][0]),
+            list(config["param_bounds"][1]) + list(config_rl["param_bounds"][1]),
+        ],
+        dtype=np.float64,
+    )
+    defaults = [
+        ("p_outlier", 0.0),
+        ("w_outlier", wiener_params["w_outlier"]),
+        ("network", None),
+    ]
+    arg_names = params_ssm + params_rl + [name for name, _ in defaults]
+
+    def build(x):
+        return {
+            "rt": x["rt"].values.astype(float),
+            "response": x["response"].values.astype(int),
+            "feedback": x["feedback"].values,
+            "split_by": x["split_by"].values.astype(int),
+            "q_init": x["q_init"].iloc[0],
+        }
+
+    observed = _ObservedCache(build)
+
+    def likelihood(x, *args, **kwargs):
+        bound = _bind_likelihood_args(arg_names, defaults, args, kwargs)
+        entry = observed(x)
+        return hddm.wfpt.wiener_like_rlssm_nn(
+            model,
+            entry["rt"],
+            entry["response"],
+            entry["feedback"],
+            entry["split_by"],
+            entry["q_init"],
+            np.array([bound[param] for param in params_ssm]),
+            np.array([bound[param] for param in params_rl]),
+            params_bnds=params_bnds,
+            network=bound["network"],
+            p_outlier=bound["p_outlier"],
+            w_outlier=bound["w_outlier"],
+        )
+
+    likelihood.__name__ = fun_name
+    likelihood.__signature__ = _likelihood_signature(
+        "x", params_ssm + params_rl, defaults
+    )
+    return likelihood
+
+
+def make_reg_likelihood_fun_mlp(
+    config=None,
+    wiener_params=None,
+    param_links=None,
+    param_links_betas=None,
+    fun_name="custom_likelihood_reg",
+):
+    """Define a likelihood function that can be used as a mlp-likelihood in the
+    HDDMnnRegressor class. Compiled counterpart of make_reg_likelihood_str_mlp
+    (and of make_reg_likelihood_str_mlp_basic if no param_links / param_links_betas are supplied).
+
+    :Arguments:
+        config : dict <default = None>
+            Config dictionary for the model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config.
+        param_links : dict <default = None>
+            Maps each parameter to the indirect regressors that are added to it.
+        param_links_betas : dict <default = None>
+            Maps each parameter to (indirect beta, covariate) tuples that are added to it.
+
+    :Returns:
+        function:
+            The likelihood function as needed by HDDM to pass to PyMC2.
+            (Serves as a wrapper around the LAN forward pass)
+
+    """
+    params = list(config["params"])
+    n_params = len(params)
+    fun_params = list(params)
+    if param_links is not None and "indirect_regressors" in config:
+        fun_params += list(config["indirect_regressors"].keys())
+    if param_links_betas is not None and "indirect_betas" in config:
+        fun_params += list(config["indirect_betas"].keys())
+
+    param_links = param_links or {}
+    param_links_betas = param_links_betas or {}
+    lower_bounds = list(config["param_bounds"][0])
+    upper_bounds = list(config["param_bounds"][1])
+    defaults = [
+        ("p_outlier", 0),
+        ("w_outlier", wiener_params["w_outlier"]),
+        ("reg_positions", None),
+    ]
+    arg_names = fun_params + ["reg_outcomes"] + [name for name, _ in defaults]
+
+    covariates = set(
+        covariate for links in param_links_betas.values() for _, covariate in links
+    )
+
+    def build(value):
+        data = np.zeros((value.shape[0], n_params + 2), dtype=np.float32)
+        data[:, n_params] = np.absolute(value["rt"].values)
+        data[:, n_params + 1] = value["response"].values
+        return {
+            "data": data,
+            "covariates": {
+                covariate: value[covariate].values for covariate in covariates
+            },
+        }
+
+    observed = _ObservedCache(build)
+
+    def likelihood(value, *args, **kwargs):
+        bound = _bind_likelihood_args(arg_names, defaults, args, kwargs)
+        reg_outcomes = bound["reg_outcomes"]
+        reg_positions = bound.get("reg_positions")
+        entry = observed(value)
+        data = entry["data"]
+
+        for cnt, param in enumerate(params):
+            if param in reg_outcomes:
+                data[:, cnt] = _gather_reg_outcome(
+                    entry, param, bound[param], value.index, reg_positions
+                )
+                for linked_indirect_regressor in param_links.get(param, ()):
+                    data[:, cnt] += _gather_reg_outcome(
+                        entry,
+                        linked_indirect_regressor,
+                        bound[linked_indirect_regressor],
+                        value.index,
+                        reg_positions,
+                    )
+                for linked_indirect_beta in param_links_betas.get(param, ()):
+                    data[:, cnt] += (
+                        bound[linked_indirect_beta[0]]
+                        * entry["covariates"][linked_indirect_beta[1]]
+                    )
+                if (data[:, cnt].min() < lower_bounds[cnt]) or (
+                    data[:, cnt].max() > upper_bounds[cnt]
+                ):
+                    warnings.warn("Boundary violation of regressor part.")
+                    return -np.inf
+            else:
+                data[:, cnt] = bound[param]
+
+        return hddm.wfpt.wiener_like_multi_nn_mlp(
+            data,
+            p_outlier=bound["p_outlier"],
+            w_outlier=bound["w_outlier"],
+            network=bound["network"],
+        )
+
+    likelihood.__name__ = fun_name
+    likelihood.__signature__ = _likelihood_signature(
+        "value", fun_params + ["reg_outcomes"], defaults, var_keyword=True
+    )
+    return likelihood
+
+
+def make_reg_likelihood_fun_mlp_basic_nn_rl(
+    model=None,
+    config=None,
+    config_rl=None,
+    wiener_params=None,
+    fun_name="custom_likelihood_reg",
+):
+    """Define a likelihood function that can be used as a mlp-likelihood in the
+    HDDMnnRLRegressor class. Compiled counterpart of make_reg_likelihood_str_mlp_basic_nn_rl.
+
+    :Arguments:
+        model : str
+            Name of the sequential sampling model used.
+        config : dict <default = None>
+            Config dictionary for the sequential sampling model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config.
+        config_rl : dict <default = None>
+            Config dictionary for the reinforcement learning model for which you would like to construct a custom
+            likelihood. In the style of what you find under hddm.model_config.
+
+    :Returns:
+        function:
+            The likelihood function as needed by HDDM to pass to PyMC2.
+            (Serves as a wrapper around the LAN forward pass)
+
+    """
+    params_ssm = list(config["params"])
+    params_rl = list(config_rl["params"])
+    n_params_ssm = len(params_ssm)
+    lower_bounds = list(config["param_bounds"][0])
+    upper_bounds = list(config["param_bounds"][1])
+    params_bnds = np.array(
+        [
+            lower_bounds + list(config_rl["param_bounds"][0]),
+            upper_bounds + list(config_rl["param_bounds"][1]),
+        ],
+        dtype=np.float64,
+    )
+    defaults = [
+        ("p_outlier", 0),
+        ("w_outlier", wiener_params["w_outlier"]),
+        ("reg_positions", None),
+    ]
+    arg_names = params_ssm + params_rl + ["reg_outcomes"] + [n for n, _ in defaults]
+
+    def build(value):
+        data = np.zeros((value.shape[0], n_params_ssm + 2), dtype=np.float32)
+        data[:, n_params_ssm] = np.absolute(value["rt"].values)
+        data[:, n_params_ssm + 1] = value["response"].values
+        return {
+            "data": data,
+            "rl_arr": np.zeros((value.shape[0], len(params_rl)), dtype=np.float32),
+            "rt": value["rt"].values.astype(float),
+            "response": value["response"].values.astype(int),
+            "feedback": value["feedback"].values,
+            "split_by": value["split_by"].values.astype(int),
+            "q_init": value["q_init"].iloc[0],
+        }
+
+    observed = _ObservedCache(build)
+
+    def likelihood(value, *args, **kwargs):
+        bound = _bind_likelihood_args(arg_names, defaults, args, kwargs)
+        reg_outcomes = bound["reg_outcomes"]
+        reg_positions = bound.get("reg_positions")
+        if "v" in reg_outcomes:
+            raise Exception("For RLSSM models, v cannot be the regression target.")
+
+        entry = observed(value)
+        data = entry["data"]
+        rl_arr = entry["rl_arr"]
+
+        for cnt, param in enumerate(params_ssm):
+            if param in reg_outcomes:
+                data[:, cnt] = _gather_reg_outcome(
+                    entry, param, bound[param], value.index, reg_positions
+                )
+                if (data[:, cnt].min() < lower_bounds[cnt]) or (
+                    data[:, cnt].max() > upper_bounds[cnt]
+                ):
+                    warnings.warn("Boundary violation of regressor part.")
+                    return -np.inf
+            else:
+                data[:, cnt] = bound[param]
+
+        for cnt, param in enumerate(params_rl):
+            if param in reg_outcomes:
+                rl_arr[:, cnt] = _gather_reg_outcome(
+                    entry, param, bound[param], value.index, reg_positions
+                )
+            else:
+                rl_arr[:, cnt] = bound[param]
+
+        # Note: wiener_like_rlssm_nn_reg overwrites the first column of data,
+        # which is refilled above on every call.
+        return hddm.wfpt.wiener_like_rlssm_nn_reg(
+            data,
+            rl_arr,
+            entry["rt"],
+            entry["response"],
+            entry["feedback"],
+            entry["split_by"],
+            entry["q_init"],
+            params_bnds=params_bnds,
+            network=bound["network"],
+            p_outlier=bound["p_outlier"],
+            w_outlier=bound["w_outlier"],
+        )
+
+    likelihood.__name__ = fun_name
+    likelihood.__signature__ = _likelihood_signature(
+        "value", params_ssm + params_rl + ["reg_outcomes"], defaults, var_keyword=True
+    )
+    return likelihood
+
+
 def flip_errors(data):
     """Flip sign for lower boundary responses.
 
@@ -738,6 +1185,51 @@ def EZ(pc, vrt, mrt, s=1):
     return (v, a, ter)
 
 
+def load(fname, warm_start=False):
+    """Load a model saved by model.save() or model.save_skeleton().
+
+    :Arguments:
+        fname : str
+            File name of the saved model.
+
+    :Optional:
+        warm_start : bool <default=False>
+            Set the nodes to their last values and keep the tuning state of
+            the step methods, so that the next call of model.sample() continues
+            the saved chain and needs no burn-in. For a model saved by
+            model.save(), the next run starts a new trace database.
+
+    :Returns:
+        model
+    """
+    with open(fname, "rb") as f:
+        model = pickle.load(f)
+
+    if isinstance(model, dict) and "hddm_skeleton" in model:
+        skeleton = model
+        data = skeleton["data"]
+        if data is None:
+            data = pd.read_csv(skeleton["data_fname"])
+        model = skeleton["model_class"](
+            data, *skeleton["args"], **skeleton["kwargs"]
+        )
+        if not warm_start:
+            return model
+
+        model.set_values(skeleton["values"])
+        if skeleton["slice_widths"] is not None:
+            model.slice_widths = skeleton["slice_widths"]
+        model._step_method_states = skeleton["step_methods"]
+
+    elif warm_start and model.mc is not None:
+        # Node values were restored from the database by load_db()
+        state = model.mc.db.getstate() or {}
+        model._step_method_states = state.get("step_methods", {})
+        model.mc = None
+
+    return model
+
+
 def hddm_parents_trace(model, obs_node, idx):
     """Return the parents' value of an wfpt node in index 'idx' (the
     function is used by ppd_test)
@@ -787,8 +1279,6 @@ def gen_ppc_stats(quantiles=(10, 30, 50, 70, 90)):
     :Returns:
         OrderedDict mapping statistic name -> function
     """
-    from collections import OrderedDict
-
     stats = OrderedDict()
     stats["accuracy"] = lambda x: np.mean(x > 0)
 
@@ -815,6 +1305,69 @@ def gen_ppc_stats(quantiles=(10, 30, 50, 70, 90)):
     return stats
 
 
+def ppc_stats_array(x, quantiles=(10, 30, 50, 70, 90)):
+    """Compute all gen_ppc_stats() statistics of one or many simulated datasets.
+
+    Each dataset is sorted once; accuracy, means, stds and quantiles of both
+    boundaries are then read off the sorted values.
+
+    :Arguments:
+        x : numpy.ndarray
+            Flipped RTs (negative for lower boundary responses), either one dataset
+            of shape (n_trials,) or many of shape (n_sims, n_trials).
+
+    :Optional:
+        quantiles : sequence
+            Percentiles as in gen_ppc_stats().
+
+    :Returns:
+        numpy.ndarray of shape (n_stats,) or (n_sims, n_stats), the columns ordered
+        as the keys of gen_ppc_stats(quantiles).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    x_2d = np.atleast_2d(x)
+    n_sims, n_trials = x_2d.shape
+    rows = np.arange(n_sims)[:, None]
+    percent = np.asarray(quantiles, dtype=np.float64) / 100.0
+
+    # negative RTs come first, then the positive ones, NaNs are sorted last
+    x_sorted = np.sort(x_2d, axis=1)
+    n_lb = np.sum(x_2d < 0, axis=1)
+    n_ub = np.sum(x_2d > 0, axis=1)
+    start_ub = n_lb + np.sum(x_2d == 0, axis=1)
+
+    def boundary_stats(values, n, first):
+        # mean, std and quantiles of the n values starting at the sorted position first
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.sum(values, axis=1) / n
+            std = np.sqrt(
+                np.sum(np.where(values != 0, values - mean[:, None], 0) ** 2, axis=1)
+                / n
+            )
+        # linear interpolation between closest ranks (as scoreatpercentile)
+        rank = percent[None, :] * np.maximum(n - 1, 0)[:, None]
+        lower = np.floor(rank).astype(np.intp)
+        upper = np.minimum(lower + 1, np.maximum(n - 1, 0)[:, None])
+        at = lambda idx: np.abs(x_sorted[rows, np.clip(first(idx), 0, n_trials - 1)])
+        q = at(lower) + (at(upper) - at(lower)) * (rank - lower)
+        q[n == 0] = np.nan
+        mean[n == 0] = np.nan
+        std[n == 0] = np.nan
+        return np.column_stack((mean, std, q))
+
+    # the lower boundary's absolute RTs are sorted in reverse
+    ub = boundary_stats(
+        np.where(x_2d > 0, x_2d, 0), n_ub, lambda idx: start_ub[:, None] + idx
+    )
+    lb = boundary_stats(
+        np.where(x_2d < 0, x_2d, 0), n_lb, lambda idx: n_lb[:, None] - 1 - idx
+    )
+    accuracy = n_ub / float(n_trials)
+
+    out = np.column_stack((accuracy, ub, lb))
+    return out[0] if x.ndim == 1 else out
+
+
 def post_pred_stats(data, sim_datasets, **kwargs):
     """Calculate a set of summary statistics over posterior predictives.
 
@@ -841,12 +1394,151 @@ def post_pred_stats(data, sim_datasets, **kwargs):
     data = flip_errors(data)
     sim_datasets = flip_errors(sim_datasets)
 
+    if "stats" not in kwargs and not kwargs.get("plot", False):
+        # default statistics, computed for all samples of a node at once
+        stats = gen_ppc_stats()
+        sampled_stats = _ppc_stats_of_sim_datasets(sim_datasets["rt"])
+        if not kwargs.get("call_compare", True):
+            return sampled_stats
+        data_stats = OrderedDict(
+            zip(stats.keys(), ppc_stats_array(np.asarray(data["rt"])))
+        )
+        return post_pred_compare_stats(
+            sampled_stats, data_stats, evals=kwargs.get("evals", None)
+        )
+
     if "stats" not in kwargs:
         kwargs["stats"] = gen_ppc_stats()
 
     return kabuki.analyze.post_pred_stats(data["rt"], sim_datasets["rt"], **kwargs)
 
 
+def _ppc_stats_of_sim_datasets(sim_rts):
+    """gen_ppc_stats() of every (node, sample) of post_pred_gen output."""
+    names = list(gen_ppc_stats().keys())
+    sampled_stats = []
+    for node, node_rts in sim_rts.groupby(level=0, sort=False):
+        samples = node_rts.index.get_level_values(1)
+        sample_keys, sample_sizes = np.unique(samples, return_counts=True)
+        if np.all(sample_sizes == sample_sizes[0]) and np.all(np.diff(samples) >= 0):
+            # every sample is a row of a (n_samples, n_trials) array
+            stats = ppc_stats_array(
+                np.asarray(node_rts).reshape(len(sample_keys), sample_sizes[0])
+            )
+        else:
+            stats = np.array(
+                [
+                    ppc_stats_array(np.asarray(node_rts[samples == key]))
+                    for key in sample_keys
+                ]
+            )
+        sampled_stats.append(
+            pd.DataFrame(
+                stats,
+                columns=names,
+                index=pd.MultiIndex.from_product(
+                    [[node], sample_keys], names=sim_rts.index.names[:2]
+                ),
+            )
+        )
+    return pd.concat(sampled_stats)
+
+
+def post_pred_stats_streaming(
+    model,
+    samples=500,
+    stats=None,
+    evals=None,
+    call_compare=True,
+    spill_path=None,
+    chunk_size=50,
+    progress_bar=True,
+):
+    """Posterior predictive statistics computed while the datasets are simulated.
+
+    Gives the same result as post_pred_stats(model.data, post_pred_gen(model, samples)),
+    but each simulated dataset is reduced to its summary statistics as soon as it is
+    drawn, so memory only grows with nodes x samples x statistics, not with the
+    number of trials.
+
+    :Arguments:
+        model : kabuki.Hierarchical
+            Model whose observed nodes are simulated.
+
+    :Optional:
+        samples : int <default=500>
+            Number of posterior samples (simulated datasets) per node.
+        stats : dict
+            Mapping statistic name -> function of the flipped RTs (default gen_ppc_stats()).
+        evals : dict
+            Evaluations of the statistics, see kabuki.analyze.post_pred_compare_stats.
+        call_compare : bool <default=True>
+            If False, return the statistics of every (node, sample) instead of their evaluation.
+        spill_path : str <default=None>
+            If given, the raw simulated datasets are appended to this csv file
+            (with columns node and sample) in chunks of chunk_size samples.
+        chunk_size : int <default=50>
+            Number of simulated datasets buffered before they are written to spill_path.
+        progress_bar : bool <default=True>
+            Display progress bar while sampling.
+
+    :Returns:
+        pandas.DataFrame with the evaluation of every statistic (or, if call_compare
+        is False, the statistics of every simulated dataset indexed by node and sample).
+
+    """
+    if stats is None:
+        stats = gen_ppc_stats()
+        compute_stats = ppc_stats_array
+    else:
+        compute_stats = lambda rts: [func(rts) for func in stats.values()]
+
+    observeds = list(model.iter_observeds())
+    if progress_bar:
+        bar = tqdm.tqdm(total=len(observeds) * samples)
+
+    sampled_stats = {}
+    spill_header = True
+    for name, obs in observeds:
+        node = obs["node"]
+        node_stats = np.empty((samples, len(stats)))
+        spill_buffer = []
+
+        for i_sample in range(samples):
+            kabuki.analyze._parents_to_random_posterior_sample(node)
+            sim_data = flip_errors(node.random())
+            rts = np.asarray(sim_data["rt"])
+            node_stats[i_sample] = compute_stats(rts)
+
+            if spill_path is not None:
+                spill_buffer.append(sim_data.assign(node=name, sample=i_sample))
+                if len(spill_buffer) == chunk_size or i_sample == samples - 1:
+                    pd.concat(spill_buffer).to_csv(
+                        spill_path,
+                        mode="w" if spill_header else "a",
+                        header=spill_header,
+                        index=False,
+                    )
+                    spill_header = False
+                    spill_buffer = []
+
+            if progress_bar:
+                bar.update()
+
+        sampled_stats[name] = pd.DataFrame(node_stats, columns=list(stats.keys()))
+
+    if progress_bar:
+        bar.close()
+
+    sampled_stats = pd.concat(sampled_stats, names=["node", "sample"])
+    if not call_compare:
+        return sampled_stats
+
+    data = np.asarray(flip_errors(model.data)["rt"])
+    data_stats = OrderedDict(zip(stats.keys(), compute_stats(data)))
+    return post_pred_compare_stats(sampled_stats, data_stats, evals=evals)
+
+
 def plot_posteriors(model, **kwargs):
     """Generate posterior plots for each parameter.
 
@@ -2,20 +2,31 @@ from setuptools import setup
 from setuptools import Extension
 #from setuptools.dist import Distribution
 #Distribution().fetch_build_eggs(['Cython>=0.29', 'numpy>=1.20']) # necessary to allow cold install into empty environment / otherwise complains about lack of numpy
+import sys
 import numpy as np
 
+# OpenMP for the prange loops of wfpt, the simulators and cdfdif (Apple clang ships without it)
+if sys.platform == 'win32':
+    openmp_args = ['/openmp']
+elif sys.platform == 'darwin':
+    openmp_args = []
+else:
+    openmp_args = ['-fopenmp']
+
 try:
     from Cython.Build import cythonize
     ext_modules = cythonize([
-                             Extension('wfpt', ['src/wfpt.pyx'], language='c++'), # uncomment for OSX: , extra_compile_args=['-stdlib=libc++'], extra_link_args=['-stdlib=libc++', "-mmacosx-version-min=10.9"]),
-                             Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.pyx', 'src/cdfdif.c']),
+                             Extension('wfpt', ['src/wfpt.pyx'], language='c++', extra_compile_args=openmp_args, extra_link_args=openmp_args), # uncomment for OSX: , extra_compile_args=['-stdlib=libc++'], extra_link_args=['-stdlib=libc++', "-mmacosx-version-min=10.9"]),
+                             Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.pyx', 'src/cdfdif.c'], extra_compile_args=openmp_args, extra_link_args=openmp_args),
+                             Extension('cddm_data_simulation', ['src/cddm_data_simulation.pyx'], language='c++', extra_compile_args=openmp_args, extra_link_args=openmp_args),
                             ], 
                             compiler_directives = {"language_level": "3"})
 
 except ImportError:
     ext_modules = [
-                   Extension('wfpt', ['src/wfpt.cpp'], language='c++'),
-                   Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.c', 'src/cdfdif.c']),
+                   Extension('wfpt', ['src/wfpt.cpp'], language='c++', extra_compile_args=openmp_args, extra_link_args=openmp_args),
+                   Extension('cdfdif_wrapper', ['src/cdfdif_wrapper.c', 'src/cdfdif.c'], extra_compile_args=openmp_args, extra_link_args=openmp_args),
+                   # cddm_data_simulation ships without generated sources and needs Cython
                    ]
 
 setup(
@@ -5,9 +5,14 @@
 # cython: initializedcheck=False
 
 # Functions for DDM data simulation
+#
+# Noise is drawn from a counter-based generator (see philox.pxi) with one
+# stream per (trial, sample), so that the sample loops run in parallel (prange)
+# and results only depend on random_state, not on the number of threads.
 import cython
-from libc.stdlib cimport rand, RAND_MAX
-from libc.math cimport log, sqrt, pow, fmax, atan, sin, cos, tan, M_PI, M_PI_2
+from cython.parallel import prange, parallel
+from libc.stdlib cimport malloc, free
+from libc.math cimport log, exp, sqrt, pow, fmax, atan, sin, cos, tan, M_PI, M_PI_2
 
 import numpy as np
 cimport numpy as np
@@ -15,22 +20,16 @@ from time import time
 import inspect
 import pickle
 
-DTYPE = np.float32
-
-# Method to draw random samples from a gaussian
-cdef float random_uniform():
-    cdef float r = rand()
-    return r / RAND_MAX
+include "philox.pxi"
 
-cdef float random_exponential():
-    return - log(random_uniform())
+DTYPE = np.float32
 
-cdef float random_stable(float alpha_diff):
+cdef float random_stable(philox_state* state, float alpha_diff) nogil:
     cdef float eta, u, w, x
     # chi = - tan(M_PI_2 * alpha_diff)
 
-    u = M_PI * (random_uniform() - 0.5)
-    w = random_exponential()
+    u = M_PI * (philox_uniform(state) - 0.5)
+    w = philox_exponential(state)
 
     if alpha_diff == 1.0:
         eta = M_PI_2 # useless but kept to remain faithful to wikipedia entry
@@ -39,63 +38,138 @@ cdef float random_stable(float alpha_diff):
         x = (sin(alpha_diff * u) / (pow(cos(u), 1 / alpha_diff))) * pow(cos(u - (alpha_diff * u)) / w, (1.0 - alpha_diff) / alpha_diff)
     return x
 
-cdef float[:] draw_random_stable(int n, float alpha_diff):
-    cdef int i
-    cdef float[:] result = np.zeros(n, dtype = DTYPE)
-
-    for i in range(n):
-        result[i] = random_stable(alpha_diff)
-    return result
-
-cdef float random_gaussian():
-    cdef float x1, x2, w
-    w = 2.0
-
-    while(w >= 1.0):
-        x1 = 2.0 * random_uniform() - 1.0
-        x2 = 2.0 * random_uniform() - 1.0
-        w = x1 * x1 + x2 * x2
-
-    w = ((-2.0 * log(w)) / w) ** 0.5
-    return x1 * w
-
-cdef int sign(float x):
+cdef inline int sign(float x) nogil:
     return (x > 0) - (x < 0)
 
-cdef float csum(float[:] x):
+cdef inline float csum(float* x, int n) nogil:
     cdef int i
-    cdef int n = x.shape[0]
     cdef float total = 0
-    
+
     for i in range(n):
         total += x[i]
-    
-    return total
-
-## @cythonboundscheck(False)
-cdef void assign_random_gaussian_pair(float[:] out, int assign_ix):
-    cdef float x1, x2, w
-    w = 2.0
-
-    while(w >= 1.0):
-        x1 = (2.0 * random_uniform()) - 1.0
-        x2 = (2.0 * random_uniform()) - 1.0
-        w = (x1 * x1) + (x2 * x2)
 
-    w = ((-2.0 * log(w)) / w) ** 0.5
-    out[assign_ix] = x1 * w
-    out[assign_ix + 1] = x2 * w # this was x2 * 2 ..... :0 
+    return total
 
-# @cythonboundscheck(False)
-cdef float[:] draw_gaussian(int n):
-    # Draws standard normal variables - need to have the variance rescaled
+cdef inline int argmax(float* x, int n) nogil:
     cdef int i
-    cdef float[:] result = np.zeros(n, dtype=DTYPE)
-    for i in range(n // 2):
-        assign_random_gaussian_pair(result, i * 2)
-    if n % 2 == 1:
-        result[n - 1] = random_gaussian()
-    return result
+    cdef int i_max = 0
+    for i in range(1, n):
+        if x[i] > x[i_max]:
+            i_max = i
+    return i_max
+
+cdef inline void set_key(uint32_t* key, random_state):
+    key_tmp = philox_key(random_state)
+    key[0] = key_tmp[0]
+    key[1] = key_tmp[1]
+
+# Boundaries --------------------------------------------------------------------------------------
+# The flexbound simulators run all (trial, sample) paths in a single parallel loop.
+# Boundaries of the constant, angle and weibull_cdf families are evaluated analytically
+# inside that loop from per-trial parameters, any other boundary_fun is evaluated once
+# for all trials into a (n_trials x n_steps) table.
+
+cdef enum:
+    BOUNDARY_TABLE = 0
+    BOUNDARY_CONSTANT = 1
+    BOUNDARY_ANGLE = 2
+    BOUNDARY_WEIBULL = 3
+
+cdef struct boundary_spec:
+    int kind
+    bint multiplicative
+    double delta_t
+    Py_ssize_t n_steps
+    float* a
+    float* p0
+    float* p1
+    float* table
+
+# boundary_fun.__name__ --> (kind, boundary_params it takes)
+ANALYTIC_BOUNDARIES = {'constant': (BOUNDARY_CONSTANT, ()),
+                       'angle': (BOUNDARY_ANGLE, ('theta',)),
+                       'weibull_cdf': (BOUNDARY_WEIBULL, ('alpha', 'beta'))}
+
+cdef inline float boundary_at(boundary_spec* bnd, Py_ssize_t k, Py_ssize_t ix) nogil:
+    # Boundary of trial k after ix steps
+    cdef double t_ix, f
+
+    if bnd.kind == BOUNDARY_TABLE:
+        if ix >= bnd.n_steps:
+            ix = bnd.n_steps - 1
+        return bnd.table[k * bnd.n_steps + ix]
+
+    t_ix = ix * bnd.delta_t
+    if bnd.kind == BOUNDARY_ANGLE:
+        f = t_ix * bnd.p0[k]
+    elif bnd.kind == BOUNDARY_WEIBULL:
+        f = exp(- pow(t_ix / bnd.p1[k], bnd.p0[k]))
+    else:
+        f = 1.0
+
+    if bnd.multiplicative:
+        return bnd.a[k] * f
+    return bnd.a[k] + f
+
+def boundary_table(a, t_s, boundary_fun, boundary_multiplicative = True, boundary_params = {}):
+    """Boundaries of all trials as a (n_trials x n_steps) array.
+
+    boundary_fun is called once with t of shape (1, n_steps) and the per-trial
+    boundary_params as columns, falling back to one call per trial if it does
+    not broadcast.
+    """
+    a = np.asarray(a, dtype = DTYPE)
+    n_trials = a.shape[0]
+    try:
+        values = boundary_fun(t = t_s[None, :], **{key: np.asarray(value)[:, None] for key, value in boundary_params.items()})
+        values = np.broadcast_to(values, (n_trials, t_s.shape[0]))
+    except (ValueError, TypeError, IndexError):
+        values = np.stack([np.broadcast_to(boundary_fun(t = t_s, **{key: boundary_params[key][k] for key in boundary_params.keys()}), t_s.shape)
+                           for k in range(n_trials)])
+
+    if boundary_multiplicative:
+        return np.multiply(a[:, None], values).astype(DTYPE)
+    return np.add(a[:, None], values).astype(DTYPE)
+
+cdef tuple set_boundary(boundary_spec* bnd, a, t_s, float delta_t, boundary_fun, boundary_multiplicative, boundary_params):
+    # Fills bnd for all trials. Returns the boundary of the last trial (kept in the
+    # metadata of the simulators) and the arrays bnd points into, which have to stay
+    # alive while bnd is used.
+    a = np.ascontiguousarray(a, dtype = DTYPE)
+    cdef Py_ssize_t n_trials = a.shape[0]
+    kind, param_names = ANALYTIC_BOUNDARIES.get(getattr(boundary_fun, '__name__', None), (BOUNDARY_TABLE, ()))
+    if set(boundary_params.keys()) != set(param_names):
+        kind = BOUNDARY_TABLE
+
+    params = np.ones((2, max(n_trials, 1)), dtype = DTYPE)
+    table = np.zeros((1, 1), dtype = DTYPE)
+    if kind == BOUNDARY_ANGLE:
+        theta = np.asarray(boundary_params['theta'], dtype = np.float64)
+        params[0, :n_trials] = - np.sin(theta) / np.cos(theta)
+    elif kind == BOUNDARY_WEIBULL:
+        params[0, :n_trials] = boundary_params['alpha']
+        params[1, :n_trials] = boundary_params['beta']
+    elif kind == BOUNDARY_TABLE:
+        table = boundary_table(a, t_s, boundary_fun, boundary_multiplicative, boundary_params)
+
+    cdef float[::1] a_view = a
+    cdef float[:, ::1] params_view = params
+    cdef float[:, ::1] table_view = table
+
+    bnd.kind = kind
+    bnd.multiplicative = boundary_multiplicative
+    bnd.delta_t = delta_t
+    bnd.n_steps = t_s.shape[0]
+    bnd.a = &a_view[0] if n_trials > 0 else NULL
+    bnd.p0 = &params_view[0, 0]
+    bnd.p1 = &params_view[1, 0]
+    bnd.table = &table_view[0, 0]
+
+    if kind == BOUNDARY_TABLE:
+        boundary = table[n_trials - 1] if n_trials > 0 else None
+    else:
+        boundary = np.array([boundary_at(bnd, n_trials - 1, ix) for ix in range(t_s.shape[0])], dtype = DTYPE) if n_trials > 0 else None
+    return boundary, (a, params, table)
 
 # DUMMY TEST SIMULATOR ------------------------------------------------------------------------
 # Simulate (rt, choice) tuples from: SIMPLE DDM -----------------------------------------------
@@ -110,6 +184,7 @@ def test(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
          float max_t = 20, # maximum rt allowed
          int n_samples = 20000, # number of samples considered
          int n_trials = 10,
+         random_state = None, # seed material for the random number generator
          ):
 
     # Param views
@@ -128,32 +203,28 @@ def test(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
 
     cdef float y, t_particle
 
-    #cdef int n
     cdef Py_ssize_t n, k
-    cdef int m = 0
-    cdef int num_draws = int(max_t / delta_t + 1)
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-    
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
     for k in range(n_trials):
         # Loop over samples
-        for n in range(n_samples):
+        for n in prange(n_samples, nogil = True):
+            rng = philox_stream(rng_key, k, n)
             y = z_view[k] * a_view[k] # reset starting point
             t_particle = 0.0 # reset time
 
             # Random walker
-            while y <= a_view[k] and y >= 0 and t <= max_t:
-                y += v_view[k] * delta_t + sqrt_st * gaussian_values[m] # update particle position
-                t_particle += delta_t
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-
-            # Note that for purposes of consistency with Navarro and Fuss, 
+            while y <= a_view[k] and y >= 0 and t_particle <= max_t:
+                y = y + v_view[k] * delta_t + sqrt_st * philox_gaussian(&rng) # update particle position
+                t_particle = t_particle + delta_t
+
+            # Note that for purposes of consistency with Navarro and Fuss,
             # the choice corresponding the lower barrier is +1, higher barrier is -1
             rts_view[n, k, 0] = t_particle + t_view[k] # store rt
             choices_view[n, k, 0] = (-1) * sign(y) # store choice
-  
+
     return (rts, choices, {'v': v,
                            'a': a,
                            'z': z,
@@ -183,6 +254,7 @@ def full_ddm_hddm_base(np.ndarray[float, ndim = 1] v, # = 0,
                      float max_t = 20,
                      int n_samples = 20000,
                      int n_trials = 1,
+                     random_state = None,
                      ):
 
     # cdef int cov_length = np.max([v.size, a.size, w.size, t.size]).astype(int)
@@ -198,7 +270,7 @@ def full_ddm_hddm_base(np.ndarray[float, ndim = 1] v, # = 0,
 
     # Data-structs for trajectory storage
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:, :] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
@@ -210,59 +282,48 @@ def full_ddm_hddm_base(np.ndarray[float, ndim = 1] v, # = 0,
     cdef float delta_t_sqrt = sqrt(delta_t) # correct scalar so we can use standard normal samples for the brownian motion
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
-    # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
-    t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-
     cdef float y, t_particle, t_tmp
     cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
     cdef float drift_increment = 0.0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws) 
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
     # Loop over trials
-    for k in range(n_trials): 
+    for k in range(n_trials):
         # Loop over samples
-        for n in range(n_samples):
+        for n in prange(n_samples, nogil = True):
+            rng = philox_stream(rng_key, k, n)
+
             # initialize starting point
             y = (z_view[k] * (a_view[k]))  # reset starting position
-            
-            # get drift by random displacement of v 
-            drift_increment = (v_view[k] + sv_view[k] * gaussian_values[m]) * delta_t
-            t_tmp = t_view[k] + (2 * (random_uniform() - 0.5) * st_view[k])
-            
+
+            # get drift by random displacement of v
+            drift_increment = (v_view[k] + sv_view[k] * philox_gaussian(&rng)) * delta_t
+            t_tmp = t_view[k] + (2 * (philox_uniform(&rng) - 0.5) * st_view[k])
+
             # apply uniform displacement on y
-            y += 2 * (random_uniform() - 0.5) * sz_view[k]
-            
-            # increment m appropriately
-            m += 1
-            if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-            
+            y = y + 2 * (philox_uniform(&rng) - 0.5) * sz_view[k]
+
             t_particle = 0.0 # reset time
             ix = 0 # reset boundary index
-            
+
             if n == 0:
                 if k == 0:
                     traj_view[0, 0] = y
 
             # Random walker
             while y >= 0 and y <= a_view[k] and t_particle <= max_t:
-                y += drift_increment + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
+                y = y + drift_increment + (sqrt_st * philox_gaussian(&rng))
+                t_particle = t_particle + delta_t
+                ix = ix + 1
+
                 if n == 0:
                     if k == 0:
                         traj_view[ix, 0] = y
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
 
             rts_view[n, k, 0] = t_particle + t_tmp # Store rt
-            
+
             if y < 0:
                 choices_view[n, k, 0] = 0 # Store choice
             else:
@@ -300,6 +361,7 @@ def ddm(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
         float max_t = 20, # maximum rt allowed
         int n_samples = 20000, # number of samples considered
         int n_trials = 10,
+        random_state = None, # seed material for the random number generator
         ):
 
     # Param views
@@ -323,44 +385,41 @@ def ddm(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
 
     cdef float y, t_particle
 
-    #cdef int n
-    cdef Py_ssize_t n, k
-    cdef int m = 0
-    cdef int num_draws = int(max_t / delta_t + 1)
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-    
+    cdef Py_ssize_t n, k, ix
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
     for k in range(n_trials):
         # Loop over samples
-        for n in range(n_samples):
+        for n in prange(n_samples, nogil = True):
+            rng = philox_stream(rng_key, k, n)
             y = z_view[k] * a_view[k] # reset starting point
             t_particle = 0.0 # reset time
+            ix = 0
 
             if n == 0:
                 if k == 0:
                     traj_view[0, 0] = y
-            
+
             # Random walker
             while y <= a_view[k] and y >= 0 and t_particle <= max_t:
-                y += v_view[k] * delta_t + sqrt_st * gaussian_values[m] # update particle position
-                t_particle += delta_t
-                m += 1
+                y = y + v_view[k] * delta_t + sqrt_st * philox_gaussian(&rng) # update particle position
+                t_particle = t_particle + delta_t
+                ix = ix + 1
 
                 if n == 0:
                     if k == 0:
-                        traj_view[m, 0] = y
-
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+                        traj_view[ix, 0] = y
 
-            # Note that for purposes of consistency with Navarro and Fuss, 
+            # Note that for purposes of consistency with Navarro and Fuss,
             # the choice corresponding the lower barrier is +1, higher barrier is -1
             rts_view[n, k, 0] = t_particle + t_view[k] # store rt
             if y < 0:
                 choices_view[n, k, 0] = 0 # store choice
             else:
                 choices_view[n, k, 0] = 1 # store choice
-        
+
     return (rts, choices, {'v': v,
                            'a': a,
                            'z': z,
@@ -390,6 +449,7 @@ def ddm_cov(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
             float max_t = 20, # maximum rt allowed
             int n_samples = 1000, # number of samples considered
             int n_trials = 1,
+            random_state = None, # seed material for the random number generator
             ):
 
     #cdef int n_trials = np.max([v.size, a.size, w.size, t.size]).astype(int)
@@ -409,29 +469,25 @@ def ddm_cov(np.ndarray[float, ndim = 1] v, # drift by timestep 'delta_t'
 
     cdef float y, t_particle
 
-    # cdef int n
     cdef Py_ssize_t n
     cdef Py_ssize_t k
-    cdef int m = 0
-    cdef int num_draws = int(max_t / delta_t + 1)
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
     # Loop over samples
-    for n in range(n_samples):
+    for n in prange(n_samples, nogil = True):
         for k in range(n_trials):
+            rng = philox_stream(rng_key, k, n)
             y = z_view[k] * a_view[k] # reset starting point
             t_particle = 0.0 # reset time
 
             # Random walker
-            while y <= a[k] and y >= 0 and t_particle <= max_t:
-                y += v_view[k] * delta_t + sqrt_st * gaussian_values[m] # update particle position
-                t_particle += delta_t
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-
-            # Note that for purposes of consistency with Navarro and Fuss, 
+            while y <= a_view[k] and y >= 0 and t_particle <= max_t:
+                y = y + v_view[k] * delta_t + sqrt_st * philox_gaussian(&rng) # update particle position
+                t_particle = t_particle + delta_t
+
+            # Note that for purposes of consistency with Navarro and Fuss,
             # the choice corresponding the lower barrier is +1, higher barrier is -1
             rts_view[n, k, 0] = t_particle + t_view[k] # store rt
             choices_view[n, k, 0] = (-1) * sign(y) # store choice
@@ -463,6 +519,7 @@ def ddm_flexbound(np.ndarray[float, ndim = 1] v,
                   boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                   boundary_multiplicative = True,
                   boundary_params = {},
+                  random_state = None, # seed material for the random number generator
                   ):
 
     #cdef int cov_length = np.max([v.size, a.size, w.size, t.size]).astype(int)
@@ -474,7 +531,7 @@ def ddm_flexbound(np.ndarray[float, ndim = 1] v,
     cdef float[:] t_view = t
 
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:,:] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
@@ -487,56 +544,48 @@ def ddm_flexbound(np.ndarray[float, ndim = 1] v,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
 
     cdef float y, t_particle
-    cdef Py_ssize_t n 
+    cdef Py_ssize_t n
     cdef Py_ssize_t ix
-    cdef Py_ssize_t m = 0
-    cdef Py_ssize_t k
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-    cdef float[:] boundary_view = boundary
-    
-    # Loop over samples
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        for n in range(n_samples):
-            y = (-1) * boundary_view[0] + (z_view[k] * 2 * (boundary_view[0]))  # reset starting position 
-            t_particle = 0.0 # reset time
-            ix = 0 # reset boundary index
-            
+    cdef Py_ssize_t k, kn
+    cdef boundary_spec bnd
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
+        y = (-1) * boundary_at(&bnd, k, 0) + (z_view[k] * 2 * (boundary_at(&bnd, k, 0)))  # reset starting position
+        t_particle = 0.0 # reset time
+        ix = 0 # reset boundary index
+
+        # Can improve with less checks
+        if n == 0:
+            if k == 0:
+                traj_view[0, 0] = y
+
+        while (y >= (-1) * boundary_at(&bnd, k, ix)) and (y <= boundary_at(&bnd, k, ix)) and (t_particle <= max_t):
+            y = y + (v_view[k] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
+
             # Can improve with less checks
             if n == 0:
                 if k == 0:
-                    traj_view[0, 0] = y
+                    traj_view[ix, 0] = y
 
-            while (y >= (-1) * boundary_view[ix]) and (y <= boundary_view[ix]) and (t_particle <= max_t):
-                y += (v_view[k] * delta_t) + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
-                # Can improve with less checks
-                if n == 0:
-                    if k == 0:
-                        traj_view[ix, 0] = y
-                
-                # Can improve with less checks
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+        rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
+        choices_view[n, k, 0] = sign(y) # Store choice
 
-            rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
-            choices_view[n, k, 0] = sign(y) # Store choice
-    
     return (rts, choices,  {'v': v,
                             'a': a,
                             'z': z,
@@ -565,6 +614,7 @@ def ddm_flexbound_max(float v = 0.0,
                       boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                       boundary_multiplicative = True,
                       boundary_params = {},
+                      random_state = None, # seed material for the random number generator
                       ):
 
     rts = np.zeros((n_samples, 1), dtype = DTYPE)
@@ -577,18 +627,17 @@ def ddm_flexbound_max(float v = 0.0,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
     boundary = np.zeros(t_s.shape, dtype = DTYPE)
 
 
     cdef float y, t_particle
-    cdef Py_ssize_t n 
+    cdef Py_ssize_t n
     cdef Py_ssize_t ix
-    cdef Py_ssize_t m = 0
-    cdef Py_ssize_t k
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
     cdef float[:] boundary_view = boundary
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
     # Loop over samples
     # Precompute boundary evaluations
@@ -597,26 +646,21 @@ def ddm_flexbound_max(float v = 0.0,
     else:
         boundary[:] = np.add(a, boundary_fun(t = t_s, **boundary_params)).astype(DTYPE)
 
-    for n in range(n_samples):
-        y = (-1) * boundary_view[0] + (z * 2 * (boundary_view[0]))  # reset starting position 
+    for n in prange(n_samples, nogil = True):
+        rng = philox_stream(rng_key, 0, n)
+        y = (-1) * boundary_view[0] + (z * 2 * (boundary_view[0]))  # reset starting position
         t_particle = 0.0 # reset time
         ix = 0 # reset boundary index
 
         # Random walker
         while y >= (-1) * boundary_view[ix] and y <= boundary_view[ix] and t_particle <= max_t:
-            y += (v * delta_t) + (sqrt_st * gaussian_values[m])
-            t_particle += delta_t
-            ix += 1
-            m += 1
-            
-            # Can improve with less checks
-            if m == num_draws:
-                gaussian_values = draw_gaussian(num_draws)
-                m = 0
+            y = y + (v * delta_t) + (sqrt_st * philox_gaussian(&rng))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
 
         rts_view[n, 0] = t_particle + t # Store rt
         choices_view[n, 0] = sign(y) # Store choice
-    
+
 
     return (rts, choices,  {'v': v,
                             'a': a,
@@ -651,7 +695,8 @@ def levy_flexbound(np.ndarray[float, ndim = 1] v,
                    int n_trials = 1,
                    boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                    boundary_multiplicative = True,
-                   boundary_params = {}
+                   boundary_params = {},
+                   random_state = None, # seed material for the random number generator
                    ):
 
     # Param views:
@@ -663,7 +708,7 @@ def levy_flexbound(np.ndarray[float, ndim = 1] v,
 
     # Data-struct for trajectory storage
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:,:] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
@@ -675,55 +720,46 @@ def levy_flexbound(np.ndarray[float, ndim = 1] v,
     cdef float delta_t_alpha # = pow(delta_t, 1.0 / alpha_diff) # correct scalar so we can use standard normal samples for the brownian motion
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
     cdef float y, t_particle
-    cdef Py_ssize_t n 
+    cdef Py_ssize_t n
     cdef Py_ssize_t ix
-    cdef Py_ssize_t k
-    cdef Py_ssize_t m = 0
-    #cdef int n, ix
-    #cdef int m = 0
-    cdef float[:] alpha_stable_values = draw_random_stable(num_draws, alpha_diff_view[0])
-
-    for k in range(n_trials):
+    cdef Py_ssize_t k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
         delta_t_alpha = s * pow(delta_t, 1.0 / alpha_diff_view[k])
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
+        y = (-1) * boundary_at(&bnd, k, 0) + (z_view[k] * 2 * (boundary_at(&bnd, k, 0)))  # reset starting position
+        t_particle = 0.0 # reset time
+        ix = 0 # reset boundary index
+        if n == 0:
+            if k == 0:
+                traj_view[0, 0] = y
 
-        # Loop over samples
-        for n in range(n_samples):
-            y = (-1) * boundary_view[0] + (z_view[k] * 2 * (boundary_view[0]))  # reset starting position 
-            t_particle = 0.0 # reset time
-            ix = 0 # reset boundary index
+        # Random walker
+        while y >= (-1) * boundary_at(&bnd, k, ix) and y <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+            y = y + (v_view[k] * delta_t) + (delta_t_alpha * random_stable(&rng, alpha_diff_view[k]))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
             if n == 0:
                 if k == 0:
-                    traj_view[0, 0] = y
+                    traj_view[ix, 0] = y
 
-            # Random walker
-            while y >= (-1) * boundary_view[ix] and y <= boundary_view[ix] and t_particle <= max_t:
-                y += (v_view[k] * delta_t) + (delta_t_alpha * alpha_stable_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                if n == 0:
-                    if k == 0:
-                        traj_view[ix, 0] = y
-                if m == num_draws:
-                    alpha_stable_values = draw_random_stable(num_draws, alpha_diff_view[k])
-                    m = 0
+        rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
+        choices_view[n, k, 0] = sign(y) # Store choice
 
-            rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
-            choices_view[n, k, 0] = sign(y) # Store choice
-        
     return (rts, choices,  {'v': v,
                             'a': a,
                             'z': z,
@@ -758,7 +794,8 @@ def full_ddm(np.ndarray[float, ndim = 1] v, # = 0,
              int n_trials = 1,
              boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
              boundary_multiplicative = True,
-             boundary_params = {}
+             boundary_params = {},
+             random_state = None, # seed material for the random number generator
              ):
 
     # cdef int cov_length = np.max([v.size, a.size, w.size, t.size]).astype(int)
@@ -774,7 +811,7 @@ def full_ddm(np.ndarray[float, ndim = 1] v, # = 0,
 
     # Data-structs for trajectory storage
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:, :] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
@@ -787,68 +824,55 @@ def full_ddm(np.ndarray[float, ndim = 1] v, # = 0,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
     cdef float y, t_particle, t_tmp
-    cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
+    cdef Py_ssize_t n, ix, k, kn
     cdef float drift_increment = 0.0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws) 
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
-    # Loop over trials
-    for k in range(n_trials):
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
+
+        # initialize starting point
+        y = ((-1) * boundary_at(&bnd, k, 0)) + (z_view[k] * 2.0 * (boundary_at(&bnd, k, 0)))  # reset starting position
+
+        # get drift by random displacement of v
+        drift_increment = (v_view[k] + sv_view[k] * philox_gaussian(&rng)) * delta_t
+        t_tmp = t_view[k] + (2 * (philox_uniform(&rng) - 0.5) * st_view[k])
+
+        # apply uniform displacement on y
+        y = y + 2 * (philox_uniform(&rng) - 0.5) * sz_view[k]
+
+        t_particle = 0.0 # reset time
+        ix = 0 # reset boundary index
+
+        if n == 0:
+            if k == 0:
+                traj_view[0, 0] = y
+
+        # Random walker
+        while y >= (-1) * boundary_at(&bnd, k, ix) and y <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+            y = y + drift_increment + (sqrt_st * philox_gaussian(&rng))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
 
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary_view[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary_view[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        
-        # Loop over samples
-        for n in range(n_samples):
-            # initialize starting point
-            y = ((-1) * boundary_view[0]) + (z_view[k] * 2.0 * (boundary_view[0]))  # reset starting position
-            
-            # get drift by random displacement of v 
-            drift_increment = (v_view[k] + sv_view[k] * gaussian_values[m]) * delta_t
-            t_tmp = t_view[k] + (2 * (random_uniform() - 0.5) * st_view[k])
-            
-            # apply uniform displacement on y
-            y += 2 * (random_uniform() - 0.5) * sz_view[k]
-            
-            # increment m appropriately
-            m += 1
-            if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-            
-            t_particle = 0.0 # reset time
-            ix = 0 # reset boundary index
-            
             if n == 0:
                 if k == 0:
-                    traj_view[0, 0] = y
-
-            # Random walker
-            while y >= (-1) * boundary_view[ix] and y <= boundary_view[ix] and t_particle <= max_t:
-                y += drift_increment + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
-                if n == 0:
-                    if k == 0:
-                        traj_view[ix, 0] = y
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+                    traj_view[ix, 0] = y
 
-            rts_view[n, k, 0] = t_particle + t_tmp # Store rt
-            choices_view[n, k, 0] = np.sign(y) # Store choice
+        rts_view[n, k, 0] = t_particle + t_tmp # Store rt
+        choices_view[n, k, 0] = sign(y) # Store choice
 
     return (rts, choices,  {'v': v,
                             'a': a,
@@ -885,12 +909,13 @@ def ddm_sdv(np.ndarray[float, ndim = 1] v,
             int n_trials = 1,
             boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
             boundary_multiplicative = True,
-            boundary_params = {}
+            boundary_params = {},
+            random_state = None, # seed material for the random number generator
             ):
 
     # Data-structs for trajectory storage
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:,:] traj_view = traj
 
     # Param views
@@ -899,7 +924,7 @@ def ddm_sdv(np.ndarray[float, ndim = 1] v,
     cdef float[:] z_view = z
     cdef float[:] t_view = t
     cdef float[:] sv_view = sv
-    
+
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
     choices = np.zeros((n_samples, n_trials, 1), dtype = np.intc)
 
@@ -910,71 +935,51 @@ def ddm_sdv(np.ndarray[float, ndim = 1] v,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
-    # Precompute boundary evaluations
-    if boundary_multiplicative:
-        boundary_view[:] = np.multiply(a, boundary_fun(t = t_s, **boundary_params)).astype(DTYPE)
-    else:
-        boundary_view[:] = np.add(a, boundary_fun(t = t_s, **boundary_params)).astype(DTYPE)
-    
     cdef float y, t_particle
-    cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
+    cdef Py_ssize_t n, ix, k, kn
     cdef float drift_increment = 0.0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws) 
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
 
-        if boundary_multiplicative:
-            boundary_view[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary_view[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
 
-        # Loop over samples
-        for n in range(n_samples):
-            # initialize starting point
-            y = ((-1) * boundary_view[0]) + (z_view[k] * 2.0 * (boundary_view[0]))  # reset starting position
-            
-            # get drift by random displacement of v 
-            drift_increment = (v_view[k] + sv_view[k] * gaussian_values[m]) * delta_t
-            
-            # increment m appropriately
-            m += 1
-            if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-            
-            t_particle = 0.0 # reset time
-            ix = 0 # reset boundary index
-            
-            if n == 0:
-                if k == 0:
-                    traj_view[0, 0] = y
+        # initialize starting point
+        y = ((-1) * boundary_at(&bnd, k, 0)) + (z_view[k] * 2.0 * (boundary_at(&bnd, k, 0)))  # reset starting position
 
-            # Random walker
-            while y >= (-1) * boundary_view[ix] and y <= boundary_view[ix] and t_particle <= max_t:
-                y += drift_increment + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
-                if n == 0:
-                    if k == 0:
-                        traj_view[ix, 0] = y
+        # get drift by random displacement of v
+        drift_increment = (v_view[k] + sv_view[k] * philox_gaussian(&rng)) * delta_t
 
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+        t_particle = 0.0 # reset time
+        ix = 0 # reset boundary index
 
+        if n == 0:
+            if k == 0:
+                traj_view[0, 0] = y
 
-            rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
-            choices_view[n, k, 0] = np.sign(y) # Store choice
+        # Random walker
+        while y >= (-1) * boundary_at(&bnd, k, ix) and y <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+            y = y + drift_increment + (sqrt_st * philox_gaussian(&rng))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
+
+            if n == 0:
+                if k == 0:
+                    traj_view[ix, 0] = y
+
+        rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
+        choices_view[n, k, 0] = sign(y) # Store choice
 
 
     return (rts, choices,  {'v': v,
@@ -1012,6 +1017,7 @@ def ddm_flex(np.ndarray[float, ndim = 1] v,
              boundary_multiplicative = True,
              boundary_params = {},
              drift_params = {},
+             random_state = None, # seed material for the random number generator
              ):
 
     # Param views:
@@ -1021,7 +1027,7 @@ def ddm_flex(np.ndarray[float, ndim = 1] v,
     cdef float[:] t_view = t
 
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:,:] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
@@ -1034,24 +1040,24 @@ def ddm_flex(np.ndarray[float, ndim = 1] v,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
     boundary = np.zeros(t_s.shape, dtype = DTYPE)
     drift = np.zeros(t_s.shape, dtype = DTYPE)
 
     cdef float y, t_particle
-    cdef Py_ssize_t n 
+    cdef Py_ssize_t n
     cdef Py_ssize_t ix
-    cdef Py_ssize_t m = 0
     cdef Py_ssize_t k
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
     cdef float[:] boundary_view = boundary
     cdef float[:] drift_view = drift
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
     # Loop over samples
     for k in range(n_trials):
         # Precompute boundary evaluations and drift evaluations
-        
+
         # Drift
         drift_params_tmp = {key: drift_params[key][k] for key in drift_params.keys()}
         drift[:] = np.add(v_view[k], drift_fun(t = t_s, **drift_params_tmp)).astype(DTYPE)
@@ -1064,11 +1070,12 @@ def ddm_flex(np.ndarray[float, ndim = 1] v,
         else:
             boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
 
-        for n in range(n_samples):
-            y = (-1) * boundary_view[0] + (z_view[k] * 2 * (boundary_view[0]))  # reset starting position 
+        for n in prange(n_samples, nogil = True):
+            rng = philox_stream(rng_key, k, n)
+            y = (-1) * boundary_view[0] + (z_view[k] * 2 * (boundary_view[0]))  # reset starting position
             t_particle = 0.0 # reset time
             ix = 0 # reset boundary index
-            
+
             # Can improve with less checks
             if n == 0:
                 if k == 0:
@@ -1076,24 +1083,18 @@ def ddm_flex(np.ndarray[float, ndim = 1] v,
 
             # Random walker
             while (y >= (-1) * boundary_view[ix]) and (y <= boundary_view[ix]) and (t_particle <= max_t):
-                y += (drift_view[ix] * delta_t) + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
+                y = y + (drift_view[ix] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+                t_particle = t_particle + delta_t
+                ix = ix + 1
+
                 # Can improve with less checks
                 if n == 0:
                     if k == 0:
                         traj_view[ix, 0] = y
-                
-                # Can improve with less checks
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
 
             rts_view[n, k, 0] = t_particle + t_view[k] # Store rt
             choices_view[n, k, 0] = sign(y) # Store choice
-    
+
     return (rts, choices,  {'v': v,
                             'a': a,
                             'z': z,
@@ -1128,12 +1129,13 @@ def ornstein_uhlenbeck(np.ndarray[float, ndim = 1] v, # drift parameter
                        int n_trials = 1,
                        boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                        boundary_multiplicative = True,
-                       boundary_params = {}
+                       boundary_params = {},
+                       random_state = None, # seed material for the random number generator
                       ):
 
     # Data-structs for trajectory storage
     traj = np.zeros((int(max_t / delta_t) + 1, 1), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:,:] traj_view = traj
 
     # Param views
@@ -1154,53 +1156,44 @@ def ornstein_uhlenbeck(np.ndarray[float, ndim = 1] v, # drift parameter
     cdef float sqrt_st = s * delta_t_sqrt
 
     # Boundary Storage
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
     cdef float y, t_particle
-    cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
+    cdef Py_ssize_t n, ix, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
+        y = (-1) * boundary_at(&bnd, k, 0) + (z_view[k] * 2 * boundary_at(&bnd, k, 0))
+        t_particle = 0.0
+        ix = 0
+
+        if n == 0:
+            if k == 0:
+                traj_view[0, 0] = y
 
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        # Loop over samples
-        for n in range(n_samples):
-            y = (-1) * boundary_view[0] + (z_view[k] * 2 * boundary_view[0])
-            t_particle = 0.0
-            ix = 0
+        # Random walker
+        while y >= (-1) * boundary_at(&bnd, k, ix) and y <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+            y = y + ((v_view[k] - (g_view[k] * y)) * delta_t) + sqrt_st * philox_gaussian(&rng)
+            t_particle = t_particle + delta_t
+            ix = ix + 1
 
             if n == 0:
                 if k == 0:
-                    traj_view[0, 0] = y
-
-            # Random walker
-            while y >= (-1) * boundary_view[ix] and y <= boundary_view[ix] and t_particle <= max_t:
-                y += ((v_view[k] - (g_view[k] * y)) * delta_t) + sqrt_st * gaussian_values[m]
-                t_particle += delta_t
-                ix += 1
-                m += 1
-
-                if n == 0:
-                    if k == 0:
-                        traj_view[ix, 0] = y
+                    traj_view[ix, 0] = y
 
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-
-            rts_view[n, k, 0] = t_particle + t_view[k] 
-            choices_view[n, k, 0] = sign(y)
+        rts_view[n, k, 0] = t_particle + t_view[k]
+        choices_view[n, k, 0] = sign(y)
 
     return (rts, choices, {'v': v,
                            'a': a,
@@ -1226,28 +1219,13 @@ def ornstein_uhlenbeck(np.ndarray[float, ndim = 1] v, # drift parameter
 # @cythonwraparound(False)
 
 # Function that checks boundary crossing of particles
-cdef bint check_finished(float[:] particles, float boundary, int n):
-    cdef int i # ,n
-    #n = particles.shape[0]
+cdef inline bint check_finished(float* particles, float boundary, int n) nogil:
+    cdef int i
     for i in range(n):
         if particles[i] > boundary:
             return True
     return False
 
-#def test_check():
-#    # Quick sanity check for the check_finished function
-#    temp = np.random.normal(0,1, 10).astype(DTYPE)
-#    cdef float[:] temp_view = temp
-#    start = time()
-#    [check_finished(temp_view, 3) for _ in range(1000000)]
-#    print(check_finished(temp_view, 3))
-#    end = time()
-#    print("cython check: {}".format(start - end))
-#    start = time()
-#    [(temp > 3).any() for _ in range(1000000)]
-#    end = time()
-#    print("numpy check: {}".format(start - end))
-
 # @cythonboundscheck(False)
 # @cythonwraparound(False)
 def race_model(np.ndarray[float, ndim = 2] v,  # np.array expected, one column of floats
@@ -1257,11 +1235,13 @@ def race_model(np.ndarray[float, ndim = 2] v,  # np.array expected, one column o
                np.ndarray[float, ndim = 2] s, # np.array expected, one column of floats
                float delta_t = 0.001, # time increment step
                float max_t = 20, # maximum rt allowed
-               int n_samples = 2000, 
+               int n_samples = 2000,
                int n_trials = 1,
                boundary_fun = None,
                boundary_multiplicative = True,
-               boundary_params = {}):
+               boundary_params = {},
+               random_state = None, # seed material for the random number generator
+               ):
 
     # Param views
     cdef float[:, :] v_view = v
@@ -1271,7 +1251,7 @@ def race_model(np.ndarray[float, ndim = 2] v,  # np.array expected, one column o
     cdef float[:, :] s_view = s
 
     cdef float delta_t_sqrt = sqrt(delta_t)
-    sqrt_st = delta_t_sqrt * s
+    sqrt_st = (delta_t_sqrt * s).astype(DTYPE)
     cdef float[:, :] sqrt_st_view = sqrt_st
 
     cdef int n_particles = v.shape[1]
@@ -1279,46 +1259,40 @@ def race_model(np.ndarray[float, ndim = 2] v,  # np.array expected, one column o
     cdef float[:, :, :] rts_view = rts
     choices = np.zeros((n_samples, n_trials, 1), dtype = np.intc)
     cdef int[:, :, :] choices_view = choices
-    
-    particles = np.zeros((n_particles), dtype = DTYPE)
-    cdef float [:] particles_view = particles
 
+    # Particle positions, one buffer per thread
+    cdef float* particles
 
     # TD: Add Trajectory
     traj = np.zeros((int(max_t / delta_t) + 1, n_particles), dtype = DTYPE)
-    traj[:, :] = -999 
-    cdef float[:, :] traj_view = traj    
-
-    # Boundary storage
-    cdef int num_steps = int((max_t / delta_t) + 1)
+    traj[:, :] = -999
+    cdef float[:, :] traj_view = traj
 
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
-    # Initialize variables needed for for loop 
+    # Initialize variables needed for for loop
     cdef float t_particle
-    cdef Py_ssize_t n, ix, j, k
-    cdef Py_ssize_t m = 0
-
-    cdef int num_draws = num_steps * n_particles
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k, 0], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k, 0], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        # Loop over samples
-        for n in range(n_samples):
+    cdef Py_ssize_t n, ix, j, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a[:, 0], t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    with nogil, parallel():
+        particles = <float*> malloc(n_particles * sizeof(float))
+
+        # Loop over trials and samples
+        for kn in prange(n_trials * n_samples):
+            k = kn // n_samples
+            n = kn % n_samples
+            rng = philox_stream(rng_key, k, n)
             for j in range(n_particles):
-                particles_view[j] = z_view[k, j] * boundary_view[0] # Reset particle starting points
-            
+                particles[j] = z_view[k, j] * boundary_at(&bnd, k, 0) # Reset particle starting points
+
             t_particle = 0.0 # reset time
             ix = 0
 
@@ -1328,36 +1302,34 @@ def race_model(np.ndarray[float, ndim = 2] v,  # np.array expected, one column o
                         traj_view[0, j] = particles[j]
 
             # Random walker
-            while not check_finished(particles_view, boundary_view[ix], n_particles) and t_particle <= max_t:
+            while not check_finished(particles, boundary_at(&bnd, k, ix), n_particles) and t_particle <= max_t:
                 for j in range(n_particles):
-                    particles_view[j] += (v_view[k, j] * delta_t) + sqrt_st_view[k, j] * gaussian_values[m]
-                    m += 1
-                    if m == num_draws:
-                        m = 0
-                        gaussian_values = draw_gaussian(num_draws)
-                t_particle += delta_t
-                ix += 1
+                    particles[j] = particles[j] + (v_view[k, j] * delta_t) + sqrt_st_view[k, j] * philox_gaussian(&rng)
+                t_particle = t_particle + delta_t
+                ix = ix + 1
                 if n == 0:
                     if k == 0:
                         for j in range(n_particles):
                             traj_view[ix, j] = particles[j]
 
-            choices_view[n, k, 0] = np.argmax(particles)
+            choices_view[n, k, 0] = argmax(particles, n_particles)
             #rts_view[n, 0] = t + t[choices_view[n, 0]]
-            rts_view[n , k, 0] = t_particle + t[k, 0] # for now no t per choice option
+            rts_view[n , k, 0] = t_particle + t_view[k, 0] # for now no t per choice option
 
-        # Create some dics
-        v_dict = {}
-        z_dict = {}
-        #t_dict = {}
-        for i in range(n_particles):
-            v_dict['v' + str(i)] = v[:, i]
-            z_dict['z' + str(i)] = z[:, i]
-            #t_dict['t_' + str(i)] = t[i] # for now no t by choice
+        free(particles)
+
+    # Create some dics
+    v_dict = {}
+    z_dict = {}
+    #t_dict = {}
+    for i in range(n_particles):
+        v_dict['v' + str(i)] = v[:, i]
+        z_dict['z' + str(i)] = z[:, i]
+        #t_dict['t_' + str(i)] = t[i] # for now no t by choice
 
 
     return (rts, choices, {**v_dict,
-                        'a': a[:, 0], 
+                        'a': a[:, 0],
                         **z_dict, # if z's are different
                         'z': z[:, 0], # single z if z's all the same
                         't': t[:, 0],
@@ -1390,7 +1362,9 @@ def lca(np.ndarray[float, ndim = 2] v, # drift parameters (np.array expect: one
         int n_trials = 1,
         boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
         boundary_multiplicative = True,
-        boundary_params = {}):
+        boundary_params = {},
+        random_state = None, # seed material for the random number generator
+        ):
 
 
     # Param views
@@ -1405,56 +1379,50 @@ def lca(np.ndarray[float, ndim = 2] v, # drift parameters (np.array expect: one
     # Trajectory
     cdef int n_particles = v.shape[1]
     traj = np.zeros((int(max_t / delta_t) + 1, n_particles), dtype = DTYPE)
-    traj[:, :] = -999 
+    traj[:, :] = -999
     cdef float[:, :] traj_view = traj
 
     rts = np.zeros((n_samples, n_trials, 1), dtype = DTYPE)
     cdef float[:, :, :] rts_view = rts
-    
+
     choices = np.zeros((n_samples, n_trials, 1), dtype = np.intc)
     cdef int[:, :, :] choices_view = choices
 
-    particles = np.zeros(n_particles, dtype = DTYPE)
-    cdef float[:] particles_view = particles
-    
-    particles_reduced_sum = np.zeros(n_particles, dtype = DTYPE)
-    cdef float[:] particles_reduced_sum_view = particles_reduced_sum
-    
+    # Particle positions and leave-one-out sums, one buffer per thread
+    cdef float* particles
+    cdef float* particles_reduced_sum
+
     cdef float delta_t_sqrt = sqrt(delta_t)
-    sqrt_st = s * delta_t_sqrt
+    sqrt_st = (s * delta_t_sqrt).astype(DTYPE)
     cdef float[:, :] sqrt_st_view = sqrt_st
-    
-    cdef Py_ssize_t n, i, ix, k
-    cdef Py_ssize_t m = 0
-    cdef float t_par, particles_sum
-    
-    # Boundary storage                                                             
-    cdef int num_steps = int((max_t / delta_t) + 2)
+
+    cdef Py_ssize_t n, i, ix, k, kn
+    cdef float t_particle, particles_sum
 
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
-    cdef int num_draws = num_steps * n_particles
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
 
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a[:, 0], t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
 
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            # print(a)
-            boundary[:] = np.multiply(a_view[k, 0], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            # print(a)
-            boundary[:] = np.add(a_view[k, 0], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
+    with nogil, parallel():
+        particles = <float*> malloc(n_particles * sizeof(float))
+        particles_reduced_sum = <float*> malloc(n_particles * sizeof(float))
 
-        for n in range(n_samples):
+        # Loop over trials and samples
+        for kn in prange(n_trials * n_samples):
+            k = kn // n_samples
+            n = kn % n_samples
+            rng = philox_stream(rng_key, k, n)
             # Reset particle starting points
             for i in range(n_particles):
-                particles_view[i] = z_view[k, i] * boundary_view[0]
-            
+                particles[i] = z_view[k, i] * boundary_at(&bnd, k, 0)
+
             t_particle = 0.0 # reset time
             ix = 0 # reset boundary index
 
@@ -1463,38 +1431,36 @@ def lca(np.ndarray[float, ndim = 2] v, # drift parameters (np.array expect: one
                     for i in range(n_particles):
                         traj_view[0, i] = particles[i]
 
-            while not check_finished(particles_view, boundary_view[ix], n_particles) and t_particle <= max_t:
+            while not check_finished(particles, boundary_at(&bnd, k, ix), n_particles) and t_particle <= max_t:
                 # calculate current sum over particle positions
-                particles_sum = csum(particles_view)
-                
-                # update particle positions 
+                particles_sum = csum(particles, n_particles)
+
+                # update particle positions
                 for i in range(n_particles):
-                    particles_reduced_sum_view[i] = (- 1) * particles_view[i] + particles_sum
-                    particles_view[i] += ((v_view[k, i] - (g_view[k, 0] * particles_view[i]) - \
-                            (b_view[k, 0] * particles_reduced_sum_view[i])) * delta_t) + (sqrt_st_view[k, i] * gaussian_values[m])
-                    particles_view[i] = fmax(0.0, particles_view[i])
-                    m += 1
-
-                    if m == num_draws:
-                        gaussian_values = draw_gaussian(num_draws)
-                        m = 0
-                
-                t_particle += delta_t # increment time
-                ix += 1 # increment boundary index
+                    particles_reduced_sum[i] = (- 1) * particles[i] + particles_sum
+                    particles[i] = particles[i] + ((v_view[k, i] - (g_view[k, 0] * particles[i]) - \
+                            (b_view[k, 0] * particles_reduced_sum[i])) * delta_t) + (sqrt_st_view[k, i] * philox_gaussian(&rng))
+                    particles[i] = fmax(0.0, particles[i])
+
+                t_particle = t_particle + delta_t # increment time
+                ix = ix + 1 # increment boundary index
 
                 if n == 0:
                     if k == 0:
                         for i in range(n_particles):
                             traj_view[ix, i] = particles[i]
-        
-            choices_view[n, k, 0] = np.argmax(particles) # store choices for sample n
+
+            choices_view[n, k, 0] = argmax(particles, n_particles) # store choices for sample n
             rts_view[n, k, 0] = t_particle + t_view[k, 0] # t[choices_view[n, 0]] # store reaction time for sample n
-        
+
+        free(particles)
+        free(particles_reduced_sum)
+
     # Create some dics
     v_dict = {}
     z_dict = {}
     #t_dict = {}
-    
+
     for i in range(n_particles):
         v_dict['v' + str(i)] = v[:, i]
         z_dict['z_' + str(i)] = z[:, i]
@@ -1502,7 +1468,7 @@ def lca(np.ndarray[float, ndim = 2] v, # drift parameters (np.array expect: one
     return (rts, choices, {**v_dict,
                            'a': a[:, 0],
                            **z_dict, # --> if different z's
-                           'z': z[:, 0], # z --> if all z_s the same , 
+                           'z': z[:, 0], # z --> if all z_s the same ,
                            'g': g[:, 0],
                            'b': b[:, 0],
                            't': t[:, 0],
@@ -1536,7 +1502,8 @@ def ddm_flexbound_seq2(np.ndarray[float, ndim = 1] v_h,
                        print_info = True,
                        boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                        boundary_multiplicative = True,
-                       boundary_params = {}
+                       boundary_params = {},
+                       random_state = None, # seed material for the random number generator
                        ):
 
     # Param views
@@ -1560,86 +1527,76 @@ def ddm_flexbound_seq2(np.ndarray[float, ndim = 1] v_h,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
+
+    cdef float y_h, t_particle, y_l, v_l
+    cdef bint walk_l # whether the low dimensional walker has to be run
+    cdef Py_ssize_t n, ix, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
+        t_particle = 0.0 # reset time
+        ix = 0 # reset boundary index
+        walk_l = False
 
-    cdef float y_h, t_particle, y_l
-    cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
-    #cdef Py_ssize_t traj_id
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
+        # Random walker 1
+        y_h = (-1) * boundary_at(&bnd, k, 0) + (z_h_view[k] * 2 * (boundary_at(&bnd, k, 0)))  # reset starting position
 
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
+        while y_h >= (-1) * boundary_at(&bnd, k, ix) and y_h <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+            y_h = y_h + (v_h_view[k] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+            t_particle = t_particle + delta_t
+            ix = ix + 1
 
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
+        # If we are already at maximum t, to generate a choice we just sample from a bernoulli
+        if t_particle >= max_t:
+            if philox_uniform(&rng) > 0.5:
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 1
         else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        # Loop over samples
-        for n in range(n_samples):
-            t_particle = 0.0 # reset time
-            ix = 0 # reset boundary index
+            if sign(y_h) < 0: # Store intermediate choice
+                choices_view[n, k, 0] = 0
 
-            # Random walker 1
-            y_h = (-1) * boundary_view[0] + (z_h_view[k] * 2 * (boundary_view[0]))  # reset starting position 
-
-            while y_h >= (-1) * boundary_view[ix] and y_h <= boundary_view[ix] and t_particle <= max_t:
-                y_h += (v_h_view[k] * delta_t) + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-
-            # If we are already at maximum t, to generate a choice we just sample from a bernoulli
-            if t_particle >= max_t:
-                if random_uniform() > 0.5:
-                    choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+                # In case boundary is negative already, we flip a coin with bias determined by w_l_ parameter
+                if boundary_at(&bnd, k, ix) <= 0:
+                    if philox_uniform(&rng) < z_l_1_view[k]:
+                        choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+                else:
+                    y_l = (-1) * boundary_at(&bnd, k, ix) + (z_l_1_view[k] * 2 * (boundary_at(&bnd, k, ix)))
+                    v_l = v_l_1_view[k]
+                    walk_l = True
             else:
-                if sign(y_h) < 0: # Store intermediate choice
-                    choices_view[n, k, 0] = 0 
-                    
-                    # In case boundary is negative already, we flip a coin with bias determined by w_l_ parameter
-                    if boundary_view[ix] <= 0:
-                        if random_uniform() < z_l_1_view[k]:
-                            choices_view[n, k, 0] += 1
-                    else:
-                        y_l = (-1) * boundary_view[ix] + (z_l_1_view[k] * 2 * (boundary_view[ix])) 
-                        v_l = v_l_1_view[k]
-                        #traj_id = 1
+                choices_view[n, k, 0] = 2
+
+                # In case boundary is negative already, we flip a coin with bias determined by w_l_ parameter
+                if boundary_at(&bnd, k, ix) <= 0:
+                    if philox_uniform(&rng) < z_l_2_view[k]:
+                        choices_view[n, k, 0] = choices_view[n, k, 0] + 1
                 else:
-                    choices_view[n, k, 0] = 2
-                    
-                    # In case boundary is negative already, we flip a coin with bias determined by w_l_ parameter
-                    if boundary_view[ix] <= 0:
-                        if random_uniform() < z_l_2_view[k]:
-                            choices_view[n, k, 0] += 1
-                    else:
-                        y_l = (-1) * boundary_view[ix] + (z_l_2_view[k] * 2 * (boundary_view[ix])) 
-                        v_l = v_l_2_view[k]
-                        #traj_id = 2
-
-            # Random walker 2
-            while y_l >= (-1) * boundary_view[ix] and y_l <= boundary_view[ix] and t_particle <= max_t:
-                y_l += (v_l * delta_t) + (sqrt_st * gaussian_values[m])
-                t_particle += delta_t
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
-
-            rts_view[n, k, 0] = t_particle + t_view[k]
+                    y_l = (-1) * boundary_at(&bnd, k, ix) + (z_l_2_view[k] * 2 * (boundary_at(&bnd, k, ix)))
+                    v_l = v_l_2_view[k]
+                    walk_l = True
+
+        # Random walker 2
+        if walk_l:
+            while y_l >= (-1) * boundary_at(&bnd, k, ix) and y_l <= boundary_at(&bnd, k, ix) and t_particle <= max_t:
+                y_l = y_l + (v_l * delta_t) + (sqrt_st * philox_gaussian(&rng))
+                t_particle = t_particle + delta_t
+                ix = ix + 1
+
             if sign(y_l) >= 0: # store choice update
-                choices_view[n, k, 0] += 1
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+
+        rts_view[n, k, 0] = t_particle + t_view[k]
 
     return (rts, choices,  {'vh': v_h,
                             'vl1': v_l_1,
@@ -1680,7 +1637,8 @@ def ddm_flexbound_par2(np.ndarray[float, ndim = 1] v_h,
                        print_info = True,
                        boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                        boundary_multiplicative = True,
-                       boundary_params = {}
+                       boundary_params = {},
+                       random_state = None, # seed material for the random number generator
                        ):
 
 
@@ -1706,70 +1664,58 @@ def ddm_flexbound_par2(np.ndarray[float, ndim = 1] v_h,
     cdef float sqrt_st = delta_t_sqrt * s # scalar to ensure the correct variance for the gaussian step
 
     # Boundary storage for the upper bound
-    cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
     cdef float y_h, y_l, v_l, t_h, t_l
-    cdef Py_ssize_t n, ix, k
-    cdef Py_ssize_t m = 0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
+    cdef Py_ssize_t n, ix, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    # Loop over trials and samples
+    for kn in prange(n_trials * n_samples, nogil = True):
+        k = kn // n_samples
+        n = kn % n_samples
+        rng = philox_stream(rng_key, k, n)
+        t_h = 0.0 # reset time high dimension
+        t_l = 0.0 # reset time low dimension
+        ix = 0 # reset boundary index
 
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        
-        # Loop over samples
-        for n in range(n_samples):
-            t_h = 0.0 # reset time high dimension
-            t_l = 0.0 # reset time low dimension
-            ix = 0 # reset boundary index
+        # Initialize walkers
+        y_h = (-1) * boundary_at(&bnd, k, 0) + (z_h_view[k] * 2 * (boundary_at(&bnd, k, 0)))
 
-            # Initialize walkers
-            y_h = (-1) * boundary_view[0] + (z_h_view[k] * 2 * (boundary_view[0])) 
+        # Random walks until y_h hits bound
+        while y_h >= (-1) * boundary_at(&bnd, k, ix) and y_h <= boundary_at(&bnd, k, ix) and t_h <= max_t:
+            y_h = y_h + (v_h_view[k] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+            t_h = t_h + delta_t
+            ix = ix + 1
 
-            # Random walks until y_h hits bound
-            while y_h >= (-1) * boundary_view[ix] and y_h <= boundary_view[ix] and t_h <= max_t:
-                y_h += (v_h_view[k] * delta_t) + (sqrt_st * gaussian_values[m])
-                t_h += delta_t
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+        if sign(y_h) < 0: # Store intermediate choice
+            choices_view[n, k, 0] = 0
+            y_l = (-1) * boundary_at(&bnd, k, 0) + (z_l_1_view[k] * 2 * (boundary_at(&bnd, k, 0)))
+            v_l = v_l_1_view[k]
 
-            if sign(y_h) < 0: # Store intermediate choice
-                choices_view[n, k, 0] = 0 
-                y_l = (-1) * boundary_view[0] + (z_l_1_view[k] * 2 * (boundary_view[0])) 
-                v_l = v_l_1_view[k]
-            
-            else:
-                choices_view[n, k, 0] = 2
-                y_l = (-1) * boundary_view[0] + (z_l_2_view[k] * 2 * (boundary_view[0])) 
-                v_l = v_l_2_view[k]
+        else:
+            choices_view[n, k, 0] = 2
+            y_l = (-1) * boundary_at(&bnd, k, 0) + (z_l_2_view[k] * 2 * (boundary_at(&bnd, k, 0)))
+            v_l = v_l_2_view[k]
 
-            # Random walks until the y_l corresponding to y_h hits bound
-            ix = 0
-            while y_l >= (-1) * boundary_view[ix] and y_l <= boundary_view[ix] and t_l <= max_t:
-                y_l += (v_l * delta_t) + (sqrt_st * gaussian_values[m])
-                t_l += delta_t
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+        # Random walks until the y_l corresponding to y_h hits bound
+        ix = 0
+        while y_l >= (-1) * boundary_at(&bnd, k, ix) and y_l <= boundary_at(&bnd, k, ix) and t_l <= max_t:
+            y_l = y_l + (v_l * delta_t) + (sqrt_st * philox_gaussian(&rng))
+            t_l = t_l + delta_t
+            ix = ix + 1
 
-            rts_view[n, k, 0] = fmax(t_h, t_l) + t_view[k]
+        rts_view[n, k, 0] = fmax(t_h, t_l) + t_view[k]
 
-            if sign(y_l) >= 0: # store choice update
-                choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+        if sign(y_l) >= 0: # store choice update
+            choices_view[n, k, 0] = choices_view[n, k, 0] + 1
 
     return (rts, choices,  {'vh': v_h,
                             'vl1': v_l_1,
@@ -1794,7 +1740,7 @@ def ddm_flexbound_par2(np.ndarray[float, ndim = 1] v_h,
 # Simulate (rt, choice) tuples from: DDM WITH FLEXIBLE BOUNDARIES ------------------------------------
 # @cythonboundscheck(False)
 # @cythonwraparound(False)
-def ddm_flexbound_mic2_adj(np.ndarray[float, ndim = 1] v_h, 
+def ddm_flexbound_mic2_adj(np.ndarray[float, ndim = 1] v_h,
                            np.ndarray[float, ndim = 1] v_l_1,
                            np.ndarray[float, ndim = 1] v_l_2,
                            np.ndarray[float, ndim = 1] a,
@@ -1811,14 +1757,15 @@ def ddm_flexbound_mic2_adj(np.ndarray[float, ndim = 1] v_h,
                            print_info = True,
                            boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                            boundary_multiplicative = True,
-                           boundary_params = {}
+                           boundary_params = {},
+                           random_state = None, # seed material for the random number generator
                            ):
     # Param views
     cdef float[:] v_h_view = v_h # slope corresponding to high dimension slope
     cdef float[:] v_l_1_view = v_l_1 # slope corresponding to irrelevant low dimension
     cdef float[:] v_l_2_view = v_l_2 # slope corresponding to correct low dimension
     cdef float[:] a_view = a
-    cdef float[:] z_h_view = z_h # bias corresponding to high dimension 
+    cdef float[:] z_h_view = z_h # bias corresponding to high dimension
     cdef float[:] z_l_1_view = z_l_1 # bias corresponding to irrelevant low dimension
     cdef float[:] z_l_2_view = z_l_2 # bias corresponding to correct low dimension
     cdef float[:] d_view = d
@@ -1837,107 +1784,100 @@ def ddm_flexbound_mic2_adj(np.ndarray[float, ndim = 1] v_h,
     # Boundary storage for the upper bound
     cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
-    # Y particle trace
-    bias_trace = np.zeros(num_draws, dtype = DTYPE) # tracks the y_h position in the accumulator (normalized to be between [0, 1])
-    cdef float[:] bias_trace_view = bias_trace
+    # Y particle trace, one buffer per thread
+    cdef float* bias_trace # tracks the y_h position in the accumulator (normalized to be between [0, 1])
 
     cdef float y_h, y_l, v_l, t_h, t_l
-    cdef Py_ssize_t n, ix, ix_tmp, k
-    cdef Py_ssize_t m = 0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        # Loop over samples
-        for n in range(n_samples):
+    cdef Py_ssize_t n, ix, ix_tmp, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    with nogil, parallel():
+        bias_trace = <float*> malloc(num_draws * sizeof(float))
+
+        # Loop over trials and samples
+        for kn in prange(n_trials * n_samples):
+            k = kn // n_samples
+            n = kn % n_samples
+            rng = philox_stream(rng_key, k, n)
             choices_view[n, k, 0] = 0 # reset choice
             t_h = 0 # reset time high dimension
             t_l = 0 # reset time low dimension
             ix = 0 # reset boundary index
 
             # Initialize walkers
-            y_h = (-1) * boundary_view[0] + (z_h_view[k] * 2 * (boundary_view[0])) 
-            bias_trace_view[0] = ((y_h + boundary_view[0]) / (2 * boundary_view[0]))
+            y_h = (-1) * boundary_at(&bnd, k, 0) + (z_h_view[k] * 2 * (boundary_at(&bnd, k, 0)))
+            bias_trace[0] = ((y_h + boundary_at(&bnd, k, 0)) / (2 * boundary_at(&bnd, k, 0)))
 
             # Random walks until y_h hits bound
-            while (y_h >= ((-1) * boundary_view[ix])) and ((y_h <= boundary_view[ix])) and (t_h <= max_t):
-                y_h += (v_h_view[k] * delta_t) + (sqrt_st * gaussian_values[m])
-                bias_trace_view[ix] = ((y_h + boundary_view[ix]) / (2 * boundary_view[ix]))
-                t_h += delta_t
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+            while (y_h >= ((-1) * boundary_at(&bnd, k, ix))) and ((y_h <= boundary_at(&bnd, k, ix))) and (t_h <= max_t):
+                y_h = y_h + (v_h_view[k] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+                bias_trace[ix] = ((y_h + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix)))
+                t_h = t_h + delta_t
+                ix = ix + 1
 
             # The probability of making a 'mistake' 1 - (relative y position)
-            # y at upper bound --> y_h + boundary_view[ix] / 2 * boundary_view[ix] = 1 --> choices_view[n, k, 0] adds two     
-            # y at lower bound --> y_h + boundary_view[ix] / 2 * boundary_view[ix] = 0 --> choices_view[n, k, 0] stays the same 
-            if random_uniform() <= ((y_h + boundary_view[ix]) / (2 * boundary_view[ix])):
-                choices_view[n, k, 0] += 2
-           
+            # y at upper bound --> y_h + boundary[ix] / 2 * boundary[ix] = 1 --> choices_view[n, k, 0] adds two
+            # y at lower bound --> y_h + boundary[ix] / 2 * boundary[ix] = 0 --> choices_view[n, k, 0] stays the same
+            if philox_uniform(&rng) <= ((y_h + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix))):
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 2
+
             if choices_view[n, k, 0] == 2:
-                y_l = (- 1) * boundary_view[0] + (z_l_2_view[k] * 2 * (boundary_view[0])) 
+                y_l = (- 1) * boundary_at(&bnd, k, 0) + (z_l_2_view[k] * 2 * (boundary_at(&bnd, k, 0)))
                 v_l = v_l_2_view[k]
 
                 # Fill bias trace until max_rt reached
                 ix_tmp = ix + 1
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 1.0
-                    ix_tmp += 1
+                    bias_trace[ix_tmp] = 1.0
+                    ix_tmp = ix_tmp + 1
 
             else: # Store intermediate choice
-                y_l = (- 1) * boundary_view[0] + (z_l_1_view[k] * 2 * (boundary_view[0])) 
+                y_l = (- 1) * boundary_at(&bnd, k, 0) + (z_l_1_view[k] * 2 * (boundary_at(&bnd, k, 0)))
                 v_l = v_l_1_view[k]
 
                 # Fill bias trace until max_rt reached
                 ix_tmp = ix + 1
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 0.0
-                    ix_tmp += 1
+                    bias_trace[ix_tmp] = 0.0
+                    ix_tmp = ix_tmp + 1
 
                 # We need to reverse the bias_trace if we took the lower choice
                 ix_tmp = 0
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 1.0 - bias_trace_view[ix_tmp]
-                    ix_tmp += 1
-            
+                    bias_trace[ix_tmp] = 1.0 - bias_trace[ix_tmp]
+                    ix_tmp = ix_tmp + 1
+
             # Random walks until the y_l corresponding to high dimensional choice hits bound
             ix = 0
-            while (y_l >= ((-1) * boundary_view[ix])) and (y_l <= boundary_view[ix]) and (t_l <= max_t):
-                # If high-dim choice has not been taken --> apply the slope discount according to parameter d and the position of y_h (normalized and sitting in bias_trace_view)
-                if (bias_trace_view[ix] < 1) and (bias_trace_view[ix] > 0): # Note I think > 0 part is unnecessary 
-                    y_l += ((v_l * bias_trace_view[ix] * d_view[k]) * delta_t)
+            while (y_l >= ((-1) * boundary_at(&bnd, k, ix))) and (y_l <= boundary_at(&bnd, k, ix)) and (t_l <= max_t):
+                # If high-dim choice has not been taken --> apply the slope discount according to parameter d and the position of y_h (normalized and sitting in bias_trace)
+                if (bias_trace[ix] < 1) and (bias_trace[ix] > 0): # Note I think > 0 part is unnecessary
+                    y_l = y_l + ((v_l * bias_trace[ix] * d_view[k]) * delta_t)
                 else: # If high-dim choice already taken, apply low dim slope undiscounted
-                    y_l += (v_l * delta_t)
-                
-                y_l += (sqrt_st * gaussian_values[m]) # add noise
-                
-                t_l += delta_t # add time
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+                    y_l = y_l + (v_l * delta_t)
+
+                y_l = y_l + (sqrt_st * philox_gaussian(&rng)) # add noise
+
+                t_l = t_l + delta_t # add time
+                ix = ix + 1
 
             rts_view[n, k, 0] = fmax(t_h, t_l) + t_view[k]
 
             # The probability of making a 'mistake' 1 - (relative y position)
-            # y at upper bound --> y_l + boundary_view[ix] / 2 * boundary_view[ix] = 1 --> choices_view[n, k, 0] adds one     
-            # y at lower bound --> y_l + boundary_view[ix] / 2 * boundary_view[ix] = 0 --> choices_view[n, k, 0] stays the same 
-            if random_uniform() <= ((y_l + boundary_view[ix]) / (2 * boundary_view[ix])):
-                choices_view[n, k, 0] += 1
+            # y at upper bound --> y_l + boundary[ix] / 2 * boundary[ix] = 1 --> choices_view[n, k, 0] adds one
+            # y at lower bound --> y_l + boundary[ix] / 2 * boundary[ix] = 0 --> choices_view[n, k, 0] stays the same
+            if philox_uniform(&rng) <= ((y_l + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix))):
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+
+        free(bias_trace)
 
     return (rts, choices, {'vh': v_h,
                            'vl1': v_l_1,
@@ -1963,7 +1903,7 @@ def ddm_flexbound_mic2_adj(np.ndarray[float, ndim = 1] v_h,
 # Simulate (rt, choice) tuples from: DDM WITH FLEXIBLE BOUNDARIES ------------------------------------
 # @cythonboundscheck(False)
 # @cythonwraparound(False)
-def ddm_flexbound_tradeoff(np.ndarray[float, ndim = 1] v_h, 
+def ddm_flexbound_tradeoff(np.ndarray[float, ndim = 1] v_h,
                            np.ndarray[float, ndim = 1] v_l_1,
                            np.ndarray[float, ndim = 1] v_l_2,
                            np.ndarray[float, ndim = 1] a,
@@ -1980,7 +1920,8 @@ def ddm_flexbound_tradeoff(np.ndarray[float, ndim = 1] v_h,
                            print_info = True,
                            boundary_fun = None, # function of t (and potentially other parameters) that takes in (t, *args)
                            boundary_multiplicative = True,
-                           boundary_params = {}
+                           boundary_params = {},
+                           random_state = None, # seed material for the random number generator
                            ):
     # Param views
     cdef float[:] v_h_view = v_h
@@ -2007,114 +1948,104 @@ def ddm_flexbound_tradeoff(np.ndarray[float, ndim = 1] v_h,
     # Boundary storage for the upper bound
     cdef int num_draws = int((max_t / delta_t) + 1)
     t_s = np.arange(0, max_t + delta_t, delta_t).astype(DTYPE)
-    boundary = np.zeros(t_s.shape, dtype = DTYPE)
-    cdef float[:] boundary_view = boundary
+    cdef boundary_spec bnd
 
-    # Y particle trace
-    bias_trace = np.zeros(num_draws, dtype = DTYPE)
-    cdef float[:] bias_trace_view = bias_trace
+    # Y particle trace, one buffer per thread
+    cdef float* bias_trace
 
     cdef float y_h, y_l, v_l, t_h, t_l, tmp_pos_dep
-    cdef Py_ssize_t n, ix, ix_tmp, k
-    cdef Py_ssize_t m = 0
-    cdef float[:] gaussian_values = draw_gaussian(num_draws)
-
-    for k in range(n_trials):
-        # Precompute boundary evaluations
-        boundary_params_tmp = {key: boundary_params[key][k] for key in boundary_params.keys()}
-
-        # Precompute boundary evaluations
-        if boundary_multiplicative:
-            boundary[:] = np.multiply(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-        else:
-            boundary[:] = np.add(a_view[k], boundary_fun(t = t_s, **boundary_params_tmp)).astype(DTYPE)
-    
-        # Loop over samples
-        for n in range(n_samples):
+    cdef Py_ssize_t n, ix, ix_tmp, k, kn
+    cdef uint32_t rng_key[2]
+    cdef philox_state rng
+    set_key(rng_key, random_state)
+
+    # Boundaries are evaluated analytically for known families, otherwise
+    # precomputed for all trials (see set_boundary)
+    boundary, boundary_arrays = set_boundary(&bnd, a, t_s, delta_t, boundary_fun, boundary_multiplicative, boundary_params)
+
+    with nogil, parallel():
+        bias_trace = <float*> malloc(num_draws * sizeof(float))
+
+        # Loop over trials and samples
+        for kn in prange(n_trials * n_samples):
+            k = kn // n_samples
+            n = kn % n_samples
+            rng = philox_stream(rng_key, k, n)
             choices_view[n, k, 0] = 0 # reset choice
             t_h = 0 # reset time high dimension
             t_l = 0 # reset time low dimension
             ix = 0 # reset boundary index
 
             # Initialize walkers
-            y_h = (-1) * boundary_view[0] + (z_h_view[k] * 2 * (boundary_view[0])) 
-            bias_trace_view[0] = ((y_h + boundary_view[0]) / (2 * boundary_view[0]))
+            y_h = (-1) * boundary_at(&bnd, k, 0) + (z_h_view[k] * 2 * (boundary_at(&bnd, k, 0)))
+            bias_trace[0] = ((y_h + boundary_at(&bnd, k, 0)) / (2 * boundary_at(&bnd, k, 0)))
 
             # Random walks until y_h hits bound
-            while (y_h >= ((-1) * boundary_view[ix])) and ((y_h <= boundary_view[ix])) and (t_h <= max_t):
-                y_h += (v_h_view[k] * delta_t) + (sqrt_st * gaussian_values[m])
-                bias_trace_view[ix] = ((y_h + boundary_view[ix]) / (2 * boundary_view[ix]))
-                t_h += delta_t
-                ix += 1
-                m += 1
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+            while (y_h >= ((-1) * boundary_at(&bnd, k, ix))) and ((y_h <= boundary_at(&bnd, k, ix))) and (t_h <= max_t):
+                y_h = y_h + (v_h_view[k] * delta_t) + (sqrt_st * philox_gaussian(&rng))
+                bias_trace[ix] = ((y_h + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix)))
+                t_h = t_h + delta_t
+                ix = ix + 1
 
             # The probability of making a 'mistake' 1 - (relative y position)
             # y at upper bound --> choices_view[n, k, 0] add 2 deterministically
             # y at lower bound --> choice_view[n, k, 0] stay the same deterministically
-            if random_uniform() <= ((y_h + boundary_view[ix]) / (2 * boundary_view[ix])):
-                choices_view[n, k, 0] += 2
-           
+            if philox_uniform(&rng) <= ((y_h + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix))):
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 2
+
             if choices_view[n, k, 0] == 2:
-                y_l = (- 1) * boundary_view[0] + (z_l_2_view[k] * 2 * (boundary_view[0])) 
+                y_l = (- 1) * boundary_at(&bnd, k, 0) + (z_l_2_view[k] * 2 * (boundary_at(&bnd, k, 0)))
                 v_l = v_l_2_view[k]
 
                 # Fill bias trace until max_rt reached
                 ix_tmp = ix + 1
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 1.0
-                    ix_tmp += 1
+                    bias_trace[ix_tmp] = 1.0
+                    ix_tmp = ix_tmp + 1
 
             else: # Store intermediate choice
-                y_l = (- 1) * boundary_view[0] + (z_l_1_view[k] * 2 * (boundary_view[0])) 
+                y_l = (- 1) * boundary_at(&bnd, k, 0) + (z_l_1_view[k] * 2 * (boundary_at(&bnd, k, 0)))
                 v_l = v_l_1_view[k]
 
                 # Fill bias trace until max_rt reached
                 ix_tmp = ix + 1
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 0.0
-                    ix_tmp += 1
+                    bias_trace[ix_tmp] = 0.0
+                    ix_tmp = ix_tmp + 1
 
                 #We need to reverse the bias_trace if we took the lower choice
-                ix_tmp = 0 
+                ix_tmp = 0
                 while ix_tmp < num_draws:
-                    bias_trace_view[ix_tmp] = 1.0 - bias_trace_view[ix_tmp]
-                    ix_tmp += 1
+                    bias_trace[ix_tmp] = 1.0 - bias_trace[ix_tmp]
+                    ix_tmp = ix_tmp + 1
 
-                #print('new bias_trace: ', bias_trace)
-            
             # Random walks until the y_l corresponding to y_h hits bound
             ix = 0
-            while (y_l >= ((-1) * boundary_view[ix])) and (y_l <= boundary_view[ix]) and (t_l <= max_t):
+            while (y_l >= ((-1) * boundary_at(&bnd, k, ix))) and (y_l <= boundary_at(&bnd, k, ix)) and (t_l <= max_t):
                 # Compute local position dependence
-                tmp_pos_dep = (1 + (d_view[k] * (bias_trace_view[ix] - 1.0))) / (2 - d_view[k])
+                tmp_pos_dep = (1 + (d_view[k] * (bias_trace[ix] - 1.0))) / (2 - d_view[k])
 
-                if (bias_trace_view[ix] < 1) and (bias_trace_view[ix] > 0):
+                if (bias_trace[ix] < 1) and (bias_trace[ix] > 0):
                     # Before high-dim choice is taken
-                    y_l += tmp_pos_dep * (v_l * delta_t) # Add drift
-                    y_l += tmp_pos_dep * sqrt_st * gaussian_values[m] # Add noise
+                    y_l = y_l + tmp_pos_dep * (v_l * delta_t) # Add drift
+                    y_l = y_l + tmp_pos_dep * sqrt_st * philox_gaussian(&rng) # Add noise
                 else:
                     # After high-dim choice is taken
-                    y_l += (v_l * delta_t) # Add drift
-                    y_l += sqrt_st * gaussian_values[m] # Add noise
-    
-                t_l += delta_t # update time for low_dim choice
-                ix += 1 # update time index
-                m += 1 # update rv couter
+                    y_l = y_l + (v_l * delta_t) # Add drift
+                    y_l = y_l + sqrt_st * philox_gaussian(&rng) # Add noise
 
-                if m == num_draws:
-                    gaussian_values = draw_gaussian(num_draws)
-                    m = 0
+                t_l = t_l + delta_t # update time for low_dim choice
+                ix = ix + 1 # update time index
 
             rts_view[n, k, 0] = fmax(t_h, t_l) + t_view[k]
 
             # The probability of making a 'mistake' 1 - (relative y position)
             # y at upper bound --> choices_view[n, k, 0] add one deterministically
             # y at lower bound --> choice_view[n, k, 0] stays the same deterministically
-            if random_uniform() <= ((y_l + boundary_view[ix]) / (2 * boundary_view[ix])):
-                choices_view[n, k, 0] += 1
+            if philox_uniform(&rng) <= ((y_l + boundary_at(&bnd, k, ix)) / (2 * boundary_at(&bnd, k, ix))):
+                choices_view[n, k, 0] = choices_view[n, k, 0] + 1
+
+        free(bias_trace)
 
     return {'rts': rts, 'choices': choices, 'metadata': {'vh': v_h,
                                                          'vl1': v_l_1,
@@ -55,8 +55,9 @@
 /*     for (i=0;i<nt;i++) y[i] = cdfdif(t[i],*x,nwp,pr); */
 /* } */
 
-/* The main function for the seven-parameter diffusion model */
-double cdfdif(double t, int x, double *par, double *prob)
+/* The main function for the seven-parameter diffusion model. It keeps no
+   global or static state and is safe to call from several threads. */
+double cdfdif(double t, int x, const double *par, double *prob)
 {
     double a = par[0], Ter = par[1], eta = par[2], z = par[3], sZ = par[4],
     st = par[5], nu = par[6], a2 = a*a,
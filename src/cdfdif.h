@@ -1 +1 @@
-double cdfdif(double t, int x, double *par, double *prob);
+double cdfdif(double t, int x, const double *par, double *prob);
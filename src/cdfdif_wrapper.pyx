@@ -1,18 +1,51 @@
+# cython: boundscheck=False
+# cython: wraparound=False
 
 cimport numpy as np
 import numpy as np
+from cython.parallel import prange, parallel
+from libc.stdlib cimport malloc, free
 
 cdef extern from "cdfdif.h":
-    double cdfdif(double t, int x, double *par, double *prob)
+    double cdfdif(double t, int x, const double *par, double *prob) nogil
 
 cdef extern from "math.h":
-    double fabs(double)
+    double fabs(double) nogil
+    double log(double) nogil
+    double INFINITY
 
-cdef inline double add_outlier_cdf(double y, double x, double p_outlier, double w_outlier):
+cdef inline double add_outlier_cdf(double y, double x, double p_outlier, double w_outlier) nogil:
     return y * (1 - p_outlier) + (x + (1. / (2 * w_outlier))) * w_outlier * p_outlier
 
 cdef inline bint p_outlier_in_range(double p_outlier): return (p_outlier >= 0) & (p_outlier <= 1)
 
+cdef inline void set_params(double *params, double v, double sv, double a, double z,
+                            double sz, double t, double st) nogil:
+    cdef double epsi = 1e-10
+
+    #transform parameters
+    params[0] = a/10.
+    params[1] = t
+    params[2] = sv/10. + epsi
+    params[3] = z*(a/10.)
+    params[4] = sz*(a/10.) + epsi
+    params[5] = st + epsi
+    params[6] = v/10.
+
+cdef inline double dmat_cdf(double x, const double *params, double p_outlier, double w_outlier) nogil:
+    cdef double p_boundary
+    cdef double y = cdfdif(fabs(x), x > 0, params, &p_boundary)
+
+    if x > 0:
+        y = (1 - p_boundary) + y
+    elif x < 0:
+        y = (1 - p_boundary) - y
+    else:
+        y = 1 - p_boundary
+
+    #add p_outlier probability
+    return add_outlier_cdf(y, x, p_outlier, w_outlier)
+
 def dmat_cdf_array(np.ndarray[double, ndim=1] x, double v, double sv,
                  double a, double z, double sz, double t, double st, double p_outlier, double w_outlier):
 
@@ -26,28 +59,118 @@ def dmat_cdf_array(np.ndarray[double, ndim=1] x, double v, double sv,
 
 
     cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i
     cdef np.ndarray[double, ndim=1] y = np.empty(size, dtype=np.double)
-    cdef int boundary
-    cdef double p_boundary
     cdef double params[7]
-    cdef double epsi = 1e-10
 
-    #transform parameters
-    params[0] = a/10.
-    params[1] = t
-    params[2] = sv/10. + epsi
-    params[3] = z*(a/10.)
-    params[4] = sz*(a/10.) + epsi
-    params[5] = st + epsi
-    params[6] = v/10.
+    set_params(params, v, sv, a, z, sz, t, st)
+
+    for i in prange(size, nogil=True):
+        y[i] = dmat_cdf(x[i], params, p_outlier, w_outlier)
+
+    return y
+
+def dmat_cdf_batch(np.ndarray[double, ndim=1] x, v, sv, a, z, sz, t, st, p_outlier, double w_outlier):
+    """CDF of the RTs x under many parameter sets at once.
+
+    The parameters are arrays (or scalars) broadcast to a common length
+    n_sets; returns an array of shape (n_sets, len(x)) whose rows equal
+    dmat_cdf_array(x, ...) for the corresponding parameter set.
+    """
+    v, sv, a, z, sz, t, st, p_outlier = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(p, dtype=np.double)) for p in (v, sv, a, z, sz, t, st, p_outlier)])
+
+    #check arguments
+    if np.any(p_outlier > 0):
+        assert np.max(np.abs(x)) < (1./(2*w_outlier)), ValueError('1. / (2*w_outlier) must be smaller than RT')
+
+    if np.any((sv < 0) | (a <=0 ) | (z < 0) | (z > 1) | (sz < 0) | (sz > 1) | (z+sz/2.>1) |
+              (z-sz/2.<0) | (t-st/2.<0) | (t<0) | (st < 0) | (p_outlier < 0) | (p_outlier > 1)):
+        raise ValueError("at least one of the parameters is out of the support")
 
+    cdef Py_ssize_t n_sets = v.shape[0]
+    cdef Py_ssize_t size = x.shape[0]
+    cdef Py_ssize_t i, j, ij
+    cdef np.ndarray[double, ndim=2] params = np.empty((n_sets, 7), dtype=np.double)
+    cdef np.ndarray[double, ndim=1] p_outlier_arr = p_outlier
+    cdef np.ndarray[double, ndim=2] y = np.empty((n_sets, size), dtype=np.double)
 
-    for i in range(size):
-        boundary = (int) (x[i] > 0)
-        y[i] = cdfdif(fabs(x[i]), boundary, params, &p_boundary)
-        y[i] = (1 - p_boundary) + np.sign(x[i])*y[i]
+    for i in range(n_sets):
+        set_params(&params[i, 0], v[i], sv[i], a[i], z[i], sz[i], t[i], st[i])
 
-        #add p_outlier probability
-        y[i] = add_outlier_cdf(y[i], x[i], p_outlier, w_outlier)
+    for ij in prange(n_sets * size, nogil=True):
+        i = ij // size
+        j = ij % size
+        y[i, j] = dmat_cdf(x[j], &params[i, 0], p_outlier_arr[i], w_outlier)
 
     return y
+
+def quantile_scores(np.ndarray[double, ndim=1] x, np.ndarray[np.intp_t, ndim=1] offsets,
+                    np.ndarray[double, ndim=1] freq_obs, np.ndarray[double, ndim=1] n_samples,
+                    np.ndarray[double, ndim=2] params, bint gsquare=False):
+    """Chi-square (or G^2 up to a constant) statistic of many nodes in one call.
+
+    Node i has the quantile RTs x[offsets[i]:offsets[i + 1]], the observed
+    frequencies freq_obs[offsets[i] + i:offsets[i + 1] + i + 1] of the bins
+    they delimit, n_samples[i] trials and the parameters
+    params[i] = (v, sv, a, z, sz, t, st, p_outlier, w_outlier).
+    Parameters out of the support score inf (-inf for G^2), like the
+    chisquare() and gsquare() methods of the wfpt nodes.
+    """
+    cdef Py_ssize_t n_nodes = offsets.shape[0] - 1
+    cdef np.ndarray[double, ndim=1] scores = np.empty(n_nodes, dtype=np.double)
+    cdef double epsi = 1e-6
+    cdef double *par
+    cdef double *p
+    cdef double cdf, cdf_prev, prop, f_exp, score, max_rt
+    cdef Py_ssize_t i, j
+
+    if x.shape[0] != offsets[n_nodes] or freq_obs.shape[0] != offsets[n_nodes] + n_nodes \
+            or params.shape[0] != n_nodes or params.shape[1] != 9 or n_samples.shape[0] != n_nodes:
+        raise ValueError("inconsistent shapes of the quantile statistics")
+
+    with nogil, parallel():
+        par = <double *> malloc(7 * sizeof(double))
+        for i in prange(n_nodes):
+            p = &params[i, 0]
+            max_rt = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                if fabs(x[j]) > max_rt:
+                    max_rt = fabs(x[j])
+
+            if (p[1] < 0) or (p[2] <= 0) or (p[3] < 0) or (p[3] > 1) or (p[4] < 0) or (p[4] > 1) or \
+                    (p[3] + p[4] / 2. > 1) or (p[3] - p[4] / 2. < 0) or (p[5] - p[6] / 2. < 0) or \
+                    (p[5] < 0) or (p[6] < 0) or (p[7] < 0) or (p[7] > 1) or \
+                    ((p[7] > 0) and (max_rt >= 1. / (2 * p[8]))):
+                if gsquare:
+                    scores[i] = -INFINITY
+                else:
+                    scores[i] = INFINITY
+                continue
+
+            set_params(par, p[0], p[1], p[2], p[3], p[4], p[5], p[6])
+            cdf_prev = 0
+            score = 0
+            for j in range(offsets[i], offsets[i + 1] + 1):
+                if j < offsets[i + 1]:
+                    cdf = dmat_cdf(x[j], par, p[7], p[8])
+                else:
+                    cdf = 1
+                prop = cdf - cdf_prev
+                if prop <= epsi:
+                    prop = epsi
+                cdf_prev = cdf
+
+                if gsquare:
+                    score = score + freq_obs[j + i] * log(prop)
+                else:
+                    f_exp = prop * n_samples[i]
+                    score = score + (freq_obs[j + i] - f_exp) * (freq_obs[j + i] - f_exp) / f_exp
+
+            if gsquare:
+                scores[i] = 2 * score
+            else:
+                scores[i] = score
+        free(par)
+
+    return scores
@@ -0,0 +1,118 @@
+#cython: cdivision=True
+#cython: wraparound=False
+#cython: boundscheck=False
+#
+# Counter-based random number generation (Philox4x32-10, Salmon et al., 2011).
+#
+# Every simulated path gets its own stream: the key is derived once per call
+# from a NumPy SeedSequence, the stream id (trial, sample) fills the upper
+# half of the counter and the lower half counts blocks of 4 x 32 bit draws.
+# Draws therefore do not depend on which thread simulates a path, or on the
+# number of threads.
+
+from libc.stdint cimport uint32_t, uint64_t
+from libc.math cimport log, sqrt, cos, sin, M_PI
+
+DEF PHILOX_M0 = 0xD2511F53
+DEF PHILOX_M1 = 0xCD9E8D57
+DEF PHILOX_W0 = 0x9E3779B9
+DEF PHILOX_W1 = 0xBB67AE85
+
+cdef struct philox_state:
+    uint32_t ctr[4]
+    uint32_t key[2]
+    uint32_t out[4]
+    int pos
+    bint has_spare
+    double spare
+
+cdef inline void philox4x32_10(uint32_t* ctr, uint32_t* key, uint32_t* out) nogil:
+    cdef uint32_t x0 = ctr[0], x1 = ctr[1], x2 = ctr[2], x3 = ctr[3]
+    cdef uint32_t k0 = key[0], k1 = key[1]
+    cdef uint64_t p0, p1
+    cdef int i
+
+    for i in range(10):
+        p0 = <uint64_t>PHILOX_M0 * x0
+        p1 = <uint64_t>PHILOX_M1 * x2
+        x0 = (<uint32_t>(p1 >> 32)) ^ x1 ^ k0
+        x1 = <uint32_t>p1
+        x2 = (<uint32_t>(p0 >> 32)) ^ x3 ^ k1
+        x3 = <uint32_t>p0
+        k0 = k0 + <uint32_t>PHILOX_W0
+        k1 = k1 + <uint32_t>PHILOX_W1
+
+    out[0] = x0
+    out[1] = x1
+    out[2] = x2
+    out[3] = x3
+
+cdef inline philox_state philox_stream(uint32_t* key, uint32_t stream_hi, uint32_t stream_lo) nogil:
+    """Generator state of stream (stream_hi, stream_lo), e.g. (trial, sample)."""
+    cdef philox_state state
+    state.key[0] = key[0]
+    state.key[1] = key[1]
+    state.ctr[0] = 0
+    state.ctr[1] = 0
+    state.ctr[2] = stream_lo
+    state.ctr[3] = stream_hi
+    state.pos = 4
+    state.has_spare = 0
+    state.spare = 0
+    return state
+
+cdef inline uint32_t philox_next32(philox_state* state) nogil:
+    if state.pos == 4:
+        philox4x32_10(state.ctr, state.key, state.out)
+        state.ctr[0] += 1
+        if state.ctr[0] == 0:
+            state.ctr[1] += 1
+        state.pos = 0
+    state.pos += 1
+    return state.out[state.pos - 1]
+
+cdef inline double philox_uniform(philox_state* state) nogil:
+    """Uniform draw from the open interval (0, 1)."""
+    return (philox_next32(state) + 0.5) * 2.3283064365386963e-10
+
+cdef inline double philox_gaussian(philox_state* state) nogil:
+    """Standard normal draw (Box-Muller, the second value is kept for the next call)."""
+    cdef double r, phi
+    if state.has_spare:
+        state.has_spare = 0
+        return state.spare
+    r = sqrt(-2.0 * log(philox_uniform(state)))
+    phi = 2.0 * M_PI * philox_uniform(state)
+    state.spare = r * sin(phi)
+    state.has_spare = 1
+    return r * cos(phi)
+
+cdef inline double philox_exponential(philox_state* state) nogil:
+    return - log(philox_uniform(state))
+
+def philox_key(random_state=None):
+    """Key (two 32 bit words) of the counter-based generator.
+
+    :Arguments:
+        random_state : None, int, sequence of ints or numpy.random.SeedSequence
+            Seed material. If None, the key is drawn from NumPy's global random
+            state, so that numpy.random.seed() makes simulations reproducible.
+    """
+    if random_state is None:
+        random_state = [int(x) for x in np.random.randint(0, 2 ** 31, size=4)]
+    if not isinstance(random_state, np.random.SeedSequence):
+        random_state = np.random.SeedSequence(random_state)
+    return random_state.generate_state(2, dtype=np.uint32)
+
+def philox_block(counter, key):
+    """Philox4x32-10 applied to a single counter (4 words) and key (2 words)."""
+    cdef uint32_t ctr[4]
+    cdef uint32_t k[2]
+    cdef uint32_t out[4]
+    cdef int i
+    for i in range(4):
+        ctr[i] = counter[i]
+    for i in range(2):
+        k[i] = key[i]
+    philox4x32_10(ctr, k, out)
+    return np.array([out[0], out[1], out[2], out[3]], dtype=np.uint32)
@@ -17,6 +17,7 @@ import hddm
 #from hddm.model_config import model_config
 
 import scipy.integrate as integrate
+from collections import OrderedDict
 from copy import copy
 import numpy as np
 
@@ -354,37 +355,79 @@ def wiener_like_rl(np.ndarray[long, ndim=1] response,
     return sum_logp
 
 
-def wiener_like_multi(np.ndarray[double, ndim=1] x, v, sv, a, z, sz, t, st, double err, multi=None,
-                      int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
-                      double p_outlier=0, double w_outlier=0):
+# Column order of the trial-wise parameter matrix used by wiener_like_multi_array
+multi_param_names = ('v', 'sv', 'a', 'z', 'sz', 't', 'st')
+
+
+def multi_params_matrix(Py_ssize_t size, v, sv, a, z, sz, t, st):
+    """Stack scalar and/or trial-wise DDM parameters into a (size x 7)
+    float64 matrix with columns ordered as in multi_param_names.
+
+    If all parameters are scalars no copy is made: the returned matrix is a
+    read-only view of a single row with row stride 0.
+    """
+    cdef Py_ssize_t j
+    cols = (v, sv, a, z, sz, t, st)
+
+    if all(np.ndim(col) == 0 for col in cols):
+        return np.broadcast_to(np.array(cols, dtype=np.double), (size, 7))
+
+    params = np.empty((size, 7), dtype=np.double)
+    for j in range(7):
+        params[:, j] = cols[j]
+    return params
+
+
+def wiener_like_multi_array(const double[:] x, const double[:, :] params, double err,
+                            int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
+                            double p_outlier=0, double w_outlier=0):
+    """Summed log-likelihood of the full DDM with trial-wise parameters.
+
+    params is a (n_trials x 7) matrix with columns v, sv, a, z, sz, t, st
+    (see multi_params_matrix). RTs coded as 999 (-999) contribute the
+    probability of hitting the upper (lower) boundary.
+    """
     cdef Py_ssize_t size = x.shape[0]
     cdef Py_ssize_t i
-    cdef double p = 0
+    cdef double p
     cdef double sum_logp = 0
     cdef double wp_outlier = w_outlier * p_outlier
 
-    if multi is None:
-        return full_pdf(x, v, sv, a, z, sz, t, st, err)
-    else:
-        params = {'v': v, 'z': z, 't': t, 'a': a, 'sv': sv, 'sz': sz, 'st': st}
-        params_iter = copy(params)
-        for i in range(size):
-            for param in multi:
-                params_iter[param] = params[param][i]
-            if abs(x[i]) != 999.:
-                p = full_pdf(x[i], params_iter['v'],
-                             params_iter['sv'], params_iter['a'], params_iter['z'],
-                             params_iter['sz'], params_iter['t'], params_iter['st'],
-                             err, n_st, n_sz, use_adaptive, simps_err)
-                p = p * (1 - p_outlier) + wp_outlier
-            elif x[i] == 999.:
-                p = prob_ub(params_iter['v'], params_iter['a'], params_iter['z'])
-            else: # x[i] == -999.
-                p = 1 - prob_ub(params_iter['v'], params_iter['a'], params_iter['z'])
+    if params.shape[0] != size or params.shape[1] != 7:
+        raise ValueError("params has to be of shape (%d, 7), got (%d, %d)" %
+                         (size, params.shape[0], params.shape[1]))
 
-            sum_logp += log(p)
+    if not p_outlier_in_range(p_outlier):
+        return -np.inf
 
-        return sum_logp
+    for i in prange(size, nogil=True):
+        if fabs(x[i]) != 999.:
+            p = full_pdf(x[i], params[i, 0], params[i, 1], params[i, 2], params[i, 3],
+                         params[i, 4], params[i, 5], params[i, 6],
+                         err, n_st, n_sz, use_adaptive, simps_err)
+            p = p * (1 - p_outlier) + wp_outlier
+        elif x[i] == 999.:
+            p = prob_ub(params[i, 0], params[i, 2], params[i, 3])
+        else: # x[i] == -999.
+            p = 1 - prob_ub(params[i, 0], params[i, 2], params[i, 3])
+
+        # If one probability = 0, the log sum will be -Inf
+        sum_logp += log(p)
+
+    return sum_logp
+
+
+def wiener_like_multi(np.ndarray[double, ndim=1] x, v, sv, a, z, sz, t, st, double err, multi=None,
+                      int n_st=10, int n_sz=10, bint use_adaptive=1, double simps_err=1e-3,
+                      double p_outlier=0, double w_outlier=0):
+    """Summed log-likelihood of the full DDM where the parameters named in
+    multi are arrays with one value per trial. Thin wrapper around
+    wiener_like_multi_array.
+    """
+    params = multi_params_matrix(x.shape[0], v, sv, a, z, sz, t, st)
+
+    return wiener_like_multi_array(x, params, err, n_st, n_sz, use_adaptive, simps_err,
+                                   p_outlier, w_outlier)
 
 
 def wiener_like_multi_rlddm(np.ndarray[double, ndim=1] x, 
@@ -514,38 +557,200 @@ def wiener_like_rlssm_nn_reg(np.ndarray[float, ndim=2] data,
     return sum_logp
 
 
-def gen_rts_from_cdf(double v, double sv, double a, double z, double sz, double t,
-                     double st, int samples=1000, double cdf_lb=-6, double cdf_ub=6, double dt=1e-2):
+class LRUCache(object):
+    """Least recently used cache with hit statistics, used for the CDFs of
+    cdf_grid and of the wfpt nodes (hddm.likelihoods.cdf_cache). Keys are
+    compared exactly. Cached arrays are shared by all callers and therefore
+    made read-only.
+
+    :Optional:
+        maxsize : int <default=128>
+            Maximum number of entries. Use resize() to change it.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        """Return the value stored for key, calling compute() to create it if missing."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            for array in (value if isinstance(value, tuple) else (value,)):
+                if isinstance(array, np.ndarray):
+                    array.flags.writeable = False
+            self._data[key] = value
+            self._evict()
+            return value
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "size": len(self._data),
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+    def _evict(self):
+        while self._data and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+# Normalized CDF grids of the decision time, keyed by parameters and grid
+cdf_grid_cache = LRUCache(maxsize=128)
+
+
+def cdf_grid(double v, double sv, double a, double z, double sz, double cdf_lb=-6,
+             double cdf_ub=6, double dt=1e-2):
+    """Return the grid and the normalized CDF of the decision time (errors at
+    negative times), computed with pdf_array and cached per parameter tuple
+    in cdf_grid_cache. The returned arrays are shared with the cache and
+    read-only.
+    """
+    return cdf_grid_cache.get(
+        (v, sv, a, z, sz, cdf_lb, cdf_ub, dt),
+        lambda: _compute_cdf_grid(v, sv, a, z, sz, cdf_lb, cdf_ub, dt),
+    )
 
+
+def _compute_cdf_grid(double v, double sv, double a, double z, double sz,
+                      double cdf_lb, double cdf_ub, double dt):
     cdef np.ndarray[double, ndim = 1] x = np.arange(cdf_lb, cdf_ub, dt)
-    cdef np.ndarray[double, ndim = 1] l_cdf = np.empty(x.shape[0], dtype=np.double)
-    cdef double pdf, rt
+    cdef np.ndarray[double, ndim = 1] pdf = pdf_array(x, v, sv, a, z, sz, 0, 0, 1e-4)
     cdef Py_ssize_t size = x.shape[0]
-    cdef Py_ssize_t i, j
-    cdef int idx
+    cdef np.ndarray[double, ndim = 1] l_cdf = np.empty(size, dtype=np.double)
 
+    # trapezoidal integration
     l_cdf[0] = 0
-    for i from 1 <= i < size:
-        pdf = full_pdf(x[i], v, sv, a, z, sz, 0, 0, 1e-4)
-        l_cdf[i] = l_cdf[i - 1] + pdf
+    np.cumsum((pdf[1:] + pdf[:size - 1]) * np.diff(x) / 2, out=l_cdf[1:])
+    l_cdf /= l_cdf[size - 1]
 
-    l_cdf /= l_cdf[x.shape[0] - 1]
+    return x, l_cdf
 
-    cdef np.ndarray[double, ndim = 1] rts = np.empty(samples, dtype=np.double)
+
+def gen_rts_from_cdf(double v, double sv, double a, double z, double sz, double t,
+                     double st, int samples=1000, double cdf_lb=-6, double cdf_ub=6, double dt=1e-2):
+
+    x, l_cdf = cdf_grid(v, sv, a, z, sz, cdf_lb, cdf_ub, dt)
     cdef np.ndarray[double, ndim = 1] f = np.random.rand(samples)
-    cdef np.ndarray[double, ndim = 1] delay
 
-    if st != 0:
+    # invert the CDF, linear within grid cells
+    cdef np.ndarray[np.intp_t, ndim = 1] idx = np.clip(np.searchsorted(l_cdf, f), 1, x.shape[0] - 1)
+    lower = l_cdf[idx - 1]
+    width = l_cdf[idx] - lower
+    frac = np.divide(f - lower, width, out=np.ones(samples), where=width > 0)
+    rts = x[idx - 1] + frac * (x[idx] - x[idx - 1])
+
+    if st == 0:
+        delay = t
+    else:
         delay = (np.random.rand(samples) * st + (t - st / 2.))
-    for i from 0 <= i < samples:
-        idx = np.searchsorted(l_cdf, f[i])
-        rt = x[idx]
-        if st == 0:
-            rt = rt + np.sign(rt) * t
-        else:
-            rt = rt + np.sign(rt) * delay[i]
-        rts[i] = rt
-    return rts
+    return rts + np.sign(rts) * delay
+
+
+cdef extern from "math.h" nogil:
+    double expm1(double)
+
+
+cdef inline double p_upper_ddm(double v, double a, double z) nogil:
+    # Probability to reach the upper boundary, starting at z * a with drift v
+    cdef double va = v * a
+    if fabs(va) < 1e-8:
+        return z
+    if va > 0:
+        return expm1(-2 * va * z) / expm1(-2 * va)
+    return exp(2 * va * (1 - z)) * expm1(2 * va * z) / expm1(2 * va)
+
+
+def bandit_q_learning(double[:] scaler, double[:] alpha, double[:] pos_alpha, double[:] a,
+                      double[:] z, double[:, :] rew_up, double[:, :] rew_low, double[:, :] u,
+                      double[:, :] response, double q_init=0.5, bint simulate=1,
+                      double flat_eps=0):
+    """Trial-sequential Rescorla-Wagner learning on the 2-armed bandit, one
+    subject per row, subjects in parallel.
+
+    On every trial the drift is scaler * (q_up - q_low) and p_upper the
+    probability that a DDM with this drift, boundary a and relative starting
+    point z ends at the upper boundary (0.5 if |drift| < flat_eps). If simulate,
+    the response is 1 (upper) where u < p_upper and 0 otherwise, and it is
+    written to response; else response holds the observed responses. The
+    Q-value of the chosen option then moves towards its reward with the
+    learning rate alpha, or pos_alpha if the reward exceeds it.
+
+    Returns q_up, q_low, sim_drift, p_upper and feedback, each (n_subj, n_trials).
+    """
+    cdef Py_ssize_t n_subj = rew_up.shape[0]
+    cdef Py_ssize_t n_trials = rew_up.shape[1]
+    cdef Py_ssize_t s, i
+
+    q_up = np.empty((n_subj, n_trials), dtype=np.double)
+    q_low = np.empty((n_subj, n_trials), dtype=np.double)
+    sim_drift = np.empty((n_subj, n_trials), dtype=np.double)
+    p_upper = np.empty((n_subj, n_trials), dtype=np.double)
+    feedback = np.empty((n_subj, n_trials), dtype=np.double)
+    cdef double[:, :] q_up_view = q_up
+    cdef double[:, :] q_low_view = q_low
+    cdef double[:, :] drift_view = sim_drift
+    cdef double[:, :] p_view = p_upper
+    cdef double[:, :] feedback_view = feedback
+
+    cdef double qu, ql, drift, p, alfa
+
+    for s in prange(n_subj, nogil=True):
+        qu = q_init
+        ql = q_init
+        for i in range(n_trials):
+            q_up_view[s, i] = qu
+            q_low_view[s, i] = ql
+            drift = (qu - ql) * scaler[s]
+            if fabs(drift) < flat_eps:
+                p = 0.5
+            else:
+                p = p_upper_ddm(drift, a[s], z[s])
+            drift_view[s, i] = drift
+            p_view[s, i] = p
+            if simulate:
+                if u[s, i] < p:
+                    response[s, i] = 1
+                else:
+                    response[s, i] = 0
+
+            if response[s, i] == 1:
+                feedback_view[s, i] = rew_up[s, i]
+                if rew_up[s, i] > qu:
+                    alfa = pos_alpha[s]
+                else:
+                    alfa = alpha[s]
+                qu = qu + alfa * (rew_up[s, i] - qu)
+            else:
+                feedback_view[s, i] = rew_low[s, i]
+                if rew_low[s, i] > ql:
+                    alfa = pos_alpha[s]
+                else:
+                    alfa = alpha[s]
+                ql = ql + alfa * (rew_low[s, i] - ql)
+
+    return q_up, q_low, sim_drift, p_upper, feedback
 
 
 def wiener_like_contaminant(np.ndarray[double, ndim=1] x, np.ndarray[int, ndim=1] cont_x, double v,
@@ -619,9 +824,8 @@ def split_cdf(np.ndarray[double, ndim=1] x, np.ndarray[double, ndim=1] data):
     lb = np.cumsum(np.concatenate([np.array([0]), -np.diff(lb)]))
 
     cdef np.ndarray[double, ndim = 1] x_ub = x[N + 1:]
-    cdef np.ndarray[double, ndim = 1] ub = data[N + 1:]
-    # ub does not start at 0
-    ub -= ub[0]
+    # ub does not start at 0 (and data is left untouched)
+    cdef np.ndarray[double, ndim = 1] ub = data[N + 1:] - data[N + 1]
 
     return (x_lb, lb, x_ub, ub)
 